@@ -14,7 +14,7 @@ import pytz
 IST = pytz.timezone("Asia/Kolkata")
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolTick:
     """Real-time tick data for a symbol.
 
@@ -6,7 +6,7 @@ Handles columnar data format parsing and date filtering.
 Requirements: 5.4, 5.5, 12.3, 12.4, 12.5
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Tuple
 import pytz
 
@@ -107,14 +107,23 @@ def parse_timestamp(ts_value: Any) -> datetime:
     return datetime.now(IST)
 
 
-def parse_columnar_candles(candles_raw: Dict[str, List]) -> List[Candle]:
+def parse_columnar_candles(
+    candles_raw: Dict[str, List],
+    reference_date: Optional[date] = None,
+) -> List[Candle]:
     """
     Parse columnar candle data into Candle objects.
 
     Requirement 5.5: Parse columnar data format (ts[], open[], high[], low[], close[], volume[])
 
+    When ``reference_date`` is given, the date filter (Requirement 5.4) is
+    fused into the parse loop: rows from other days are dropped before a
+    Candle is allocated for them, instead of building every Candle and
+    discarding most of them in filter_candles_to_today().
+
     Args:
         candles_raw: Dict with parallel arrays: ts[], open[], high[], low[], close[], volume[]
+        reference_date: Optional date (or datetime) to keep; None keeps all rows
 
     Returns:
         List of Candle objects
@@ -132,16 +141,29 @@ def parse_columnar_candles(candles_raw: Dict[str, List]) -> List[Candle]:
     if not ts_list:
         return []
 
+    if isinstance(reference_date, datetime):
+        reference_date = reference_date.date()
+
+    # Column lengths are loop-invariant
+    n_open = len(open_list)
+    n_high = len(high_list)
+    n_low = len(low_list)
+    n_close = len(close_list)
+    n_volume = len(volume_list)
+
     candles = []
     for i in range(len(ts_list)):
         try:
+            ts = parse_timestamp(ts_list[i])
+            if reference_date is not None and ts.date() != reference_date:
+                continue
             candle = Candle(
-                ts=parse_timestamp(ts_list[i]),
-                open=float(open_list[i]) if i < len(open_list) else 0.0,
-                high=float(high_list[i]) if i < len(high_list) else 0.0,
-                low=float(low_list[i]) if i < len(low_list) else 0.0,
-                close=float(close_list[i]) if i < len(close_list) else 0.0,
-                volume=int(volume_list[i]) if i < len(volume_list) else 0,
+                ts=ts,
+                open=float(open_list[i]) if i < n_open else 0.0,
+                high=float(high_list[i]) if i < n_high else 0.0,
+                low=float(low_list[i]) if i < n_low else 0.0,
+                close=float(close_list[i]) if i < n_close else 0.0,
+                volume=int(volume_list[i]) if i < n_volume else 0,
             )
             candles.append(candle)
         except (ValueError, TypeError, IndexError):
@@ -371,6 +393,9 @@ def parse_bootstrap_response(
     if not data:
         return result
 
+    # Resolve "today" once per response rather than once per candle series
+    today = datetime.now(IST).date() if filter_to_today else None
+
     for symbol in VALID_SYMBOLS:
         if symbol not in data:
             continue
@@ -380,9 +405,7 @@ def parse_bootstrap_response(
 
         # FIX-023: Parse symbol-level candles_5m (new location)
         symbol_candles_raw = symbol_data.get("candles_5m", {})
-        symbol_candles = parse_columnar_candles(symbol_candles_raw)
-        if filter_to_today and symbol_candles:
-            symbol_candles = filter_candles_to_today(symbol_candles)
+        symbol_candles = parse_columnar_candles(symbol_candles_raw, reference_date=today)
 
         # FIX-023: Parse symbol-level technical_indicators
         tech_indicators_raw = symbol_data.get("technical_indicators", {})
@@ -398,9 +421,7 @@ def parse_bootstrap_response(
             else:
                 # Legacy: candles at mode level (pre-FIX-023)
                 candles_raw = mode_data.get("candles_5m", mode_data.get("candles", {}))
-                candles = parse_columnar_candles(candles_raw)
-                if filter_to_today and candles:
-                    candles = filter_candles_to_today(candles)
+                candles = parse_columnar_candles(candles_raw, reference_date=today)
 
             # Parse option chain from columnar format
             oc_raw = mode_data.get("option_chain", {})
@@ -9,14 +9,18 @@ Implements reconnection with exponential backoff.
 Requirements: 12.1, 12.2, 12.3, 12.4, 12.5, 12.6, 12.7, 12.8, 12.9, 12.10, 17.7
 """
 
-import json
+import logging
+import queue
+import random
+import sys
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Any
-import pytz
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
 import structlog
 
 from .config import get_settings
@@ -32,7 +36,15 @@ from .parsers import (
 
 # Requirement 17.7: Log all errors to console for debugging
 logger = structlog.get_logger(__name__)
-IST = pytz.timezone("Asia/Kolkata")
+# structlog routes through this stdlib logger (see config.configure_logging);
+# used to skip debug-only work when DEBUG is filtered out.
+_stdlib_logger = logging.getLogger(__name__)
+IST = ZoneInfo("Asia/Kolkata")  # stdlib, C-backed; cheaper datetime.now(IST) than pytz
+
+# First four bytes of the SSE field names the parser acts on, as integers,
+# so a line is classified with one int compare instead of startswith calls
+_PREFIX_DATA = int.from_bytes(b"data", "little")
+_PREFIX_EVEN = int.from_bytes(b"even", "little")
 
 
 class TieredStreamClient:
@@ -61,6 +73,7 @@ class TieredStreamClient:
         running: Flag to control the client lifecycle
         reconnect_delay: Current reconnection delay in seconds
         last_connect_time: Timestamp of last successful connection
+        last_heartbeat_monotonic: time.monotonic() of the last heartbeat event
         on_refresh_recommended: Callback for refresh_recommended event
     """
 
@@ -68,6 +81,12 @@ class TieredStreamClient:
     MAX_RECONNECT_DELAY = 30.0  # Maximum backoff delay in seconds
     PROACTIVE_RECONNECT_MINUTES = 55  # Reconnect before Cloud Run timeout
     HEARTBEAT_TIMEOUT = 90  # Seconds without heartbeat before reconnecting
+    HEARTBEAT_CHECK_INTERVAL = 10.0  # Seconds between heartbeat watchdog checks
+    RX_CHUNK_SIZE = 65536  # Bytes per read from the streaming response
+    TOKEN_RECONNECT_DEDUP_SECONDS = 30.0  # Min interval between token-driven reconnects
+    MAX_EVENT_BYTES = 4 * 1024 * 1024  # Max size of one buffered, unterminated event
+    MAX_PENDING_EVENTS = 10_000  # Dispatch backlog above which heartbeats are not queued
+    OPTION_CHAIN_COALESCE_SECONDS = 0.1  # Window for merging option_chain_update per symbol/mode
 
     def __init__(
         self,
@@ -95,11 +114,51 @@ class TieredStreamClient:
         self.running = False
         self.reconnect_delay = 1.0
         self.last_connect_time: Optional[datetime] = None
-        self.last_heartbeat_time: Optional[datetime] = None
+        # time.monotonic() of the last heartbeat (0.0 = none yet); see last_heartbeat_time
+        self.last_heartbeat_monotonic: float = 0.0
         self._thread: Optional[threading.Thread] = None
-        self._proactive_reconnect_timer: Optional[threading.Timer] = None
+        # Connection monitor: proactive reconnect deadline + heartbeat watchdog
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._monitor_wake = threading.Event()
+        self._monitor_gen = 0
+        self._monitor_armed = False
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._cached_url: Optional[str] = None  # Built by _build_url, reset on token change
+        # Set when _stop_event was raised to restart the stream, not to shut down
+        self._reconnect_pending = False
+        self._last_token_reconnect: Optional[float] = None  # time.monotonic() of last token-driven reconnect
+        # time.monotonic() at which a deduplicated token reconnect is due (None = none pending)
+        self._token_reconnect_due: Optional[float] = None
+        self._sse_connected_cached = False  # Last value passed to state.set_sse_connected
+        self._rx_buf = bytearray()
+        self._rx_head = 0  # Offset of the first unconsumed byte in _rx_buf
+        # Partial-event parser state, as offsets from _rx_head so that
+        # compacting _rx_buf leaves it valid; see _parse_buffer
+        self._rx_scan = 0  # Start of the first line not yet scanned
+        self._rx_newline_from = 0  # Where the search for that line's "\n" resumes
+        self._rx_event_type: Optional[str] = None
+        self._rx_data_spans: List[Tuple[int, int]] = []  # (start, end) of each data: value
+        # Parsed events handed from the read loop to the dispatch worker
+        self._event_queue: "queue.SimpleQueue[Optional[Tuple[Optional[str], bytes]]]" = queue.SimpleQueue()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Latest option_chain_update per (symbol, mode), applied when the window closes
+        self._pending_option_chains: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._option_chain_flush_at = 0.0
+        # HTTP client shared across reconnects; created lazily in _connect_and_stream
+        self._http: Optional[httpx.Client] = None
+
+    @property
+    def last_heartbeat_time(self) -> Optional[datetime]:
+        """Wall-clock time (IST) of the last heartbeat, or None if none yet.
+
+        Heartbeats only record a monotonic timestamp; the datetime is
+        derived here on demand.
+        """
+        if not self.last_heartbeat_monotonic:
+            return None
+        elapsed = time.monotonic() - self.last_heartbeat_monotonic
+        return datetime.now(IST) - timedelta(seconds=elapsed)
 
     def _build_url(self) -> str:
         """Build SSE URL with token and parameters.
@@ -107,20 +166,28 @@ class TieredStreamClient:
         Requirement 12.1: Connect to GET /v1/stream/indicators/tiered with JWT as query param
         Requirement 12.2: Request all symbols and both modes (current, positional)
 
+        The URL is cached until update_jwt_token() changes the token, so
+        reconnects do not rebuild it. Rebuilding it picks up the newest
+        token, which settles any deferred token reconnect.
+
         Returns:
             SSE URL with query parameters
         """
-        settings = get_settings()
-        base_url = settings.iceberg_api_url
-        symbols_param = ",".join(self.symbols)
-        modes_param = ",".join(self.modes)
-        return (
-            f"{base_url}/v1/stream/indicators/tiered"
-            f"?token={self.jwt_token}"
-            f"&symbols={symbols_param}"
-            f"&modes={modes_param}"
-            f"&include_optional=true"
-        )
+        with self._lock:
+            if self._cached_url is None:
+                self._token_reconnect_due = None
+                settings = get_settings()
+                base_url = settings.iceberg_api_url
+                symbols_param = ",".join(self.symbols)
+                modes_param = ",".join(self.modes)
+                self._cached_url = (
+                    f"{base_url}/v1/stream/indicators/tiered"
+                    f"?token={self.jwt_token}"
+                    f"&symbols={symbols_param}"
+                    f"&modes={modes_param}"
+                    f"&include_optional=true"
+                )
+            return self._cached_url
 
     def connect(self) -> None:
         """Connect to the SSE stream.
@@ -133,12 +200,29 @@ class TieredStreamClient:
 
         self.running = True
         self._stop_event.clear()
+        self._start_monitor()
+
+        # Fresh queue per session; a previous worker drains its own queue up to its sentinel
+        self._event_queue = queue.SimpleQueue()
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_events, args=(self._event_queue,), daemon=True
+        )
+        self._dispatch_thread.start()
+
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def _run(self) -> None:
         """Run the SSE connection loop."""
-        while self.running and not self._stop_event.is_set():
+        while self.running:
+            with self._lock:
+                if self._reconnect_pending:
+                    # Stream was stopped to reconnect - start a fresh one right away
+                    self._reconnect_pending = False
+                    self._stop_event.clear()
+            if self._stop_event.is_set():
+                break
+
             try:
                 url = self._build_url()
                 logger.info("sse_connecting", url_prefix=url[:60])
@@ -148,7 +232,7 @@ class TieredStreamClient:
             except Exception as e:
                 # Requirement 17.7: Log all errors to console for debugging
                 logger.error("sse_connection_error", error=str(e), error_type=type(e).__name__)
-                self.state.set_sse_connected(False)
+                self._set_sse_connected(False)
 
             if self.running and not self._stop_event.is_set():
                 self._schedule_reconnect()
@@ -160,27 +244,38 @@ class TieredStreamClient:
             url: Full SSE URL with query parameters
         """
         try:
+            # Reuse one client across reconnects so its connection pool survives
+            if self._http is None:
+                # The read timeout breaks a silently dead TCP connection; the
+                # server sends heartbeats well inside HEARTBEAT_TIMEOUT
+                # HTTP/2 (needs the httpx[http2] extra) trims per-frame overhead;
+                # httpx's default Accept-Encoding negotiates compression
+                self._http = httpx.Client(
+                    http2=True,
+                    headers={"Accept": "text/event-stream"},
+                    timeout=httpx.Timeout(None, connect=10.0, read=float(self.HEARTBEAT_TIMEOUT)),
+                    limits=httpx.Limits(max_keepalive_connections=1),
+                )
+
             # Use httpx with streaming for SSE
-            with httpx.Client(timeout=None) as client:
-                with client.stream("GET", url) as response:
-                    if response.status_code != 200:
-                        # Requirement 17.7: Log all errors to console for debugging
-                        logger.error("sse_connection_failed", status_code=response.status_code)
-                        return
+            with self._http.stream("GET", url) as response:
+                if response.status_code != 200:
+                    # Requirement 17.7: Log all errors to console for debugging
+                    logger.error("sse_connection_failed", status_code=response.status_code)
+                    return
 
-                    # Connection successful
-                    self.state.set_sse_connected(True)
-                    self.last_connect_time = datetime.now(IST)
-                    self.last_heartbeat_time = datetime.now(IST)
-                    self.reconnect_delay = 1.0  # Reset backoff on successful connection
+                # Connection successful
+                self._set_sse_connected(True)
+                self.last_connect_time = datetime.now(IST)
+                self.last_heartbeat_monotonic = time.monotonic()
 
-                    # Schedule proactive reconnection (Requirement 12.10)
-                    self._schedule_proactive_reconnect()
+                # Schedule proactive reconnection (Requirement 12.10)
+                self._schedule_proactive_reconnect()
 
-                    logger.info("sse_connected", symbols=self.symbols, modes=self.modes)
+                logger.info("sse_connected", symbols=self.symbols, modes=self.modes)
 
-                    # Process SSE events
-                    self._process_stream(response)
+                # Process SSE events
+                self._process_stream(response)
 
         except httpx.TimeoutException:
             # Requirement 17.7: Log all errors to console for debugging
@@ -192,45 +287,196 @@ class TieredStreamClient:
             # Requirement 17.7: Log all errors to console for debugging
             logger.error("sse_stream_error", error=str(e), error_type=type(e).__name__)
         finally:
-            self.state.set_sse_connected(False)
+            self._set_sse_connected(False)
             self._cancel_proactive_reconnect()
 
     def _process_stream(self, response: httpx.Response) -> None:
         """Process SSE event stream.
 
+        Raw bytes are accumulated in ``self._rx_buf`` and handed to
+        _parse_buffer(), which consumes only complete events. Bytes of a
+        partially received event stay in the buffer, so an event split
+        across chunk boundaries is never truncated or dispatched early.
+        Consumed bytes are skipped by advancing ``self._rx_head`` and only
+        compacted away once they make up more than half the buffer.
+
+        The reconnect backoff is reset once the first complete event has
+        been parsed, not on the 200 response alone, so a server that never
+        ends an event (past MAX_EVENT_BYTES, which abandons the stream)
+        keeps backing off instead of being re-downloaded every second.
+
         Args:
             response: httpx streaming response
         """
-        event_type = None
-        event_data = ""
-
-        for line in response.iter_lines():
-            if self._stop_event.is_set() or not self.running:
+        rx_buf = self._rx_buf = bytearray()
+        head = self._rx_head = 0
+        self._reset_pending_event()
+
+        # Bind per-chunk lookups to locals outside the hot loop
+        stop_is_set = self._stop_event.is_set
+        parse_buffer = self._parse_buffer
+        max_event_bytes = self.MAX_EVENT_BYTES
+        backoff_pending = True
+
+        for chunk in response.iter_bytes(chunk_size=self.RX_CHUNK_SIZE):
+            if stop_is_set() or not self.running:
                 break
 
-            line = line.strip()
+            rx_buf += chunk  # in place, rx_buf stays self._rx_buf
+            parsed_head = parse_buffer(rx_buf, head)
+            if backoff_pending and parsed_head != head:
+                self.reconnect_delay = 1.0  # Stream delivers whole events; reset backoff
+                backoff_pending = False
+            head = parsed_head
+            if head > len(rx_buf) >> 1:
+                del rx_buf[:head]
+                head = 0
+            self._rx_head = head
+            if len(rx_buf) - head > max_event_bytes:
+                # Only an incomplete event is left - the server never ended it
+                logger.error(
+                    "sse_oversize_event",
+                    buffered_bytes=len(rx_buf) - head,
+                    max_event_bytes=max_event_bytes,
+                )
+                rx_buf.clear()
+                self._rx_head = 0
+                self._reset_pending_event()
+                return
+
+    def _reset_pending_event(self) -> None:
+        """Forget the partially parsed event, e.g. when the buffer is discarded."""
+        self._rx_scan = 0
+        self._rx_newline_from = 0
+        self._rx_event_type = None
+        self._rx_data_spans = []
+
+    def _parse_buffer(self, buf: bytearray, start: int = 0) -> int:
+        """Parse all complete SSE events in a byte buffer.
+
+        Walks the buffer line by line with ``bytearray.find`` and tracks
+        the current event's type and ``data:`` value offsets. Field names
+        are matched in place; the ``data:`` values are copied out (joined)
+        only when the event's terminating blank line is reached.
+
+        State of an unfinished event (scan and newline-search positions,
+        type, data offsets) is kept on ``self`` between calls, relative to ``start``, so each
+        new chunk resumes where the last call stopped instead of
+        re-scanning the partial event. It is reset only once an event is
+        dispatched.
+
+        Args:
+            buf: Receive buffer
+            start: Offset of the beginning of the first unparsed event
 
-            if not line:
-                # Empty line signals end of event
-                if event_data:
-                    self._handle_event(event_type, event_data)
+        Returns:
+            Offset just past the last dispatched event (``start`` if none)
+        """
+        consumed = start
+        event_type = self._rx_event_type
+        data_spans = self._rx_data_spans
+        if data_spans and start:
+            data_spans = [(s + start, e + start) for s, e in data_spans]
+        line_start = start + self._rx_scan
+        search_from = start + self._rx_newline_from
+        buf_len = len(buf)
+        find = buf.find
+        from_bytes = int.from_bytes
+        enqueue_event = self._enqueue_event
+
+        # The view must be released before the caller resizes buf
+        with memoryview(buf) as view:
+            while line_start < buf_len:
+                line_end = find(b"\n", search_from)
+                if line_end == -1:
+                    # Incomplete line - wait for more bytes
+                    search_from = buf_len
+                    break
+
+                value_end = line_end
+                if value_end > line_start and buf[value_end - 1] == 0x0D:  # "\r"
+                    value_end -= 1
+
+                if value_end == line_start:
+                    # Empty line signals end of event
+                    if data_spans:
+                        enqueue_event(event_type, b"\n".join([view[s:e] for s, e in data_spans]))
+                        data_spans = []
                     event_type = None
-                    event_data = ""
+                    consumed = line_start = search_from = line_end + 1
+                    continue
+
+                prefix = from_bytes(view[line_start:line_start + 4], "little")
+                if prefix == _PREFIX_DATA and buf[line_start + 4] == 0x3A:  # "data:"
+                    value_start = line_start + 5
+                    if value_start < value_end and buf[value_start] == 0x20:  # " "
+                        value_start += 1
+                    data_spans.append((value_start, value_end))
+                elif prefix == _PREFIX_EVEN and buf.startswith(b"t:", line_start + 4):
+                    value_start = line_start + 6
+                    if value_start < value_end and buf[value_start] == 0x20:  # " "
+                        value_start += 1
+                    # Interned so the _HANDLERS lookup matches by identity
+                    event_type = sys.intern(str(view[value_start:value_end], "utf-8"))
+                # Comment lines (":", often used for keep-alive), "id:" and
+                # "retry:" fields are ignored
+
+                line_start = search_from = line_end + 1
+
+        self._rx_scan = line_start - consumed
+        self._rx_newline_from = search_from - consumed
+        self._rx_event_type = event_type
+        if data_spans and consumed:
+            data_spans = [(s - consumed, e - consumed) for s, e in data_spans]
+        self._rx_data_spans = data_spans
+        return consumed
+
+    def _enqueue_event(self, event_type: Optional[str], data: bytes) -> None:
+        """Hand a complete event to the dispatch worker.
+
+        Keeps JSON decoding and state updates (which may wait on the
+        StateManager lock) off the socket read loop. Heartbeats are
+        recorded here, on arrival, so a busy worker cannot hold back
+        the watchdog's view of the stream; the queued copy is only
+        logged. If the worker falls behind by more than
+        MAX_PENDING_EVENTS, heartbeats are not queued at all.
+
+        Args:
+            event_type: SSE event type (from "event:" line)
+            data: SSE event data (joined "data:" line values)
+        """
+        if event_type == "heartbeat":
+            self._record_heartbeat()
+            if self._event_queue.qsize() > self.MAX_PENDING_EVENTS:
+                return
+        self._event_queue.put((event_type, data))
+
+    def _dispatch_events(self, event_queue: "queue.SimpleQueue") -> None:
+        """Dispatch worker loop: handle queued events until the sentinel.
+
+        Args:
+            event_queue: Queue fed by _enqueue_event; None signals shutdown
+        """
+        while True:
+            timeout = None
+            if self._pending_option_chains:
+                timeout = max(0.0, self._option_chain_flush_at - time.monotonic())
+
+            try:
+                item = event_queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush_option_chain_updates()
                 continue
 
-            if line.startswith("event:"):
-                event_type = line[6:].strip()
-            elif line.startswith("data:"):
-                data_content = line[5:].strip()
-                if event_data:
-                    event_data += "\n" + data_content
-                else:
-                    event_data = data_content
-            elif line.startswith(":"):
-                # Comment line (often used for keep-alive)
-                pass
-
-    def _handle_event(self, event_type: Optional[str], data: str) -> None:
+            if item is None:
+                self._flush_option_chain_updates()
+                return
+            self._handle_event(*item)
+
+            if self._pending_option_chains and time.monotonic() >= self._option_chain_flush_at:
+                self._flush_option_chain_updates()
+
+    def _handle_event(self, event_type: Optional[str], data: Union[str, bytes]) -> None:
         """Handle a complete SSE event.
 
         Requirements 12.3, 12.4, 12.5, 12.6, 12.7, 12.8:
@@ -239,14 +485,20 @@ class TieredStreamClient:
 
         Args:
             event_type: SSE event type (from "event:" line)
-            data: SSE event data (from "data:" line)
+            data: SSE event data (joined "data:" line values)
         """
         if not data:
             return
 
+        if event_type == "heartbeat" and not _stdlib_logger.isEnabledFor(logging.DEBUG):
+            # Already recorded by _enqueue_event; the payload is only read
+            # for debug logging - skip decoding
+            return
+
         try:
-            parsed_data = json.loads(data)
-        except json.JSONDecodeError as e:
+            # orjson parses the bytes from the receive buffer directly
+            parsed_data = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
             # Requirement 17.7: Log all errors to console for debugging
             logger.error("sse_json_parse_error", error=str(e), data_preview=data[:100] if data else None)
             return
@@ -254,21 +506,18 @@ class TieredStreamClient:
         # Determine event type from event line or data
         actual_event_type = event_type or get_event_type(parsed_data)
 
+        if event_type == "heartbeat":
+            # Recorded on arrival by _enqueue_event; a late worker must not
+            # move last_heartbeat_monotonic forward
+            handler = TieredStreamClient._log_heartbeat
+        else:
+            handler = self._HANDLERS.get(actual_event_type)
+        if handler is None:
+            logger.debug("sse_unknown_event", event_type=actual_event_type)
+            return
+
         try:
-            if actual_event_type == "snapshot":
-                self._handle_snapshot(parsed_data)
-            elif actual_event_type == "indicator_update":
-                self._handle_indicator_update(parsed_data)
-            elif actual_event_type == "option_chain_update":
-                self._handle_option_chain_update(parsed_data)
-            elif actual_event_type == "market_closed":
-                self._handle_market_closed(parsed_data)
-            elif actual_event_type == "heartbeat":
-                self._handle_heartbeat(parsed_data)
-            elif actual_event_type == "refresh_recommended":
-                self._handle_refresh_recommended(parsed_data)
-            else:
-                logger.debug("sse_unknown_event", event_type=actual_event_type)
+            handler(self, parsed_data)
         except Exception as e:
             # Requirement 17.7: Log all errors to console for debugging
             logger.error("sse_event_handling_error", error=str(e), error_type=type(e).__name__, event_type=actual_event_type)
@@ -283,16 +532,11 @@ class TieredStreamClient:
             data: Snapshot event data
         """
         logger.info("sse_snapshot_processing")
+        # Apply older coalesced option chains first so they cannot overwrite the snapshot
+        self._flush_option_chain_updates()
         try:
             parsed = parse_snapshot_event(data)
-            for symbol, modes_data in parsed.items():
-                for mode, symbol_data in modes_data.items():
-                    if symbol_data.indicators:
-                        self.state.update_indicators(symbol, mode, symbol_data.indicators)
-                    if symbol_data.option_chain:
-                        self.state.update_option_chain(symbol, mode, symbol_data.option_chain)
-                    if symbol_data.candles:
-                        self.state.update_candles(symbol, symbol_data.candles)
+            self.state.apply_snapshot(parsed)
             logger.info("sse_snapshot_processed", symbol_count=len(parsed))
         except Exception as e:
             # Requirement 17.7: Log all errors to console for debugging
@@ -310,11 +554,16 @@ class TieredStreamClient:
         try:
             symbol, mode, indicators = parse_indicator_update(data)
             self.state.update_indicators(symbol, mode, indicators)
-            print(f"[SSE] Indicator update: {symbol}/{mode} - EMA5={indicators.ema_5}, EMA21={indicators.ema_21}, RSI={indicators.rsi}")
-            logger.debug("sse_indicators_updated", symbol=symbol, mode=mode)
+            logger.debug(
+                "sse_indicators_updated",
+                symbol=symbol,
+                mode=mode,
+                ema_5=indicators.ema_5,
+                ema_21=indicators.ema_21,
+                rsi=indicators.rsi,
+            )
         except Exception as e:
             # Requirement 17.7: Log all errors to console for debugging
-            print(f"[SSE] ERROR parsing indicator update: {e}")
             logger.error("sse_indicator_update_error", error=str(e), error_type=type(e).__name__)
 
     def _handle_option_chain_update(self, data: Dict[str, Any]) -> None:
@@ -329,13 +578,42 @@ class TieredStreamClient:
         try:
             symbol, mode, option_chain = parse_option_chain_update(data)
             self.state.update_option_chain(symbol, mode, option_chain)
-            print(f"[SSE] Option chain update: {symbol}/{mode} - {len(option_chain.strikes)} strikes, underlying={option_chain.underlying}")
-            logger.debug("sse_option_chain_updated", symbol=symbol, mode=mode)
+            logger.debug(
+                "sse_option_chain_updated",
+                symbol=symbol,
+                mode=mode,
+                strike_count=len(option_chain.strikes),
+                underlying=option_chain.underlying,
+            )
         except Exception as e:
             # Requirement 17.7: Log all errors to console for debugging
-            print(f"[SSE] ERROR parsing option chain update: {e}")
             logger.error("sse_option_chain_update_error", error=str(e), error_type=type(e).__name__)
 
+    def _coalesce_option_chain_update(self, data: Dict[str, Any]) -> None:
+        """Buffer an option_chain_update, keeping only the newest per symbol/mode.
+
+        During bursts the same symbol/mode can update many times a second;
+        intermediate chains are never visible in the UI, so only the last
+        one seen within OPTION_CHAIN_COALESCE_SECONDS is parsed and applied
+        (by the dispatch worker via _flush_option_chain_updates).
+
+        Args:
+            data: Option chain update event data
+        """
+        key = (str(data.get("symbol", "")).lower(), str(data.get("mode", "current")).lower())
+        if not self._pending_option_chains:
+            self._option_chain_flush_at = time.monotonic() + self.OPTION_CHAIN_COALESCE_SECONDS
+        self._pending_option_chains[key] = data
+
+    def _flush_option_chain_updates(self) -> None:
+        """Apply all buffered option_chain_update events."""
+        if not self._pending_option_chains:
+            return
+        pending = self._pending_option_chains
+        self._pending_option_chains = {}
+        for data in pending.values():
+            self._handle_option_chain_update(data)
+
     def _handle_market_closed(self, data: Dict[str, Any]) -> None:
         """Handle market_closed event to display market closed banner.
 
@@ -354,13 +632,41 @@ class TieredStreamClient:
         Requirement 12.7: WHEN receiving a heartbeat event,
         THE Dashboard SHALL update connection status.
 
+        Reached for heartbeats typed only in their payload; those with an
+        "event:" line are recorded by _enqueue_event instead.
+
         Args:
             data: Heartbeat event data
         """
-        self.last_heartbeat_time = datetime.now(IST)
-        ts = parse_timestamp(data.get("timestamp", data.get("ts")))
-        self.state.set_sse_connected(True)
-        logger.debug("sse_heartbeat_received", timestamp=str(ts) if ts else None)
+        self._record_heartbeat()
+        self._log_heartbeat(data)
+
+    def _log_heartbeat(self, data: Dict[str, Any]) -> None:
+        """Debug-log a heartbeat's timestamp.
+
+        Args:
+            data: Heartbeat event data
+        """
+        # The parsed timestamp is only logged, so skip parsing when DEBUG is off
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            ts = parse_timestamp(data.get("timestamp", data.get("ts")))
+            logger.debug("sse_heartbeat_received", timestamp=str(ts) if ts else None)
+
+    def _record_heartbeat(self) -> None:
+        """Record heartbeat arrival for the watchdog and connection status."""
+        self.last_heartbeat_monotonic = time.monotonic()
+        # Heartbeats arrive every few seconds; only write through on a change
+        if not self._sse_connected_cached:
+            self._set_sse_connected(True)
+
+    def _set_sse_connected(self, connected: bool) -> None:
+        """Update SSE connection status in state and remember the value.
+
+        Args:
+            connected: Whether the SSE stream is connected
+        """
+        self._sse_connected_cached = connected
+        self.state.set_sse_connected(connected)
 
     def _handle_refresh_recommended(self, data: Dict[str, Any]) -> None:
         """Handle refresh_recommended event by re-fetching bootstrap data.
@@ -379,17 +685,31 @@ class TieredStreamClient:
                 # Requirement 17.7: Log all errors to console for debugging
                 logger.error("sse_refresh_callback_error", error=str(e), error_type=type(e).__name__)
 
+    # Event type -> handler dispatch table for _handle_event
+    _HANDLERS: ClassVar[Dict[str, Callable[["TieredStreamClient", Dict[str, Any]], None]]] = {
+        "snapshot": _handle_snapshot,
+        "indicator_update": _handle_indicator_update,
+        "option_chain_update": _coalesce_option_chain_update,
+        "market_closed": _handle_market_closed,
+        "heartbeat": _handle_heartbeat,
+        "refresh_recommended": _handle_refresh_recommended,
+    }
+
     def _schedule_reconnect(self) -> None:
         """Schedule reconnection with exponential backoff.
 
         Requirement 12.9: THE Dashboard SHALL implement reconnection with
         exponential backoff (1s, 2s, 4s, 8s, max 30s).
+
+        The actual wait is jittered to between half and all of the current
+        backoff step, so dashboards dropped at the same moment (e.g. a
+        Cloud Run rolling restart) do not reconnect in lockstep.
         """
         if not self.running or self._stop_event.is_set():
             return
 
-        delay = self.reconnect_delay
-        logger.info("sse_reconnect_scheduled", delay_seconds=delay)
+        delay = random.uniform(self.reconnect_delay * 0.5, self.reconnect_delay)
+        logger.info("sse_reconnect_scheduled", delay_seconds=round(delay, 3))
 
         # Use stop_event.wait() instead of time.sleep() for interruptible wait
         self._stop_event.wait(timeout=delay)
@@ -402,30 +722,114 @@ class TieredStreamClient:
 
         Requirement 12.10: THE Dashboard SHALL proactively reconnect
         every 55 minutes before Cloud Run timeout.
+
+        Arms the long-lived monitor thread for a new connection. Bumping
+        the generation counter restarts its deadline and heartbeat checks
+        without allocating a new timer per connection.
         """
-        self._cancel_proactive_reconnect()
+        with self._lock:
+            self._monitor_gen += 1
+            self._monitor_armed = True
+        self._monitor_wake.set()
+        logger.debug("sse_proactive_reconnect_scheduled", minutes=self.PROACTIVE_RECONNECT_MINUTES)
 
-        reconnect_seconds = self.PROACTIVE_RECONNECT_MINUTES * 60
+    def _request_reconnect(self) -> bool:
+        """Stop the current stream so _run reconnects immediately.
 
-        def proactive_reconnect():
-            if self.running:
-                logger.info("sse_proactive_reconnect_triggered")
-                self.reconnect_delay = 1.0  # Reset backoff for proactive reconnect
-                # Signal the stream to stop, which will trigger reconnection
-                self._stop_event.set()
+        Requests are coalesced: while one reconnect is pending, further
+        requests are no-ops.
 
-        self._proactive_reconnect_timer = threading.Timer(
-            reconnect_seconds, proactive_reconnect
-        )
-        self._proactive_reconnect_timer.daemon = True
-        self._proactive_reconnect_timer.start()
-        logger.debug("sse_proactive_reconnect_scheduled", minutes=self.PROACTIVE_RECONNECT_MINUTES)
+        Returns:
+            True if a reconnect was requested, False if one was already pending
+        """
+        with self._lock:
+            if self._reconnect_pending:
+                return False
+            self._reconnect_pending = True
+            self.reconnect_delay = 1.0  # Reset backoff for requested reconnect
+        # Signal the stream to stop, which will trigger reconnection
+        self._stop_event.set()
+        return True
 
     def _cancel_proactive_reconnect(self) -> None:
-        """Cancel the proactive reconnection timer."""
-        if self._proactive_reconnect_timer:
-            self._proactive_reconnect_timer.cancel()
-            self._proactive_reconnect_timer = None
+        """Disarm the proactive reconnect deadline and heartbeat watchdog."""
+        with self._lock:
+            self._monitor_gen += 1
+            self._monitor_armed = False
+        self._monitor_wake.set()
+
+    def _start_monitor(self) -> None:
+        """Start the connection monitor thread if it is not already running."""
+        if self._monitor_thread is not None and self._monitor_thread.is_alive():
+            return
+        self._monitor_thread = threading.Thread(target=self._monitor_connection, daemon=True)
+        self._monitor_thread.start()
+
+    def _monitor_connection(self) -> None:
+        """Connection monitor loop, one thread for the client's lifetime.
+
+        While armed for a connection, wakes every HEARTBEAT_CHECK_INTERVAL
+        seconds and requests a reconnect when either:
+        - PROACTIVE_RECONNECT_MINUTES have passed (Requirement 12.10), or
+        - no heartbeat has arrived for HEARTBEAT_TIMEOUT seconds, so a
+          stream that still delivers bytes but has stopped heartbeating
+          is not kept open indefinitely.
+
+        It also fires a token reconnect that update_jwt_token deferred
+        until TOKEN_RECONNECT_DEDUP_SECONDS after the previous one.
+
+        Any schedule/cancel/defer call sets _monitor_wake, which ends the
+        current wait and re-reads the generation; the proactive deadline
+        only restarts for a new generation.
+        """
+        gen = -1
+        deadline = 0.0
+        while self.running:
+            self._monitor_wake.wait()
+            with self._lock:
+                self._monitor_wake.clear()
+                armed = self._monitor_armed
+                if gen != self._monitor_gen:
+                    gen = self._monitor_gen
+                    deadline = time.monotonic() + self.PROACTIVE_RECONNECT_MINUTES * 60
+            if not armed:
+                continue
+
+            while True:
+                timeout = self.HEARTBEAT_CHECK_INTERVAL
+                token_due = self._token_reconnect_due
+                if token_due is not None:
+                    timeout = max(0.0, min(timeout, token_due - time.monotonic()))
+                if self._monitor_wake.wait(timeout=timeout):
+                    break
+                if not self.running or gen != self._monitor_gen:
+                    break
+
+                now = time.monotonic()
+                if token_due is not None and now >= token_due:
+                    with self._lock:
+                        fire = self._token_reconnect_due == token_due
+                        if fire:
+                            self._token_reconnect_due = None
+                    if fire and self._request_reconnect():
+                        self._last_token_reconnect = now
+                        logger.info("sse_token_refresh_reconnect", deferred=True)
+                        break
+
+                if now >= deadline:
+                    logger.info("sse_proactive_reconnect_triggered")
+                    self._request_reconnect()
+                    break
+
+                last_heartbeat = self.last_heartbeat_monotonic
+                if not last_heartbeat:
+                    continue
+
+                silence = time.monotonic() - last_heartbeat
+                if silence > self.HEARTBEAT_TIMEOUT:
+                    logger.warning("sse_heartbeat_timeout", seconds_since_heartbeat=int(silence))
+                    self._request_reconnect()
+                    break
 
     def disconnect(self) -> None:
         """Disconnect from the SSE stream.
@@ -434,9 +838,21 @@ class TieredStreamClient:
         """
         logger.info("sse_disconnecting")
         self.running = False
+        with self._lock:
+            self._reconnect_pending = False
         self._stop_event.set()
+        # Sentinel unblocks the dispatch worker after already-queued events
+        self._event_queue.put(None)
         self._cancel_proactive_reconnect()
-        self.state.set_sse_connected(False)
+        self._set_sse_connected(False)
+
+        if self._http is not None:
+            try:
+                self._http.close()
+            except Exception as e:
+                # Requirement 17.7: Log all errors to console for debugging
+                logger.error("sse_close_error", error=str(e), error_type=type(e).__name__)
+            self._http = None
 
     def is_connected(self) -> bool:
         """Check if SSE is currently connected.
@@ -447,13 +863,40 @@ class TieredStreamClient:
         return self.state.get_connection_status().sse_connected
 
     def update_jwt_token(self, new_token: str) -> None:
-        """Update the JWT token for reconnection.
+        """Update the JWT token and reconnect the stream with it.
+
+        A running stream keeps the token it connected with, so a changed
+        token triggers a reconnect before the old one expires mid-stream.
+        Token-driven reconnects are limited to one per
+        TOKEN_RECONNECT_DEDUP_SECONDS to avoid thrashing the stream; a
+        change inside that window is deferred to the monitor thread,
+        which reconnects when the window ends.
 
         Args:
             new_token: New JWT token
         """
+        now = time.monotonic()
         with self._lock:
+            changed = new_token != self.jwt_token
             self.jwt_token = new_token
+            if changed:
+                self._cached_url = None
+            if not changed or not self.running:
+                return
+
+            last = self._last_token_reconnect
+            deferred = last is not None and now - last < self.TOKEN_RECONNECT_DEDUP_SECONDS
+            if deferred:
+                due = self._token_reconnect_due = last + self.TOKEN_RECONNECT_DEDUP_SECONDS
+
+        if deferred:
+            self._monitor_wake.set()
+            logger.info("sse_token_refresh_reconnect_deferred", delay_seconds=round(due - now, 3))
+            return
+
+        if self._request_reconnect():
+            self._last_token_reconnect = now
+            logger.info("sse_token_refresh_reconnect")
 
 
 def calculate_sse_backoff_delay(failure_count: int) -> float:
@@ -462,6 +905,9 @@ def calculate_sse_backoff_delay(failure_count: int) -> float:
     Requirement 12.9: Backoff follows 2^(n-1) capped at 30s.
     Sequence: 1s, 2s, 4s, 8s, 16s, 30s, 30s, ...
 
+    Each step is jittered uniformly to between half and all of its value
+    so that many clients failing together spread out their retries.
+
     Args:
         failure_count: Number of consecutive failures (1-indexed)
 
@@ -470,4 +916,5 @@ def calculate_sse_backoff_delay(failure_count: int) -> float:
     """
     if failure_count < 1:
         return 1.0
-    return min(2 ** (failure_count - 1), 30.0)
+    base = min(2 ** (failure_count - 1), 30.0)
+    return random.uniform(base * 0.5, base)
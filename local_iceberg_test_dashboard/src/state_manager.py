@@ -3,18 +3,27 @@
 Thread-safe state container for real-time market data.
 
 Manages shared state between WebSocket/SSE background threads and Dash callbacks.
-Uses RLock for concurrent access to prevent race conditions.
+Per-symbol market data is guarded by sharded locks; connection, session and
+other dashboard substates each by their own lock.
 
 Requirements: 10.4, 11.3, 12.4, 13.4, 15.2, 3.7, 3.9
 """
 
 import base64
 import json
+import sys
 import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
-import pytz
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import product
+from operator import itemgetter
+from zoneinfo import ZoneInfo
 
 from .models import (
     SymbolTick,
@@ -22,11 +31,12 @@ from .models import (
     OptionChainData,
     OptionStrike,
     Candle,
+    SymbolData,
     VALID_SYMBOLS,
     VALID_MODES,
 )
 
-IST = pytz.timezone("Asia/Kolkata")
+IST = ZoneInfo("Asia/Kolkata")
 
 # Market hours constants
 MARKET_START_MINUTES = 9 * 60 + 15  # 9:15 AM = 555 minutes
@@ -34,10 +44,24 @@ MARKET_END_MINUTES = 15 * 60 + 30   # 3:30 PM = 930 minutes
 CANDLE_INTERVAL_MINUTES = 5
 
 
+CANDLE_INTERVAL = timedelta(minutes=CANDLE_INTERVAL_MINUTES)
+_ZERO_DELTA = timedelta(0)
+
+# Last boundary built by floor_to_5min_boundary; consecutive updates within
+# one candle get it back instead of a new datetime. Shared by all threads:
+# rebinding it is atomic and every read is re-validated against ts, so a
+# stale value only costs a rebuild.
+_floor_last: Optional[datetime] = None
+
+
 def floor_to_5min_boundary(ts: datetime) -> datetime:
     """Floor a timestamp to the nearest 5-minute candle boundary.
     
     Candles are aligned to market open (9:15, 9:20, 9:25, etc.)
+
+    Flooring works on the wall-clock fields, so the boundary does not
+    depend on the UTC offset of ts.tzinfo (a pytz zone attached with
+    tzinfo= carries LMT, e.g. +05:53 for Asia/Kolkata).
     
     Args:
         ts: Timestamp to floor
@@ -45,25 +69,140 @@ def floor_to_5min_boundary(ts: datetime) -> datetime:
     Returns:
         Timestamp floored to 5-minute boundary
     """
-    # Get minutes since midnight
-    total_minutes = ts.hour * 60 + ts.minute
-    
-    # Floor to 5-minute boundary
-    floored_minutes = (total_minutes // CANDLE_INTERVAL_MINUTES) * CANDLE_INTERVAL_MINUTES
-    
-    # Create new timestamp with floored time
-    return ts.replace(
-        hour=floored_minutes // 60,
-        minute=floored_minutes % 60,
+    global _floor_last
+
+    last = _floor_last
+    # Same tzinfo object: subtraction compares wall-clock fields only
+    if last is not None and last.tzinfo is ts.tzinfo and _ZERO_DELTA <= ts - last < CANDLE_INTERVAL:
+        return last
+
+    result = ts.replace(
+        minute=ts.minute - ts.minute % CANDLE_INTERVAL_MINUTES,
         second=0,
-        microsecond=0
+        microsecond=0,
     )
+    _floor_last = result
+    return result
+
+
+def _market_open_at(now: datetime) -> bool:
+    """Check whether a time falls within Indian market hours.
+
+    Args:
+        now: Time in IST
+
+    Returns:
+        True if within 09:15 - 15:30 on a weekday, False otherwise
+    """
+    # Check if it's a weekday (Monday=0, Sunday=6)
+    if now.weekday() >= 5:  # Saturday or Sunday
+        return False
+
+    # Check market hours
+    current_minutes = now.hour * 60 + now.minute
+    return MARKET_START_MINUTES <= current_minutes <= MARKET_END_MINUTES
+
 
 # JWT refresh threshold in seconds (1 hour = 3600 seconds)
 JWT_REFRESH_THRESHOLD_SECONDS = 3600
 
+def to_ist(ts: Optional[float]) -> Optional[datetime]:
+    """Convert epoch seconds to an IST datetime for display.
+
+    Args:
+        ts: Epoch seconds (time.time()), or None
+
+    Returns:
+        Aware IST datetime, or None if ts is None
+    """
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, IST)
+
+
+# Candle-aligned entries kept per indicator history series
+HISTORY_MAX_ENTRIES = 100
+
+# Timestamp of a (timestamp, value, ...) history entry
+_entry_ts = itemgetter(0)
 
-@dataclass
+# Number of locks per-symbol data is sharded across (power of two)
+SYMBOL_LOCK_SHARDS = 8
+
+# Every (symbol, mode) key, built once for the per-pair scans
+_SYMBOL_MODE_PAIRS: Tuple[Tuple[str, str], ...] = tuple(product(VALID_SYMBOLS, VALID_MODES))
+
+# Interned lowercase symbol/mode names, keyed by the spellings callers use
+_CANONICAL_NAMES: Dict[str, str] = {
+    spelling: sys.intern(name)
+    for name in VALID_SYMBOLS + VALID_MODES
+    for spelling in (name, name.upper())
+}
+
+
+def _canon(name: str) -> str:
+    """Return the canonical lowercase form of a symbol or mode name.
+
+    Known names resolve with one dict lookup to a shared interned string;
+    anything else falls back to ``str.lower()``.
+
+    Args:
+        name: Symbol or mode name in any case
+
+    Returns:
+        Lowercase name
+    """
+    return _CANONICAL_NAMES.get(name) or name.lower()
+
+
+def _upsert_history_entry(
+    history: List[Tuple],
+    index: Dict[datetime, int],
+    entry: Tuple,
+) -> None:
+    """Insert or replace a candle-aligned history entry in place.
+
+    ``index`` maps each candle timestamp in ``history`` to its position,
+    so an existing bucket is found without scanning the list. The last
+    value for a bucket wins. ``history`` is kept sorted by timestamp, so
+    readers can return it without sorting.
+
+    Args:
+        history: History series of (timestamp, value, ...) tuples
+        index: Candle timestamp -> position in ``history``
+        entry: New (timestamp, value, ...) tuple
+    """
+    candle_ts = entry[0]
+
+    # Fast path: nearly every update lands in the current candle bucket
+    if history and history[-1][0] == candle_ts:
+        history[-1] = entry
+        return
+
+    existing_idx = index.get(candle_ts)
+    if existing_idx is not None:
+        history[existing_idx] = entry
+        return
+
+    if not history or history[-1][0] < candle_ts:
+        index[candle_ts] = len(history)
+        history.append(entry)
+    else:
+        # Rare: a bucket older than the newest one (e.g. bootstrap backfill);
+        # insert in order and shift the positions of the entries after it
+        pos = bisect_left(history, candle_ts, key=_entry_ts)
+        history.insert(pos, entry)
+        index.update(zip(map(_entry_ts, history[pos:]), range(pos, len(history))))
+
+    # Keep only the most recent entries to prevent memory growth
+    if len(history) > HISTORY_MAX_ENTRIES:
+        del history[:-HISTORY_MAX_ENTRIES]
+        # Renumber with C-level iteration (no per-entry unpacking)
+        index.clear()
+        index.update(zip(map(_entry_ts, history), range(len(history))))
+
+
+@dataclass(frozen=True, slots=True)
 class ConnectionStatus:
     """Connection status for streaming clients."""
 
@@ -73,7 +212,7 @@ class ConnectionStatus:
     last_sse_update: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserSession:
     """User session information for access control.
     
@@ -87,6 +226,8 @@ class UserSession:
     is_authenticated: bool = False
     jwt_token: Optional[str] = None
     jwt_expiry: Optional[datetime] = None
+    # jwt_expiry as epoch seconds, for refresh checks on every heartbeat
+    jwt_expiry_ts: Optional[float] = None
 
 
 def parse_jwt_expiry(token: str) -> Optional[datetime]:
@@ -105,36 +246,45 @@ def parse_jwt_expiry(token: str) -> Optional[datetime]:
     """
     if not token:
         return None
-    
+    return _parse_jwt_expiry_cached(token)
+
+
+@lru_cache(maxsize=64)
+def _parse_jwt_expiry_cached(token: str) -> Optional[datetime]:
+    """Decode a JWT's 'exp' claim; memoized since tokens are immutable strings.
+
+    Args:
+        token: Non-empty JWT token string
+
+    Returns:
+        Expiry datetime in IST timezone if found, None otherwise
+    """
+    # JWT format: header.payload.signature; reject other shapes up front
+    if token.count('.') != 2:
+        return None
+    payload = token.split('.', 2)[1]
+    if not payload:
+        return None
+
     try:
-        # JWT format: header.payload.signature
-        parts = token.split('.')
-        if len(parts) != 3:
-            return None
-        
-        payload = parts[1]
-        
-        # Add padding if needed (base64 requires padding to be multiple of 4)
-        padding = 4 - len(payload) % 4
-        if padding != 4:
-            payload += '=' * padding
-        
-        # Decode base64url to bytes
-        decoded = base64.urlsafe_b64decode(payload)
-        
-        # Parse JSON payload
+        # base64url without padding; restore it to a multiple of 4
+        decoded = base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4))
         claims = json.loads(decoded)
-        
-        # Get expiry timestamp
-        exp = claims.get('exp')
-        if exp:
-            # Convert Unix timestamp to datetime in IST
-            return datetime.fromtimestamp(exp, tz=IST)
-    except Exception:
-        # If any parsing fails, return None
-        pass
-    
-    return None
+    except ValueError:
+        # binascii.Error, UnicodeDecodeError and JSONDecodeError are all ValueErrors
+        return None
+
+    # Only the top-level claim counts; nested objects may carry their own 'exp'
+    exp = claims.get('exp') if isinstance(claims, dict) else None
+    if exp is None or isinstance(exp, bool):
+        return None
+
+    try:
+        # Convert Unix timestamp to datetime in IST
+        return datetime.fromtimestamp(exp, tz=IST)
+    except (TypeError, ValueError, OverflowError, OSError):
+        # Non-numeric or out-of-range exp claim
+        return None
 
 
 def jwt_needs_refresh(expiry: Optional[datetime], threshold_seconds: int = JWT_REFRESH_THRESHOLD_SECONDS) -> bool:
@@ -157,14 +307,13 @@ def jwt_needs_refresh(expiry: Optional[datetime], threshold_seconds: int = JWT_R
         # No expiry info - don't trigger refresh
         return False
     
-    now = datetime.now(IST)
-    time_remaining = (expiry - now).total_seconds()
+    time_remaining = expiry.timestamp() - time.time()
     
     # Refresh if less than threshold seconds remaining
     return time_remaining < threshold_seconds
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OTPSession:
     """OTP session information for admin operations.
     
@@ -176,7 +325,7 @@ class OTPSession:
     verified_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorState:
     """Error state for tracking and displaying errors.
     
@@ -194,7 +343,7 @@ class ErrorState:
     max_retries: int = 3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StalenessState:
     """Staleness state for tracking data freshness.
     
@@ -213,7 +362,7 @@ class StalenessState:
     staleness_threshold_seconds: int = 300
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataGapState:
     """State for tracking data gaps and auto-bootstrap.
     
@@ -239,7 +388,33 @@ class DataGapState:
     gap_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class GapResult:
+    """Result of a data gap check for one symbol/mode.
+    
+    FIX-032: Data Gap Detection
+    """
+    
+    has_gap: bool = False
+    
+    # Which data is missing or stale (indicators, skew_pcr)
+    gap_type: Optional[str] = None
+    
+    # Timestamp of the newest data found, if any
+    last_data_time: Optional[datetime] = None
+    
+    # Age of that data in whole minutes
+    gap_minutes: Optional[int] = None
+    
+    # Gap details for display
+    message: Optional[str] = None
+
+
+# Shared result for the common no-gap case; immutable, so safe to reuse
+NO_GAP = GapResult()
+
+
+@dataclass(frozen=True, slots=True)
 class MarketInfoState:
     """Market info state from API response meta.
     
@@ -264,6 +439,16 @@ class MarketInfoState:
     last_updated: Optional[datetime] = None
 
 
+# Initial substates; frozen, so one shared instance serves every reset
+_EMPTY_CONNECTION_STATUS = ConnectionStatus()
+_EMPTY_USER_SESSION = UserSession()
+_EMPTY_OTP_SESSION = OTPSession()
+_EMPTY_ERROR_STATE = ErrorState()
+_EMPTY_STALENESS_STATE = StalenessState()
+_EMPTY_DATA_GAP_STATE = DataGapState()
+_EMPTY_MARKET_INFO_STATE = MarketInfoState()
+
+
 class StateManager:
     """Thread-safe state container for real-time dashboard data.
 
@@ -272,7 +457,11 @@ class StateManager:
     - SSE client (slow stream - indicator updates)
     - Dash callbacks (UI updates)
 
-    All public methods are thread-safe using RLock for concurrent access.
+    All public methods are thread-safe. Writers take plain Locks: a shard
+    lock per symbol for market data and one lock per substate (connection,
+    market, session, staleness, ...). Readers take no lock: writers
+    publish new frozen substates and new entries (copy-on-write) rather
+    than mutating what a reader may hold.
 
     Requirements:
         10.4: Symbol selector updates LTPs in real-time from WebSocket tick events
@@ -282,8 +471,8 @@ class StateManager:
 
     Attributes:
         symbols_ltp: Dict mapping symbol -> SymbolTick with latest LTP
-        indicators: Dict mapping symbol -> mode -> IndicatorData
-        option_chains: Dict mapping symbol -> mode -> OptionChainData
+        indicators: Dict mapping (symbol, mode) -> IndicatorData
+        option_chains: Dict mapping (symbol, mode) -> OptionChainData
         candles: Dict mapping symbol -> List[Candle]
         ema_history: Dict mapping symbol -> List of (ts, ema_5, ema_21) tuples
         connection_status: Current connection status for WS and SSE
@@ -292,20 +481,44 @@ class StateManager:
 
     def __init__(self):
         """Initialize state manager with empty state containers."""
-        self._lock = threading.RLock()
+        # Substates are frozen dataclasses replaced whole on every change, so
+        # readers take no lock. One lock per substate serializes its writers;
+        # methods hold at most one of these at a time, and clear() takes them
+        # all in the order listed here. No locked block calls back into the
+        # manager, so plain Locks suffice (cheaper than RLock).
+        self._conn_lock = threading.Lock()        # connection_status
+        self._market_lock = threading.Lock()      # market_state, market_info_state
+        self._user_lock = threading.Lock()        # user_session
+        self._otp_lock = threading.Lock()         # otp_session
+        self._error_lock = threading.Lock()       # error_state
+        self._staleness_lock = threading.Lock()   # staleness_state
+        self._gap_lock = threading.Lock()         # data_gap_state
+        # Per-symbol data (LTP, indicators, option chains, candles, history)
+        # is guarded by a shard lock picked by symbol, so a WebSocket tick for
+        # one symbol does not block a Dash callback reading another.
+        # Lock order: substate locks first, then shard locks in index order.
+        self._symbol_locks = tuple(threading.Lock() for _ in range(SYMBOL_LOCK_SHARDS))
+        # Seqlock counters for the history series, one per shard: odd while a
+        # writer holding the shard lock is changing them, so readers can copy
+        # without the lock and retry under it only if a write overlapped
+        self._history_seq: List[int] = [0] * SYMBOL_LOCK_SHARDS
+        # Serializes copy-on-write replacement of symbols_ltp
+        self._ltp_write_lock = threading.Lock()
 
         # Symbol LTP data (Requirement 10.4, 11.3)
+        # Copy-on-write: replaced, never mutated, so readers need no copy
         self.symbols_ltp: Dict[str, SymbolTick] = {}
 
         # Indicator data per symbol/mode (Requirement 12.4, 13.4)
-        # Structure: {symbol: {mode: IndicatorData}}
-        self.indicators: Dict[str, Dict[str, IndicatorData]] = {}
+        # Structure: {(symbol, mode): IndicatorData}
+        self.indicators: Dict[Tuple[str, str], IndicatorData] = {}
 
         # Option chain data per symbol/mode (Requirement 13.4)
-        # Structure: {symbol: {mode: OptionChainData}}
-        self.option_chains: Dict[str, Dict[str, OptionChainData]] = {}
+        # Structure: {(symbol, mode): OptionChainData}
+        self.option_chains: Dict[Tuple[str, str], OptionChainData] = {}
 
         # Candle data per symbol
+        # Copy-on-write: each symbol's list is replaced, never mutated
         self.candles: Dict[str, List[Candle]] = {}
 
         # EMA history for charting: (timestamp, ema_5, ema_21)
@@ -313,7 +526,8 @@ class StateManager:
 
         # Skew/PCR history for charting: (timestamp, skew, pcr)
         # Requirement 8.1, 8.2: Track Skew and PCR values over time for timeseries display
-        self.skew_pcr_history: Dict[str, Dict[str, List[Tuple[datetime, float, float]]]] = {}
+        # Structure: {(symbol, mode): [(timestamp, skew, pcr), ...]}
+        self.skew_pcr_history: Dict[Tuple[str, str], List[Tuple[datetime, float, float]]] = {}
 
         # ADR history for charting: (timestamp, adr)
         # ADR is symbol-level (not mode-specific)
@@ -323,49 +537,97 @@ class StateManager:
         # RSI is symbol-level (not mode-specific)
         self.rsi_history: Dict[str, List[Tuple[datetime, float]]] = {}
 
+        # Candle timestamp -> list position for each history series above,
+        # so update_indicators finds an existing bucket without a scan
+        self._ema_hist_idx: Dict[str, Dict[datetime, int]] = {}
+        self._skew_pcr_hist_idx: Dict[Tuple[str, str], Dict[datetime, int]] = {}
+        self._adr_hist_idx: Dict[str, Dict[datetime, int]] = {}
+        self._rsi_hist_idx: Dict[str, Dict[datetime, int]] = {}
+
         # Connection status
-        self.connection_status = ConnectionStatus()
+        self.connection_status = _EMPTY_CONNECTION_STATUS
+
+        # Update times as epoch seconds (time.time()), cheaper to stamp and
+        # compare than aware datetimes; getters convert them with to_ist().
+        # No lock guards them: each is one float rebound whole (atomic), and
+        # both writers and readers touch them outside any substate lock.
+        self._last_ws_update: Optional[float] = None
+        self._last_sse_update: Optional[float] = None
+        self._last_data_update: Optional[float] = None  # Requirement 17.6
 
         # Market state
         self.market_state: str = "UNKNOWN"
         
         # User session (Requirement 15.2)
-        self.user_session = UserSession()
+        self.user_session = _EMPTY_USER_SESSION
         
         # OTP session (Requirement 15.8)
-        self.otp_session = OTPSession()
+        self.otp_session = _EMPTY_OTP_SESSION
         
         # Error state (Requirements 17.1, 5.6)
-        self.error_state = ErrorState()
+        self.error_state = _EMPTY_ERROR_STATE
         
         # Staleness state (Requirements 5.7, 17.6)
-        self.staleness_state = StalenessState()
+        self.staleness_state = _EMPTY_STALENESS_STATE
         
         # Data gap state (FIX-032)
-        self.data_gap_state = DataGapState()
+        self.data_gap_state = _EMPTY_DATA_GAP_STATE
         
         # Market info state (FIX-043)
-        self.market_info_state = MarketInfoState()
+        self.market_info_state = _EMPTY_MARKET_INFO_STATE
+
+        # (epoch minute, is_market_open result); market hours change only on
+        # minute boundaries, so one evaluation serves the whole minute
+        self._market_open_cache: Tuple[int, bool] = (-1, False)
 
         # Initialize empty structures for all valid symbols
         self._initialize_symbols()
 
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        """Get the shard lock guarding a symbol's data.
+
+        Args:
+            symbol: Trading symbol (lowercase)
+
+        Returns:
+            Lock for the symbol's shard
+        """
+        return self._symbol_locks[hash(symbol) & (SYMBOL_LOCK_SHARDS - 1)]
+
+    def _hold_symbol_locks(self, symbols: Optional[Any] = None) -> ExitStack:
+        """Acquire shard locks in index order for a multi-symbol operation.
+
+        Args:
+            symbols: Lowercase symbols to lock, or None for every shard
+
+        Returns:
+            ExitStack holding the locks; use it as a context manager
+        """
+        if symbols is None:
+            locks = self._symbol_locks
+        else:
+            shards = sorted({hash(symbol) & (SYMBOL_LOCK_SHARDS - 1) for symbol in symbols})
+            locks = [self._symbol_locks[shard] for shard in shards]
+        stack = ExitStack()
+        for lock in locks:
+            stack.enter_context(lock)
+        return stack
+
     def _initialize_symbols(self) -> None:
         """Initialize empty data structures for all valid symbols."""
         for symbol in VALID_SYMBOLS:
-            self.indicators[symbol] = {}
-            self.option_chains[symbol] = {}
             self.candles[symbol] = []
             self.ema_history[symbol] = []
-            self.skew_pcr_history[symbol] = {}
             self.adr_history[symbol] = []
             self.rsi_history[symbol] = []
-            for mode in VALID_MODES:
-                self.indicators[symbol][mode] = IndicatorData()
-                self.option_chains[symbol][mode] = OptionChainData(
-                    expiry="", underlying=0.0
-                )
-                self.skew_pcr_history[symbol][mode] = []
+            self._ema_hist_idx[symbol] = {}
+            self._adr_hist_idx[symbol] = {}
+            self._rsi_hist_idx[symbol] = {}
+        for key in _SYMBOL_MODE_PAIRS:
+            self.indicators[key] = IndicatorData()
+            self.option_chains[key] = OptionChainData(expiry="", underlying=0.0)
+            self.skew_pcr_history[key] = []
+            self._skew_pcr_hist_idx[key] = {}
 
     def update_ltp(
         self,
@@ -389,21 +651,60 @@ class StateManager:
             change_pct: Percentage change from previous close
             ts: Timestamp of the tick (defaults to now in IST)
         """
-        symbol = symbol.lower()
+        symbol = _canon(symbol)
         if ts is None:
             ts = datetime.now(IST)
 
-        with self._lock:
-            self.symbols_ltp[symbol] = SymbolTick(
-                symbol=symbol,
+        tick = SymbolTick(
+            symbol=symbol,
+            ltp=ltp,
+            change=change,
+            change_pct=change_pct,
+            ts=ts,
+        )
+        with self._ltp_write_lock:
+            symbols_ltp = self.symbols_ltp.copy()
+            symbols_ltp[symbol] = tick
+            self.symbols_ltp = symbols_ltp  # Atomic rebind; readers see old or new
+        # Lock-free single attribute stores, see __init__
+        self._last_ws_update = self._last_data_update = ts.timestamp()
+
+    def update_ltps_batch(
+        self,
+        ticks: List[Tuple[str, float, float, float, Optional[datetime]]],
+    ) -> None:
+        """Update LTPs for several symbols from one WebSocket frame.
+
+        Equivalent to calling update_ltp for each tick in order, but copies
+        and republishes the LTP map once and stamps the update times once.
+
+        Requirement 11.3: WHEN receiving a tick event, THE Dashboard SHALL
+        update the corresponding symbol LTP.
+
+        Args:
+            ticks: (symbol, ltp, change, change_pct, ts) tuples; a ts of
+                   None defaults to now in IST
+        """
+        if not ticks:
+            return
+
+        now = datetime.now(IST)
+        new_ticks = [
+            SymbolTick(
+                symbol=_canon(symbol),
                 ltp=ltp,
                 change=change,
                 change_pct=change_pct,
-                ts=ts,
+                ts=ts or now,
             )
-            self.connection_status.last_ws_update = ts
-            # Update staleness tracking (Requirement 17.6)
-            self.staleness_state.last_data_update = ts
+            for symbol, ltp, change, change_pct, ts in ticks
+        ]
+        with self._ltp_write_lock:
+            symbols_ltp = self.symbols_ltp.copy()
+            for tick in new_ticks:
+                symbols_ltp[tick.symbol] = tick
+            self.symbols_ltp = symbols_ltp
+        self._last_ws_update = self._last_data_update = new_ticks[-1].ts.timestamp()
 
     def update_indicators(
         self,
@@ -430,112 +731,76 @@ class StateManager:
             mode: Expiry mode ('current' or 'positional')
             indicators: IndicatorData object with updated values
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
+        symbol = _canon(symbol)
+        mode = _canon(mode)
 
-        with self._lock:
-            if symbol not in self.indicators:
-                self.indicators[symbol] = {}
-            self.indicators[symbol][mode] = indicators
-            self.connection_status.last_sse_update = indicators.ts
-            # Update staleness tracking (Requirement 17.6)
-            if indicators.ts:
-                self.staleness_state.last_data_update = indicators.ts
+        with self._lock_for(symbol):
+            self._apply_indicators(symbol, mode, indicators)
 
-            # Align timestamp to 5-minute candle boundary for history
-            candle_ts = floor_to_5min_boundary(indicators.ts) if indicators.ts else None
+    def _apply_indicators(self, symbol: str, mode: str, indicators: IndicatorData) -> None:
+        """Store indicators and update history; caller holds the symbol's lock.
 
+        Args:
+            symbol: Trading symbol (lowercase)
+            mode: Expiry mode (lowercase)
+            indicators: IndicatorData object with updated values
+        """
+        self.indicators[(symbol, mode)] = indicators
+        # Lock-free single attribute stores, see __init__
+        if indicators.ts:
+            self._last_sse_update = self._last_data_update = indicators.ts.timestamp()
+        else:
+            self._last_sse_update = None
+
+        # History is candle-aligned, so an update without a timestamp has
+        # nothing to record; bail out before testing any of the series
+        if not indicators.ts:
+            return
+
+        # Align timestamp to 5-minute candle boundary for history
+        candle_ts = floor_to_5min_boundary(indicators.ts)
+        ema_5, ema_21 = indicators.ema_5, indicators.ema_21
+        skew, pcr = indicators.skew, indicators.pcr
+        adr, rsi = indicators.adr, indicators.rsi
+
+        shard = hash(symbol) & (SYMBOL_LOCK_SHARDS - 1)
+        self._history_seq[shard] += 1  # Odd: write in progress
+        try:
             # Update EMA history for charting (candle-aligned, deduplicated)
-            if indicators.ema_5 is not None and indicators.ema_21 is not None and candle_ts:
-                if symbol not in self.ema_history:
-                    self.ema_history[symbol] = []
-                
-                # Check if we already have an entry for this candle bucket
-                # If so, update it (last value wins); otherwise append
-                existing_idx = None
-                for idx, (ts, _, _) in enumerate(self.ema_history[symbol]):
-                    if ts == candle_ts:
-                        existing_idx = idx
-                        break
-                
-                if existing_idx is not None:
-                    # Update existing entry
-                    self.ema_history[symbol][existing_idx] = (candle_ts, indicators.ema_5, indicators.ema_21)
-                else:
-                    # Append new entry
-                    self.ema_history[symbol].append(
-                        (candle_ts, indicators.ema_5, indicators.ema_21)
-                    )
-                    # Keep only last 100 entries to prevent memory growth
-                    if len(self.ema_history[symbol]) > 100:
-                        self.ema_history[symbol] = self.ema_history[symbol][-100:]
+            if ema_5 is not None and ema_21 is not None:
+                _upsert_history_entry(
+                    self.ema_history.setdefault(symbol, []),
+                    self._ema_hist_idx.setdefault(symbol, {}),
+                    (candle_ts, ema_5, ema_21),
+                )
 
             # Update Skew/PCR history for charting (candle-aligned, deduplicated)
-            if indicators.skew is not None and indicators.pcr is not None and candle_ts:
-                if symbol not in self.skew_pcr_history:
-                    self.skew_pcr_history[symbol] = {}
-                if mode not in self.skew_pcr_history[symbol]:
-                    self.skew_pcr_history[symbol][mode] = []
-                
-                # Check if we already have an entry for this candle bucket
-                # If so, update it (last value wins); otherwise append
-                existing_idx = None
-                for idx, (ts, _, _) in enumerate(self.skew_pcr_history[symbol][mode]):
-                    if ts == candle_ts:
-                        existing_idx = idx
-                        break
-                
-                if existing_idx is not None:
-                    # Update existing entry
-                    self.skew_pcr_history[symbol][mode][existing_idx] = (candle_ts, indicators.skew, indicators.pcr)
-                else:
-                    # Append new entry
-                    self.skew_pcr_history[symbol][mode].append(
-                        (candle_ts, indicators.skew, indicators.pcr)
-                    )
-                    # Keep only last 100 entries to prevent memory growth
-                    if len(self.skew_pcr_history[symbol][mode]) > 100:
-                        self.skew_pcr_history[symbol][mode] = self.skew_pcr_history[symbol][mode][-100:]
+            if skew is not None and pcr is not None:
+                _upsert_history_entry(
+                    self.skew_pcr_history.setdefault((symbol, mode), []),
+                    self._skew_pcr_hist_idx.setdefault((symbol, mode), {}),
+                    (candle_ts, skew, pcr),
+                )
 
             # Update ADR history for charting (candle-aligned, deduplicated)
             # ADR is symbol-level (not mode-specific)
-            if indicators.adr is not None and candle_ts:
-                if symbol not in self.adr_history:
-                    self.adr_history[symbol] = []
-                
-                # Check if we already have an entry for this candle bucket
-                existing_idx = None
-                for idx, (ts, _) in enumerate(self.adr_history[symbol]):
-                    if ts == candle_ts:
-                        existing_idx = idx
-                        break
-                
-                if existing_idx is not None:
-                    self.adr_history[symbol][existing_idx] = (candle_ts, indicators.adr)
-                else:
-                    self.adr_history[symbol].append((candle_ts, indicators.adr))
-                    if len(self.adr_history[symbol]) > 100:
-                        self.adr_history[symbol] = self.adr_history[symbol][-100:]
+            if adr is not None:
+                _upsert_history_entry(
+                    self.adr_history.setdefault(symbol, []),
+                    self._adr_hist_idx.setdefault(symbol, {}),
+                    (candle_ts, adr),
+                )
 
             # Update RSI history for charting (candle-aligned, deduplicated)
             # RSI is symbol-level (not mode-specific)
-            if indicators.rsi is not None and candle_ts:
-                if symbol not in self.rsi_history:
-                    self.rsi_history[symbol] = []
-                
-                # Check if we already have an entry for this candle bucket
-                existing_idx = None
-                for idx, (ts, _) in enumerate(self.rsi_history[symbol]):
-                    if ts == candle_ts:
-                        existing_idx = idx
-                        break
-                
-                if existing_idx is not None:
-                    self.rsi_history[symbol][existing_idx] = (candle_ts, indicators.rsi)
-                else:
-                    self.rsi_history[symbol].append((candle_ts, indicators.rsi))
-                    if len(self.rsi_history[symbol]) > 100:
-                        self.rsi_history[symbol] = self.rsi_history[symbol][-100:]
+            if rsi is not None:
+                _upsert_history_entry(
+                    self.rsi_history.setdefault(symbol, []),
+                    self._rsi_hist_idx.setdefault(symbol, {}),
+                    (candle_ts, rsi),
+                )
+        finally:
+            self._history_seq[shard] += 1
 
     def update_option_chain(
         self,
@@ -556,13 +821,11 @@ class StateManager:
             mode: Expiry mode ('current' or 'positional')
             option_chain: OptionChainData object with updated values
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
+        symbol = _canon(symbol)
+        mode = _canon(mode)
 
-        with self._lock:
-            if symbol not in self.option_chains:
-                self.option_chains[symbol] = {}
-            self.option_chains[symbol][mode] = option_chain
+        with self._lock_for(symbol):
+            self.option_chains[(symbol, mode)] = option_chain
 
     def update_option_chain_ltp(
         self,
@@ -580,16 +843,14 @@ class StateManager:
             mode: Expiry mode ('current' or 'positional')
             strike_ltps: Dict mapping strike -> (call_ltp, put_ltp)
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
+        symbol = _canon(symbol)
+        mode = _canon(mode)
 
-        with self._lock:
-            if symbol not in self.option_chains:
-                return
-            if mode not in self.option_chains[symbol]:
+        with self._lock_for(symbol):
+            option_chain = self.option_chains.get((symbol, mode))
+            if option_chain is None:
                 return
 
-            option_chain = self.option_chains[symbol][mode]
             for strike_obj in option_chain.strikes:
                 if strike_obj.strike in strike_ltps:
                     call_ltp, put_ltp = strike_ltps[strike_obj.strike]
@@ -607,10 +868,11 @@ class StateManager:
             symbol: Trading symbol (lowercase)
             candles: List of Candle objects
         """
-        symbol = symbol.lower()
+        symbol = _canon(symbol)
 
-        with self._lock:
-            self.candles[symbol] = candles
+        with self._lock_for(symbol):
+            # Own copy, so later changes to the caller's list are not visible
+            self.candles[symbol] = list(candles)
 
     def append_candle(self, symbol: str, candle: Candle) -> None:
         """Append a new candle to symbol's candle list.
@@ -621,12 +883,34 @@ class StateManager:
             symbol: Trading symbol (lowercase)
             candle: Candle object to append
         """
-        symbol = symbol.lower()
+        symbol = _canon(symbol)
+
+        with self._lock_for(symbol):
+            self.candles[symbol] = self.candles.get(symbol, []) + [candle]
 
-        with self._lock:
-            if symbol not in self.candles:
-                self.candles[symbol] = []
-            self.candles[symbol].append(candle)
+    def apply_snapshot(self, snapshot: Dict[str, Dict[str, SymbolData]]) -> None:
+        """Apply a parsed snapshot in a single lock acquisition.
+
+        Requirement 12.3: Populate initial indicator values on snapshot event.
+
+        Snapshots carry every symbol/mode at once; holding the snapshot's
+        symbol locks for the whole update avoids one acquire/release per
+        field and means readers never observe a half-applied snapshot.
+
+        Args:
+            snapshot: Dict mapping symbol -> mode -> SymbolData
+        """
+        snapshot = {_canon(symbol): modes_data for symbol, modes_data in snapshot.items()}
+        with self._hold_symbol_locks(snapshot):
+            for symbol, modes_data in snapshot.items():
+                for mode, symbol_data in modes_data.items():
+                    mode = _canon(mode)
+                    if symbol_data.indicators:
+                        self._apply_indicators(symbol, mode, symbol_data.indicators)
+                    if symbol_data.option_chain:
+                        self.option_chains[(symbol, mode)] = symbol_data.option_chain
+                    if symbol_data.candles:
+                        self.candles[symbol] = list(symbol_data.candles)
 
     def set_ws_connected(self, connected: bool) -> None:
         """Update WebSocket connection status.
@@ -634,10 +918,10 @@ class StateManager:
         Args:
             connected: True if connected, False otherwise
         """
-        with self._lock:
-            self.connection_status.ws_connected = connected
-            if connected:
-                self.connection_status.last_ws_update = datetime.now(IST)
+        with self._conn_lock:
+            self.connection_status = replace(self.connection_status, ws_connected=connected)
+        if connected:
+            self._last_ws_update = time.time()
 
     def set_sse_connected(self, connected: bool) -> None:
         """Update SSE connection status.
@@ -645,10 +929,10 @@ class StateManager:
         Args:
             connected: True if connected, False otherwise
         """
-        with self._lock:
-            self.connection_status.sse_connected = connected
-            if connected:
-                self.connection_status.last_sse_update = datetime.now(IST)
+        with self._conn_lock:
+            self.connection_status = replace(self.connection_status, sse_connected=connected)
+        if connected:
+            self._last_sse_update = time.time()
 
     def set_market_state(self, state: str) -> None:
         """Update market state.
@@ -656,10 +940,14 @@ class StateManager:
         Args:
             state: Market state (OPEN, CLOSED, UNKNOWN)
         """
-        with self._lock:
+        with self._market_lock:
             self.market_state = state
 
-    # Read methods (also thread-safe for consistency)
+    # Read methods. Single-reference reads (LTP, indicators, option chains,
+    # candles, substates and the predicates over them) take no lock: writers
+    # replace those objects whole, and one dict lookup or attribute load is
+    # atomic under the GIL. (Option chain strike LTPs are patched in place,
+    # which a lock around the lookup never guarded anyway.)
 
     def get_ltp(self, symbol: str) -> Optional[SymbolTick]:
         """Get current LTP data for a symbol.
@@ -670,18 +958,19 @@ class StateManager:
         Returns:
             SymbolTick if available, None otherwise
         """
-        symbol = symbol.lower()
-        with self._lock:
-            return self.symbols_ltp.get(symbol)
+        symbol = _canon(symbol)
+        return self.symbols_ltp.get(symbol)
 
-    def get_all_ltps(self) -> Dict[str, SymbolTick]:
+    def get_all_ltps(self) -> Mapping[str, SymbolTick]:
         """Get all current LTP data.
 
+        symbols_ltp is copy-on-write, so the view is a consistent snapshot
+        that later ticks do not change.
+
         Returns:
-            Copy of symbols_ltp dict
+            Read-only view of the current symbols_ltp dict
         """
-        with self._lock:
-            return dict(self.symbols_ltp)
+        return MappingProxyType(self.symbols_ltp)
 
     def get_indicators(self, symbol: str, mode: str) -> Optional[IndicatorData]:
         """Get indicator data for a symbol/mode combination.
@@ -693,12 +982,9 @@ class StateManager:
         Returns:
             IndicatorData if available, None otherwise
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
-        with self._lock:
-            if symbol in self.indicators and mode in self.indicators[symbol]:
-                return self.indicators[symbol][mode]
-            return None
+        symbol = _canon(symbol)
+        mode = _canon(mode)
+        return self.indicators.get((symbol, mode))
 
     def get_option_chain(self, symbol: str, mode: str) -> Optional[OptionChainData]:
         """Get option chain data for a symbol/mode combination.
@@ -710,12 +996,9 @@ class StateManager:
         Returns:
             OptionChainData if available, None otherwise
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
-        with self._lock:
-            if symbol in self.option_chains and mode in self.option_chains[symbol]:
-                return self.option_chains[symbol][mode]
-            return None
+        symbol = _canon(symbol)
+        mode = _canon(mode)
+        return self.option_chains.get((symbol, mode))
 
     def get_candles(self, symbol: str) -> List[Candle]:
         """Get candle data for a symbol.
@@ -724,11 +1007,34 @@ class StateManager:
             symbol: Trading symbol (lowercase)
 
         Returns:
-            List of Candle objects (copy)
+            List of Candle objects. Shared copy-on-write snapshot; do not mutate.
         """
-        symbol = symbol.lower()
-        with self._lock:
-            return list(self.candles.get(symbol, []))
+        symbol = _canon(symbol)
+        return self.candles.get(symbol, [])
+
+    def _read_history(self, symbol: str, series: Dict[Any, List[Tuple]], key: Any) -> List[Tuple]:
+        """Copy one history series, taking the shard lock only on contention.
+
+        Seqlock read: copy while the shard's counter is even and unchanged,
+        otherwise a writer overlapped and the copy is redone under the lock.
+
+        Args:
+            symbol: Trading symbol (lowercase) selecting the shard
+            series: History store to read from
+            key: Key of the series within the store
+
+        Returns:
+            Copy of the series, sorted by timestamp (kept sorted on write)
+        """
+        shard = hash(symbol) & (SYMBOL_LOCK_SHARDS - 1)
+        seq = self._history_seq
+        before = seq[shard]
+        if not before & 1:
+            entries = list(series.get(key, ()))
+            if seq[shard] == before:
+                return entries
+        with self._symbol_locks[shard]:
+            return list(series.get(key, ()))
 
     def get_ema_history(self, symbol: str) -> List[Tuple[datetime, float, float]]:
         """Get EMA history for a symbol.
@@ -739,12 +1045,8 @@ class StateManager:
         Returns:
             List of (timestamp, ema_5, ema_21) tuples (copy), sorted by timestamp
         """
-        symbol = symbol.lower()
-        with self._lock:
-            if symbol in self.ema_history:
-                # Return sorted copy to ensure proper chart rendering
-                return sorted(self.ema_history[symbol], key=lambda x: x[0])
-            return []
+        symbol = _canon(symbol)
+        return self._read_history(symbol, self.ema_history, symbol)
 
     def get_skew_pcr_history(self, symbol: str, mode: str) -> List[Tuple[datetime, float, float]]:
         """Get Skew/PCR history for a symbol/mode combination.
@@ -758,13 +1060,9 @@ class StateManager:
         Returns:
             List of (timestamp, skew, pcr) tuples (copy), sorted by timestamp
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
-        with self._lock:
-            if symbol in self.skew_pcr_history and mode in self.skew_pcr_history[symbol]:
-                # Return sorted copy to ensure proper chart rendering
-                return sorted(self.skew_pcr_history[symbol][mode], key=lambda x: x[0])
-            return []
+        symbol = _canon(symbol)
+        mode = _canon(mode)
+        return self._read_history(symbol, self.skew_pcr_history, (symbol, mode))
 
     def get_adr_history(self, symbol: str) -> List[Tuple[datetime, float]]:
         """Get ADR history for a symbol.
@@ -777,11 +1075,8 @@ class StateManager:
         Returns:
             List of (timestamp, adr) tuples (copy), sorted by timestamp
         """
-        symbol = symbol.lower()
-        with self._lock:
-            if symbol in self.adr_history:
-                return sorted(self.adr_history[symbol], key=lambda x: x[0])
-            return []
+        symbol = _canon(symbol)
+        return self._read_history(symbol, self.adr_history, symbol)
 
     def get_rsi_history(self, symbol: str) -> List[Tuple[datetime, float]]:
         """Get RSI history for a symbol.
@@ -794,11 +1089,8 @@ class StateManager:
         Returns:
             List of (timestamp, rsi) tuples (copy), sorted by timestamp
         """
-        symbol = symbol.lower()
-        with self._lock:
-            if symbol in self.rsi_history:
-                return sorted(self.rsi_history[symbol], key=lambda x: x[0])
-            return []
+        symbol = _canon(symbol)
+        return self._read_history(symbol, self.rsi_history, symbol)
 
     def clear_indicator_history(self, symbol: Optional[str] = None, mode: Optional[str] = None) -> None:
         """Clear indicator history before re-populating from bootstrap.
@@ -809,51 +1101,46 @@ class StateManager:
             symbol: If provided, clear only this symbol's history. If None, clear all.
             mode: If provided with symbol, clear only this mode's skew/pcr history.
         """
-        with self._lock:
-            if symbol is None:
-                # Clear all history
-                for sym in VALID_SYMBOLS:
-                    self.ema_history[sym] = []
-                    self.adr_history[sym] = []
-                    self.rsi_history[sym] = []
-                    for m in VALID_MODES:
-                        if sym in self.skew_pcr_history and m in self.skew_pcr_history[sym]:
-                            self.skew_pcr_history[sym][m] = []
-            else:
-                symbol = symbol.lower()
-                # Clear specific symbol's EMA, ADR, RSI history
-                if symbol in self.ema_history:
-                    self.ema_history[symbol] = []
-                if symbol in self.adr_history:
-                    self.adr_history[symbol] = []
-                if symbol in self.rsi_history:
-                    self.rsi_history[symbol] = []
-                
-                # Clear specific symbol/mode's skew/pcr history
-                if mode is not None:
-                    mode = mode.lower()
-                    if symbol in self.skew_pcr_history and mode in self.skew_pcr_history[symbol]:
-                        self.skew_pcr_history[symbol][mode] = []
-                else:
-                    # Clear all modes for this symbol
-                    if symbol in self.skew_pcr_history:
-                        for m in VALID_MODES:
-                            if m in self.skew_pcr_history[symbol]:
-                                self.skew_pcr_history[symbol][m] = []
+        if symbol is not None:
+            symbol = _canon(symbol)
+        symbols = VALID_SYMBOLS if symbol is None else (symbol,)
+        # mode only narrows the skew/pcr clear when a symbol is given
+        modes = VALID_MODES if symbol is None or mode is None else (_canon(mode),)
+
+        with self._hold_symbol_locks(None if symbol is None else symbols):
+            # Empty the series in place (getters hand out copies), so no new
+            # lists or index dicts are allocated for the next bootstrap
+            for sym in symbols:
+                for series in (
+                    self.ema_history,
+                    self.adr_history,
+                    self.rsi_history,
+                    self._ema_hist_idx,
+                    self._adr_hist_idx,
+                    self._rsi_hist_idx,
+                ):
+                    entries = series.get(sym)
+                    if entries is not None:
+                        entries.clear()
+
+                for m in modes:
+                    for series in (self.skew_pcr_history, self._skew_pcr_hist_idx):
+                        entries = series.get((sym, m))
+                        if entries is not None:
+                            entries.clear()
 
     def get_connection_status(self) -> ConnectionStatus:
         """Get current connection status.
 
         Returns:
-            Copy of ConnectionStatus
+            ConnectionStatus snapshot with the latest update times
         """
-        with self._lock:
-            return ConnectionStatus(
-                ws_connected=self.connection_status.ws_connected,
-                sse_connected=self.connection_status.sse_connected,
-                last_ws_update=self.connection_status.last_ws_update,
-                last_sse_update=self.connection_status.last_sse_update,
-            )
+        status = self.connection_status
+        return replace(
+            status,
+            last_ws_update=to_ist(self._last_ws_update),
+            last_sse_update=to_ist(self._last_sse_update),
+        )
 
     def get_market_state(self) -> str:
         """Get current market state.
@@ -861,8 +1148,7 @@ class StateManager:
         Returns:
             Market state string (OPEN, CLOSED, UNKNOWN)
         """
-        with self._lock:
-            return self.market_state
+        return self.market_state
 
     # User session methods (Requirement 15.2, 3.7, 3.9)
 
@@ -887,37 +1173,28 @@ class StateManager:
             jwt_token: JWT authentication token
             jwt_expiry: JWT token expiry datetime (auto-parsed from token if not provided)
         """
-        with self._lock:
-            self.user_session.email = email
-            self.user_session.role = role
-            self.user_session.name = name
-            self.user_session.jwt_token = jwt_token
-            
-            # Auto-parse JWT expiry if not provided (Requirement 3.9)
-            if jwt_expiry is not None:
-                self.user_session.jwt_expiry = jwt_expiry
-            elif jwt_token is not None:
-                self.user_session.jwt_expiry = parse_jwt_expiry(jwt_token)
-            else:
-                self.user_session.jwt_expiry = None
-            
-            self.user_session.is_authenticated = email is not None and jwt_token is not None
+        # Auto-parse JWT expiry if not provided (Requirement 3.9)
+        if jwt_expiry is None and jwt_token is not None:
+            jwt_expiry = parse_jwt_expiry(jwt_token)
+
+        with self._user_lock:
+            self.user_session = UserSession(
+                email=email,
+                role=role,
+                name=name,
+                is_authenticated=email is not None and jwt_token is not None,
+                jwt_token=jwt_token,
+                jwt_expiry=jwt_expiry,
+                jwt_expiry_ts=jwt_expiry.timestamp() if jwt_expiry is not None else None,
+            )
 
     def get_user_session(self) -> UserSession:
         """Get current user session information.
         
         Returns:
-            Copy of UserSession
+            UserSession snapshot (immutable; replaced on every change)
         """
-        with self._lock:
-            return UserSession(
-                email=self.user_session.email,
-                role=self.user_session.role,
-                name=self.user_session.name,
-                is_authenticated=self.user_session.is_authenticated,
-                jwt_token=self.user_session.jwt_token,
-                jwt_expiry=self.user_session.jwt_expiry,
-            )
+        return self.user_session
 
     def is_admin(self) -> bool:
         """Check if current user has admin role.
@@ -927,11 +1204,8 @@ class StateManager:
         Returns:
             True if user has admin role, False otherwise
         """
-        with self._lock:
-            return (
-                self.user_session.is_authenticated 
-                and self.user_session.role == "admin"
-            )
+        session = self.user_session
+        return session.is_authenticated and session.role == "admin"
 
     def jwt_needs_refresh(self) -> bool:
         """Check if JWT token needs to be refreshed.
@@ -942,10 +1216,11 @@ class StateManager:
         Returns:
             True if refresh is needed (< 1 hour remaining), False otherwise
         """
-        with self._lock:
-            if not self.user_session.is_authenticated:
-                return False
-            return jwt_needs_refresh(self.user_session.jwt_expiry)
+        session = self.user_session
+        if not session.is_authenticated or session.jwt_expiry_ts is None:
+            return False
+        # Same rule as jwt_needs_refresh(), on the precomputed epoch expiry
+        return session.jwt_expiry_ts - time.time() < JWT_REFRESH_THRESHOLD_SECONDS
 
     def update_jwt_token(self, new_token: str) -> None:
         """Update JWT token after refresh.
@@ -955,12 +1230,17 @@ class StateManager:
         Args:
             new_token: New JWT token from refresh response
         """
-        with self._lock:
+        jwt_expiry = parse_jwt_expiry(new_token)
+        with self._user_lock:
             if not self.user_session.is_authenticated:
                 return
-            
-            self.user_session.jwt_token = new_token
-            self.user_session.jwt_expiry = parse_jwt_expiry(new_token)
+
+            self.user_session = replace(
+                self.user_session,
+                jwt_token=new_token,
+                jwt_expiry=jwt_expiry,
+                jwt_expiry_ts=jwt_expiry.timestamp() if jwt_expiry is not None else None,
+            )
 
     def get_jwt_expiry_info(self) -> Tuple[Optional[datetime], Optional[int]]:
         """Get JWT expiry information.
@@ -968,21 +1248,19 @@ class StateManager:
         Returns:
             Tuple of (expiry datetime, seconds remaining) or (None, None) if not authenticated
         """
-        with self._lock:
-            if not self.user_session.is_authenticated or not self.user_session.jwt_expiry:
-                return None, None
-            
-            expiry = self.user_session.jwt_expiry
-            now = datetime.now(IST)
-            seconds_remaining = int((expiry - now).total_seconds())
-            
-            return expiry, seconds_remaining
+        session = self.user_session
+        if not session.is_authenticated or not session.jwt_expiry:
+            return None, None
+
+        seconds_remaining = int(session.jwt_expiry_ts - time.time())
+
+        return session.jwt_expiry, seconds_remaining
 
     def clear_user_session(self) -> None:
         """Clear user session information (logout).
         """
-        with self._lock:
-            self.user_session = UserSession()
+        with self._user_lock:
+            self.user_session = _EMPTY_USER_SESSION
 
     # OTP session methods (Requirement 15.8)
 
@@ -999,26 +1277,21 @@ class StateManager:
             verified: Whether OTP has been verified
             expiry: OTP session expiry datetime
         """
-        with self._lock:
-            self.otp_session.otp_verified = verified
-            self.otp_session.otp_expiry = expiry
-            if verified:
-                self.otp_session.verified_at = datetime.now(IST)
-            else:
-                self.otp_session.verified_at = None
+        verified_at = datetime.now(IST) if verified else None
+        with self._otp_lock:
+            self.otp_session = OTPSession(
+                otp_verified=verified,
+                otp_expiry=expiry,
+                verified_at=verified_at,
+            )
 
     def get_otp_session(self) -> OTPSession:
         """Get current OTP session information.
         
         Returns:
-            Copy of OTPSession
+            OTPSession snapshot (immutable; replaced on every change)
         """
-        with self._lock:
-            return OTPSession(
-                otp_verified=self.otp_session.otp_verified,
-                otp_expiry=self.otp_session.otp_expiry,
-                verified_at=self.otp_session.verified_at,
-            )
+        return self.otp_session
 
     def is_otp_session_valid(self) -> bool:
         """Check if OTP session is valid (verified and not expired).
@@ -1029,25 +1302,24 @@ class StateManager:
         Returns:
             True if OTP session is valid, False otherwise
         """
-        with self._lock:
-            if not self.otp_session.otp_verified:
-                return False
-            
-            if self.otp_session.otp_expiry is None:
-                # No expiry set - session is valid
-                return True
-            
-            # Check if session has expired
-            now = datetime.now(IST)
-            return now < self.otp_session.otp_expiry
+        session = self.otp_session
+        if not session.otp_verified:
+            return False
+
+        if session.otp_expiry is None:
+            # No expiry set - session is valid
+            return True
+
+        # Check if session has expired
+        return time.time() < session.otp_expiry.timestamp()
 
     def clear_otp_session(self) -> None:
         """Clear OTP session information.
         
         Used when OTP session expires or user logs out.
         """
-        with self._lock:
-            self.otp_session = OTPSession()
+        with self._otp_lock:
+            self.otp_session = _EMPTY_OTP_SESSION
 
     # Error state methods (Requirements 17.1, 5.6)
 
@@ -1068,38 +1340,33 @@ class StateManager:
             error_type: Type of error ('bootstrap', 'api', 'websocket', 'sse', 'general')
             can_retry: Whether the operation can be retried
         """
-        with self._lock:
-            self.error_state.has_error = True
-            self.error_state.error_message = message
-            self.error_state.error_type = error_type
-            self.error_state.error_timestamp = datetime.now(IST)
-            self.error_state.can_retry = can_retry
-            self.error_state.retry_count += 1
+        error_timestamp = datetime.now(IST)
+        with self._error_lock:
+            self.error_state = replace(
+                self.error_state,
+                has_error=True,
+                error_message=message,
+                error_type=error_type,
+                error_timestamp=error_timestamp,
+                can_retry=can_retry,
+                retry_count=self.error_state.retry_count + 1,
+            )
 
     def clear_error(self) -> None:
         """Clear the current error state.
         
         Called when an operation succeeds or user dismisses the error.
         """
-        with self._lock:
-            self.error_state = ErrorState()
+        with self._error_lock:
+            self.error_state = _EMPTY_ERROR_STATE
 
     def get_error_state(self) -> ErrorState:
         """Get the current error state.
         
         Returns:
-            Copy of ErrorState
+            ErrorState snapshot (immutable; replaced on every change)
         """
-        with self._lock:
-            return ErrorState(
-                has_error=self.error_state.has_error,
-                error_message=self.error_state.error_message,
-                error_type=self.error_state.error_type,
-                error_timestamp=self.error_state.error_timestamp,
-                can_retry=self.error_state.can_retry,
-                retry_count=self.error_state.retry_count,
-                max_retries=self.error_state.max_retries,
-            )
+        return self.error_state
 
     def has_error(self) -> bool:
         """Check if there is an active error.
@@ -1107,8 +1374,7 @@ class StateManager:
         Returns:
             True if there is an error, False otherwise
         """
-        with self._lock:
-            return self.error_state.has_error
+        return self.error_state.has_error
 
     def can_retry_operation(self) -> bool:
         """Check if the failed operation can be retried.
@@ -1118,11 +1384,8 @@ class StateManager:
         Returns:
             True if retry is allowed, False otherwise
         """
-        with self._lock:
-            return (
-                self.error_state.can_retry 
-                and self.error_state.retry_count < self.error_state.max_retries
-            )
+        error_state = self.error_state
+        return error_state.can_retry and error_state.retry_count < error_state.max_retries
 
     def increment_retry_count(self) -> int:
         """Increment the retry count and return the new value.
@@ -1130,9 +1393,10 @@ class StateManager:
         Returns:
             New retry count
         """
-        with self._lock:
-            self.error_state.retry_count += 1
-            return self.error_state.retry_count
+        with self._error_lock:
+            retry_count = self.error_state.retry_count + 1
+            self.error_state = replace(self.error_state, retry_count=retry_count)
+            return retry_count
 
     # Staleness state methods (Requirements 5.7, 17.6)
 
@@ -1145,8 +1409,8 @@ class StateManager:
         Args:
             stale: Whether the cache is stale
         """
-        with self._lock:
-            self.staleness_state.cache_stale = stale
+        with self._staleness_lock:
+            self.staleness_state = replace(self.staleness_state, cache_stale=stale)
 
     def update_last_data_timestamp(self, ts: Optional[datetime] = None) -> None:
         """Update the last data update timestamp.
@@ -1156,10 +1420,17 @@ class StateManager:
         Args:
             ts: Timestamp of the data update (defaults to now in IST)
         """
-        with self._lock:
-            if ts is None:
-                ts = datetime.now(IST)
-            self.staleness_state.last_data_update = ts
+        # Lock-free single attribute store, see __init__
+        self._last_data_update = time.time() if ts is None else ts.timestamp()
+
+    def _data_age(self) -> Optional[float]:
+        """Get seconds since the last data update, shared by the staleness checks.
+
+        Returns:
+            Age in seconds, or None if no data has been received
+        """
+        last_data_update = self._last_data_update
+        return None if last_data_update is None else time.time() - last_data_update
 
     def is_data_stale(self) -> bool:
         """Check if data is stale (>5 minutes old).
@@ -1170,14 +1441,9 @@ class StateManager:
         Returns:
             True if data is stale, False otherwise
         """
-        with self._lock:
-            if self.staleness_state.last_data_update is None:
-                # No data yet - consider stale
-                return True
-            
-            now = datetime.now(IST)
-            age = (now - self.staleness_state.last_data_update).total_seconds()
-            return age > self.staleness_state.staleness_threshold_seconds
+        age = self._data_age()
+        # No data yet - consider stale
+        return age is None or age > self.staleness_state.staleness_threshold_seconds
 
     def is_cache_stale(self) -> bool:
         """Check if cache_stale flag is set from bootstrap.
@@ -1188,21 +1454,15 @@ class StateManager:
         Returns:
             True if cache is marked as stale, False otherwise
         """
-        with self._lock:
-            return self.staleness_state.cache_stale
+        return self.staleness_state.cache_stale
 
     def get_staleness_state(self) -> StalenessState:
         """Get the current staleness state.
         
         Returns:
-            Copy of StalenessState
+            StalenessState snapshot with the latest data update time
         """
-        with self._lock:
-            return StalenessState(
-                cache_stale=self.staleness_state.cache_stale,
-                last_data_update=self.staleness_state.last_data_update,
-                staleness_threshold_seconds=self.staleness_state.staleness_threshold_seconds,
-            )
+        return replace(self.staleness_state, last_data_update=to_ist(self._last_data_update))
 
     def get_data_age_seconds(self) -> Optional[int]:
         """Get the age of the last data update in seconds.
@@ -1210,12 +1470,8 @@ class StateManager:
         Returns:
             Age in seconds, or None if no data has been received
         """
-        with self._lock:
-            if self.staleness_state.last_data_update is None:
-                return None
-            
-            now = datetime.now(IST)
-            return int((now - self.staleness_state.last_data_update).total_seconds())
+        age = self._data_age()
+        return None if age is None else int(age)
 
     def should_show_staleness_warning(self) -> bool:
         """Check if a staleness warning should be displayed.
@@ -1227,40 +1483,47 @@ class StateManager:
         Returns:
             True if any staleness warning should be shown, False otherwise
         """
-        with self._lock:
-            # Check cache_stale flag from bootstrap (Requirement 5.7)
-            if self.staleness_state.cache_stale:
-                return True
-            
-            # Check data age (Requirement 17.6)
-            if self.staleness_state.last_data_update is None:
-                return False  # No data yet, don't show warning
-            
-            now = datetime.now(IST)
-            age = (now - self.staleness_state.last_data_update).total_seconds()
-            return age > self.staleness_state.staleness_threshold_seconds
+        staleness_state = self.staleness_state
+        # Check cache_stale flag from bootstrap (Requirement 5.7)
+        if staleness_state.cache_stale:
+            return True
+
+        # Check data age (Requirement 17.6); no data yet shows no warning
+        age = self._data_age()
+        return age is not None and age > staleness_state.staleness_threshold_seconds
 
     # Data Gap Detection methods (FIX-032)
 
-    def is_market_open(self) -> bool:
+    def is_market_open(self, now: Optional[datetime] = None) -> bool:
         """Check if Indian market is currently open.
         
         Market hours: 09:15 - 15:30 IST, Monday-Friday
         
+        Without ``now`` the result is cached for the current wall-clock
+        minute, since polling callbacks ask many times per minute.
+        
+        Args:
+            now: Current time in IST, if the caller already has it
+        
         Returns:
             True if market is open, False otherwise
         """
-        now = datetime.now(IST)
-        
-        # Check if it's a weekday (Monday=0, Sunday=6)
-        if now.weekday() >= 5:  # Saturday or Sunday
-            return False
-        
-        # Check market hours
-        current_minutes = now.hour * 60 + now.minute
-        return MARKET_START_MINUTES <= current_minutes <= MARKET_END_MINUTES
-
-    def detect_data_gaps(self, symbol: str, mode: str) -> Dict[str, Any]:
+        if now is not None:
+            return _market_open_at(now)
+
+        ts = time.time()
+        minute = int(ts // 60)
+        cached_minute, cached_open = self._market_open_cache
+        if cached_minute == minute:
+            return cached_open
+
+        is_open = _market_open_at(datetime.fromtimestamp(ts, IST))
+        self._market_open_cache = (minute, is_open)  # Atomic tuple rebind
+        return is_open
+
+    def detect_data_gaps(
+        self, symbol: str, mode: str, now: Optional[datetime] = None
+    ) -> GapResult:
         """Detect gaps in indicator data for a symbol/mode.
         
         FIX-032: Data Gap Detection
@@ -1270,68 +1533,65 @@ class StateManager:
         Args:
             symbol: Trading symbol (lowercase)
             mode: Expiry mode ('current' or 'positional')
+            now: Current time in IST; should_auto_bootstrap passes one
+                 clock read to all symbol/mode checks
         
         Returns:
-            Dict with gap detection results:
-            {
-                "has_gap": bool,
-                "gap_type": str | None,  # "indicators", "skew_pcr", "candles"
-                "last_data_time": datetime | None,
-                "gap_minutes": int | None,
-                "message": str | None,
-            }
+            GapResult describing the gap; the shared NO_GAP instance when
+            there is none
         """
-        symbol = symbol.lower()
-        mode = mode.lower()
-        
-        with self._lock:
-            result = {
-                "has_gap": False,
-                "gap_type": None,
-                "last_data_time": None,
-                "gap_minutes": None,
-                "message": None,
-            }
-            
-            # Only check during market hours
-            if not self.is_market_open():
-                return result
-            
+        symbol = _canon(symbol)
+        mode = _canon(mode)
+
+        if now is None:
             now = datetime.now(IST)
-            gap_threshold = self.data_gap_state.gap_threshold_seconds
-            
+
+        # Only check during market hours
+        if not self.is_market_open(now):
+            return NO_GAP
+
+        gap_threshold = self.data_gap_state.gap_threshold_seconds
+        # Ages are compared on epoch seconds rather than aware datetimes
+        now_ts = now.timestamp()
+
+        with self._lock_for(symbol):
             # Check indicator data
-            indicators = self.indicators.get(symbol, {}).get(mode)
-            if indicators and indicators.ts:
-                age_seconds = (now - indicators.ts).total_seconds()
-                if age_seconds > gap_threshold:
-                    result["has_gap"] = True
-                    result["gap_type"] = "indicators"
-                    result["last_data_time"] = indicators.ts
-                    result["gap_minutes"] = int(age_seconds / 60)
-                    result["message"] = f"Indicator data is {result['gap_minutes']} minutes old"
-                    return result
-            elif indicators is None or indicators.ts is None:
+            indicators = self.indicators.get((symbol, mode))
+            if indicators is None or indicators.ts is None:
                 # No indicator data at all
-                result["has_gap"] = True
-                result["gap_type"] = "indicators"
-                result["message"] = "No indicator data available"
-                return result
-            
+                return GapResult(
+                    has_gap=True,
+                    gap_type="indicators",
+                    message="No indicator data available",
+                )
+            age_seconds = now_ts - indicators.ts.timestamp()
+            if age_seconds > gap_threshold:
+                gap_minutes = int(age_seconds / 60)
+                return GapResult(
+                    has_gap=True,
+                    gap_type="indicators",
+                    last_data_time=indicators.ts,
+                    gap_minutes=gap_minutes,
+                    message=f"Indicator data is {gap_minutes} minutes old",
+                )
+
             # Check skew/pcr history
-            skew_pcr = self.skew_pcr_history.get(symbol, {}).get(mode, [])
+            skew_pcr = self.skew_pcr_history.get((symbol, mode))
             if skew_pcr:
-                last_entry = max(skew_pcr, key=lambda x: x[0])
-                age_seconds = (now - last_entry[0]).total_seconds()
+                # History is kept sorted on write, so the newest entry is last
+                last_ts = skew_pcr[-1][0]
+                age_seconds = now_ts - last_ts.timestamp()
                 if age_seconds > gap_threshold:
-                    result["has_gap"] = True
-                    result["gap_type"] = "skew_pcr"
-                    result["last_data_time"] = last_entry[0]
-                    result["gap_minutes"] = int(age_seconds / 60)
-                    result["message"] = f"Skew/PCR data is {result['gap_minutes']} minutes old"
-                    return result
-            
-            return result
+                    gap_minutes = int(age_seconds / 60)
+                    return GapResult(
+                        has_gap=True,
+                        gap_type="skew_pcr",
+                        last_data_time=last_ts,
+                        gap_minutes=gap_minutes,
+                        message=f"Skew/PCR data is {gap_minutes} minutes old",
+                    )
+
+        return NO_GAP
 
     def should_auto_bootstrap(self) -> bool:
         """Check if auto-bootstrap should be triggered.
@@ -1347,37 +1607,52 @@ class StateManager:
         Returns:
             True if auto-bootstrap should be triggered, False otherwise
         """
-        with self._lock:
-            # Must be authenticated
-            if not self.user_session.is_authenticated:
-                return False
-            
-            # Must be during market hours
-            if not self.is_market_open():
+        # One clock read shared by the cooldown, market-hours and gap checks
+        now = datetime.now(IST)
+
+        # Check cooldown period first: it rejects almost every polling call.
+        # All pre-checks read immutable snapshots, so no lock is taken.
+        gap_state = self.data_gap_state
+        if gap_state.last_bootstrap_attempt:
+            cooldown = gap_state.bootstrap_cooldown_seconds
+            elapsed = now.timestamp() - gap_state.last_bootstrap_attempt.timestamp()
+            if elapsed < cooldown:
                 return False
-            
-            # Check cooldown period
-            if self.data_gap_state.last_bootstrap_attempt:
-                cooldown = self.data_gap_state.bootstrap_cooldown_seconds
-                elapsed = (datetime.now(IST) - self.data_gap_state.last_bootstrap_attempt).total_seconds()
-                if elapsed < cooldown:
-                    return False
-            
-            # Check for data gaps in any symbol/mode
-            for symbol in VALID_SYMBOLS:
-                for mode in VALID_MODES:
-                    gap_result = self.detect_data_gaps(symbol, mode)
-                    if gap_result["has_gap"]:
-                        # Update gap state
-                        self.data_gap_state.has_gap = True
-                        self.data_gap_state.gap_type = gap_result["gap_type"]
-                        self.data_gap_state.gap_message = gap_result["message"]
-                        return True
-            
+
+        # Must be authenticated
+        if not self.user_session.is_authenticated:
+            return False
+
+        # Must be during market hours
+        if not self.is_market_open(now):
+            return False
+
+        # Check for data gaps in any symbol/mode (first gap wins)
+        gap_results = (
+            self.detect_data_gaps(symbol, mode, now=now)
+            for symbol, mode in _SYMBOL_MODE_PAIRS
+        )
+        gap_result = next((gap for gap in gap_results if gap.has_gap), None)
+
+        # Nothing to record if no gap was found and none is recorded
+        if gap_result is None and not self.data_gap_state.has_gap:
+            return False
+
+        with self._gap_lock:
+            if gap_result is not None:
+                # Update gap state
+                self.data_gap_state = replace(
+                    self.data_gap_state,
+                    has_gap=True,
+                    gap_type=gap_result.gap_type,
+                    gap_message=gap_result.message,
+                )
+                return True
+
             # No gaps detected
-            self.data_gap_state.has_gap = False
-            self.data_gap_state.gap_type = None
-            self.data_gap_state.gap_message = None
+            self.data_gap_state = replace(
+                self.data_gap_state, has_gap=False, gap_type=None, gap_message=None
+            )
             return False
 
     def record_bootstrap_attempt(self) -> None:
@@ -1387,32 +1662,27 @@ class StateManager:
         
         Called after triggering a bootstrap to prevent spam.
         """
-        with self._lock:
-            self.data_gap_state.last_bootstrap_attempt = datetime.now(IST)
+        last_bootstrap_attempt = datetime.now(IST)
+        with self._gap_lock:
+            self.data_gap_state = replace(
+                self.data_gap_state, last_bootstrap_attempt=last_bootstrap_attempt
+            )
 
     def get_data_gap_state(self) -> DataGapState:
         """Get the current data gap state.
         
         Returns:
-            Copy of DataGapState
+            DataGapState snapshot (immutable; replaced on every change)
         """
-        with self._lock:
-            return DataGapState(
-                last_bootstrap_attempt=self.data_gap_state.last_bootstrap_attempt,
-                bootstrap_cooldown_seconds=self.data_gap_state.bootstrap_cooldown_seconds,
-                gap_threshold_seconds=self.data_gap_state.gap_threshold_seconds,
-                has_gap=self.data_gap_state.has_gap,
-                gap_type=self.data_gap_state.gap_type,
-                gap_message=self.data_gap_state.gap_message,
-            )
+        return self.data_gap_state
 
     def clear_data_gap(self) -> None:
         """Clear the data gap state after successful bootstrap.
         """
-        with self._lock:
-            self.data_gap_state.has_gap = False
-            self.data_gap_state.gap_type = None
-            self.data_gap_state.gap_message = None
+        with self._gap_lock:
+            self.data_gap_state = replace(
+                self.data_gap_state, has_gap=False, gap_type=None, gap_message=None
+            )
 
     # Market Info methods (FIX-043)
 
@@ -1433,33 +1703,29 @@ class StateManager:
             holiday_name: Holiday name if today is a holiday
             previous_trading_day: Previous trading day in YYYY-MM-DD format
         """
-        with self._lock:
+        changes: Dict[str, Any] = {"last_updated": datetime.now(IST)}
+        if market_state is not None:
+            changes["market_state"] = market_state
+        if is_trading_day is not None:
+            changes["is_trading_day"] = is_trading_day
+        if holiday_name is not None:
+            changes["holiday_name"] = holiday_name
+        if previous_trading_day is not None:
+            changes["previous_trading_day"] = previous_trading_day
+
+        with self._market_lock:
+            self.market_info_state = replace(self.market_info_state, **changes)
             if market_state is not None:
-                self.market_info_state.market_state = market_state
                 # Also update the legacy market_state field
                 self.market_state = market_state
-            if is_trading_day is not None:
-                self.market_info_state.is_trading_day = is_trading_day
-            if holiday_name is not None:
-                self.market_info_state.holiday_name = holiday_name
-            if previous_trading_day is not None:
-                self.market_info_state.previous_trading_day = previous_trading_day
-            self.market_info_state.last_updated = datetime.now(IST)
 
     def get_market_info(self) -> MarketInfoState:
         """Get current market info state.
         
         Returns:
-            Copy of MarketInfoState
+            MarketInfoState snapshot (immutable; replaced on every change)
         """
-        with self._lock:
-            return MarketInfoState(
-                market_state=self.market_info_state.market_state,
-                is_trading_day=self.market_info_state.is_trading_day,
-                holiday_name=self.market_info_state.holiday_name,
-                previous_trading_day=self.market_info_state.previous_trading_day,
-                last_updated=self.market_info_state.last_updated,
-            )
+        return self.market_info_state
 
     def is_holiday(self) -> bool:
         """Check if today is a holiday.
@@ -1467,8 +1733,7 @@ class StateManager:
         Returns:
             True if today is a holiday, False otherwise
         """
-        with self._lock:
-            return self.market_info_state.holiday_name is not None
+        return self.market_info_state.holiday_name is not None
 
     def get_holiday_name(self) -> Optional[str]:
         """Get the holiday name if today is a holiday.
@@ -1476,29 +1741,50 @@ class StateManager:
         Returns:
             Holiday name or None
         """
-        with self._lock:
-            return self.market_info_state.holiday_name
+        return self.market_info_state.holiday_name
 
     def clear(self) -> None:
         """Clear all state data.
 
         Useful for testing or resetting the dashboard.
         """
-        with self._lock:
-            self.symbols_ltp.clear()
-            self.indicators.clear()
-            self.option_chains.clear()
-            self.candles.clear()
-            self.ema_history.clear()
-            self.skew_pcr_history.clear()
-            self.adr_history.clear()
-            self.rsi_history.clear()
-            self.connection_status = ConnectionStatus()
+        with ExitStack() as stack:
+            for lock in (
+                self._conn_lock,
+                self._market_lock,
+                self._user_lock,
+                self._otp_lock,
+                self._error_lock,
+                self._staleness_lock,
+                self._gap_lock,
+            ):
+                stack.enter_context(lock)
+            stack.enter_context(self._hold_symbol_locks())
+            stack.enter_context(self._ltp_write_lock)
+
+            # Fresh containers rather than clear(): O(1), and readers still
+            # holding the old ones keep a consistent view
+            self.symbols_ltp = {}
+            self.indicators = {}
+            self.option_chains = {}
+            self.candles = {}
+            self.ema_history = {}
+            self.skew_pcr_history = {}
+            self.adr_history = {}
+            self.rsi_history = {}
+            self._ema_hist_idx = {}
+            self._skew_pcr_hist_idx = {}
+            self._adr_hist_idx = {}
+            self._rsi_hist_idx = {}
+            self.connection_status = _EMPTY_CONNECTION_STATUS
+            self._last_ws_update = None
+            self._last_sse_update = None
+            self._last_data_update = None
             self.market_state = "UNKNOWN"
-            self.user_session = UserSession()
-            self.otp_session = OTPSession()
-            self.error_state = ErrorState()
-            self.staleness_state = StalenessState()
-            self.data_gap_state = DataGapState()
-            self.market_info_state = MarketInfoState()
+            self.user_session = _EMPTY_USER_SESSION
+            self.otp_session = _EMPTY_OTP_SESSION
+            self.error_state = _EMPTY_ERROR_STATE
+            self.staleness_state = _EMPTY_STALENESS_STATE
+            self.data_gap_state = _EMPTY_DATA_GAP_STATE
+            self.market_info_state = _EMPTY_MARKET_INFO_STATE
             self._initialize_symbols()
@@ -9,13 +9,16 @@ Implements ping/pong protocol and reconnection with exponential backoff.
 Requirements: 11.1, 11.2, 11.3, 11.4, 11.5, 11.6, 11.7, 11.8, 11.9, 17.7
 """
 
-import json
+import logging
+import queue
 import threading
 import time
 from datetime import datetime, timedelta
+from itertools import chain, repeat, zip_longest
 from typing import Callable, Dict, List, Optional, Tuple
 import pytz
 
+import orjson
 import structlog
 import websocket
 
@@ -25,8 +28,59 @@ from .models import VALID_SYMBOLS
 
 # Requirement 17.7: Log all errors to console for debugging
 logger = structlog.get_logger(__name__)
+# The stdlib logger filter_by_level consults; checked before per-frame debug
+# logs so a disabled level skips building the event dict entirely.
+_level_logger = logging.getLogger(__name__)
 IST = pytz.timezone("Asia/Kolkata")
 
+# (call_ltp, put_ltp) padding for strikes beyond both LTP columns
+_NO_LTPS: Tuple[None, None] = (None, None)
+
+# Bound once: _parse_timestamp runs per tick and per symbol
+_FROMISO = datetime.fromisoformat
+_IST_LOCALIZE = IST.localize
+
+# Requirement 11.5: constant pong payload, encoded once instead of per ping
+_PONG_MESSAGE: str = '{"action":"pong"}'
+
+# Frames longer than this are never treated as pings by _frame_has_event
+_PING_SNIFF_MAX_LEN = 64
+
+
+def _event_markers(event: str) -> Tuple[Tuple[str, str], Tuple[bytes, bytes]]:
+    """Build the '"event":"<name>"' substrings that identify a frame's event.
+
+    Args:
+        event: Event name
+
+    Returns:
+        (str markers, bytes markers), each with and without a space after the colon
+    """
+    compact = f'"event":"{event}"'
+    spaced = f'"event": "{event}"'
+    return (compact, spaced), (compact.encode(), spaced.encode())
+
+
+_PING_MARKERS = _event_markers("ping")
+_SNAPSHOT_MARKERS = _event_markers("snapshot")
+
+
+def _frame_has_event(message: str | bytes, markers: Tuple[Tuple[str, str], Tuple[bytes, bytes]]) -> bool:
+    """Cheap check of a raw frame's event without parsing it as JSON.
+
+    Args:
+        message: Raw frame (str or bytes)
+        markers: Result of _event_markers for the event to look for
+
+    Returns:
+        True if the frame contains one of the markers
+    """
+    str_markers, bytes_markers = markers
+    for marker in (str_markers if isinstance(message, str) else bytes_markers):
+        if marker in message:
+            return True
+    return False
+
 
 class FastStreamClient:
     """WebSocket client for /v1/stream/fast.
@@ -45,6 +99,12 @@ class FastStreamClient:
         11.8: Implement reconnection with exponential backoff (1s, 2s, 4s, 8s, max 30s)
         11.9: Proactively reconnect every 55 minutes before Cloud Run timeout
 
+    Frames are read with UTF-8 validation skipped: every frame goes
+    straight to orjson, which rejects invalid UTF-8 itself, so the
+    library's pure-Python validator would only check each payload twice.
+    websocket-client never offers permessage-deflate, so frames also
+    arrive uncompressed and no inflate runs on the receive thread.
+
     Attributes:
         state: StateManager instance for updating shared state
         jwt_token: JWT token for authentication
@@ -52,15 +112,45 @@ class FastStreamClient:
         ws: WebSocketApp instance
         running: Flag to control the client lifecycle
         reconnect_delay: Current reconnection delay in seconds
-        last_connect_time: Timestamp of last successful connection
+        last_connect_monotonic: time.monotonic() of last successful connection (0.0 = none yet)
+        last_connect_time: Wall-clock time of last successful connection (derived)
         on_jwt_refresh_needed: Callback for JWT refresh
         on_slow_client_warning: Callback for slow client warning
     """
 
+    # Fixed attribute layout: handlers read several of these per frame
+    __slots__ = (
+        "state",
+        "jwt_token",
+        "symbols",
+        "on_jwt_refresh_needed",
+        "on_slow_client_warning",
+        "_stream_url",
+        "_symbols_param",
+        "_valid_symbols",
+        "ws",
+        "running",
+        "reconnect_delay",
+        "last_connect_monotonic",
+        "_thread",
+        "_frames",
+        "_dispatch_thread",
+        "_dropped_frames",
+        "_reconnect_timer",
+        "_monitor_thread",
+        "_monitor_wake",
+        "_monitor_gen",
+        "_monitor_armed",
+        "_lock",
+        "_stop_event",
+        "_handlers",
+    )
+
     # Constants
     MAX_RECONNECT_DELAY = 30.0  # Maximum backoff delay in seconds
     PROACTIVE_RECONNECT_MINUTES = 55  # Reconnect before Cloud Run timeout
     PING_TIMEOUT = 60  # Seconds to respond to ping
+    MAX_PENDING_FRAMES = 1000  # Dispatch backlog above which non-snapshot frames are dropped
 
     def __init__(
         self,
@@ -85,14 +175,52 @@ class FastStreamClient:
         self.on_jwt_refresh_needed = on_jwt_refresh_needed
         self.on_slow_client_warning = on_slow_client_warning
 
+        # Fixed URL parts; only the token changes between reconnects
+        self._stream_url = f"{get_settings().ws_url}/v1/stream/fast"
+        self._symbols_param = ",".join(self.symbols)
+        # Frames may only update subscribed symbols; anything else is skipped
+        self._valid_symbols = frozenset(s.lower() for s in self.symbols)
+
         self.ws: Optional[websocket.WebSocketApp] = None
         self.running = False
         self.reconnect_delay = 1.0
-        self.last_connect_time: Optional[datetime] = None
+        # time.monotonic() of the last connection open (0.0 = none yet); see last_connect_time
+        self.last_connect_monotonic: float = 0.0
         self._thread: Optional[threading.Thread] = None
+        # Raw frames handed from the socket thread to the dispatcher thread
+        self._frames: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Frames dropped during the current backlog (0 = not shedding)
+        self._dropped_frames = 0
         self._reconnect_timer: Optional[threading.Timer] = None
-        self._proactive_reconnect_timer: Optional[threading.Timer] = None
+        # Connection monitor: one long-lived thread owns the proactive reconnect deadline
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._monitor_wake = threading.Event()
+        self._monitor_gen = 0
+        self._monitor_armed = False
         self._lock = threading.Lock()
+        # Set by disconnect() to cut a pending backoff wait short
+        self._stop_event = threading.Event()
+
+        # Event -> handler table for _on_message; ping is routed separately
+        # because its handler needs the socket to reply on.
+        self._handlers: Dict[str, Callable[[dict], None]] = {
+            "tick": self._handle_tick,
+            "option_chain_ltp": self._handle_option_chain_ltp,
+            "snapshot": self._handle_snapshot,
+        }
+
+    @property
+    def last_connect_time(self) -> Optional[datetime]:
+        """Wall-clock time (IST) of the last connection open, or None if none yet.
+
+        Connection opens only record a monotonic timestamp; the datetime is
+        derived here on demand.
+        """
+        if not self.last_connect_monotonic:
+            return None
+        elapsed = time.monotonic() - self.last_connect_monotonic
+        return datetime.now(IST) - timedelta(seconds=elapsed)
 
     def _build_url(self) -> str:
         """Build WebSocket URL with token and symbols.
@@ -103,10 +231,7 @@ class FastStreamClient:
         Returns:
             WebSocket URL with query parameters
         """
-        settings = get_settings()
-        base_url = settings.ws_url
-        symbols_param = ",".join(self.symbols)
-        return f"{base_url}/v1/stream/fast?token={self.jwt_token}&symbols={symbols_param}"
+        return f"{self._stream_url}?token={self.jwt_token}&symbols={self._symbols_param}"
 
     def connect(self) -> None:
         """Connect to the WebSocket stream.
@@ -118,6 +243,14 @@ class FastStreamClient:
             return
 
         self.running = True
+        self._stop_event.clear()
+        self._frames = queue.SimpleQueue()
+        self._dropped_frames = 0
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, args=(self._frames,), daemon=True
+        )
+        self._dispatch_thread.start()
+        self._start_monitor()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
@@ -130,14 +263,15 @@ class FastStreamClient:
 
                 self.ws = websocket.WebSocketApp(
                     url,
-                    on_message=self._on_message,
+                    on_message=self._enqueue_frame,
                     on_error=self._on_error,
                     on_close=self._on_close,
                     on_open=self._on_open,
                 )
 
-                # Run with ping disabled (we handle ping/pong manually)
-                self.ws.run_forever(ping_interval=0)
+                # Run with ping disabled (we handle ping/pong manually);
+                # orjson validates UTF-8 when parsing, see class docstring
+                self.ws.run_forever(ping_interval=0, skip_utf8_validation=True)
 
             except Exception as e:
                 # Requirement 17.7: Log all errors to console for debugging
@@ -147,6 +281,55 @@ class FastStreamClient:
             if self.running:
                 self._schedule_reconnect()
 
+    def _enqueue_frame(self, ws: websocket.WebSocketApp, message: str | bytes) -> None:
+        """Hand a raw frame to the dispatcher thread.
+
+        Keeps the socket thread free to read the next frame while the
+        previous one is parsed and applied to state.
+
+        Pings are answered here rather than queued, so a backlog cannot
+        hold the pong past PING_TIMEOUT (Requirement 11.5). Once
+        MAX_PENDING_FRAMES are waiting, every frame but a snapshot is
+        dropped, so the server's backpressure is not moved into
+        unbounded client memory (Requirement 11.7). Ticks and
+        option_chain_ltp frames carry full LTP sets, so the next frame
+        for the same symbol and mode supersedes a dropped one; snapshots
+        arrive once per connection and are always queued.
+
+        Args:
+            ws: WebSocketApp instance
+            message: Raw message (str or bytes)
+        """
+        if len(message) <= _PING_SNIFF_MAX_LEN and _frame_has_event(message, _PING_MARKERS):
+            self._handle_ping(ws)
+            return
+
+        frames = self._frames
+        if frames.qsize() >= self.MAX_PENDING_FRAMES:
+            if not _frame_has_event(message, _SNAPSHOT_MARKERS):
+                if not self._dropped_frames:
+                    logger.warning("ws_backlog_dropping_frames", pending_frames=frames.qsize())
+                self._dropped_frames += 1
+                return
+        elif self._dropped_frames:
+            logger.info("ws_backlog_recovered", dropped_frames=self._dropped_frames)
+            self._dropped_frames = 0
+        frames.put((ws, message))
+
+    def _dispatch_loop(self, frames: queue.SimpleQueue) -> None:
+        """Parse and apply queued frames in arrival order until stopped.
+
+        Args:
+            frames: Queue fed by _enqueue_frame; a (None, None) entry stops the loop
+        """
+        get = frames.get
+        on_message = self._on_message
+        while True:
+            ws, message = get()
+            if ws is None:
+                return
+            on_message(ws, message)
+
     def _on_open(self, ws: websocket.WebSocketApp) -> None:
         """Handle WebSocket connection open.
 
@@ -155,13 +338,13 @@ class FastStreamClient:
         """
         logger.info("ws_connected", symbols=self.symbols)
         self.state.set_ws_connected(True)
-        self.last_connect_time = datetime.now(IST)
+        self.last_connect_monotonic = time.monotonic()
         self.reconnect_delay = 1.0  # Reset backoff on successful connection
 
         # Schedule proactive reconnection (Requirement 11.9)
         self._schedule_proactive_reconnect()
 
-    def _on_message(self, ws: websocket.WebSocketApp, message: str) -> None:
+    def _on_message(self, ws: websocket.WebSocketApp, message: str | bytes) -> None:
         """Handle incoming WebSocket message.
 
         Requirement 11.3: Update corresponding symbol LTP on tick event
@@ -170,29 +353,32 @@ class FastStreamClient:
 
         Args:
             ws: WebSocketApp instance
-            message: Raw message string
+            message: Raw message (str or bytes)
         """
         try:
-            data = json.loads(message)
+            # orjson accepts str and bytes frames alike, no decode needed
+            data = orjson.loads(message)
+        except ValueError as e:
+            # orjson.JSONDecodeError is a ValueError subclass
+            # Requirement 17.7: Log all errors to console for debugging
+            logger.error("ws_json_parse_error", error=str(e), message_preview=message[:100] if message else None)
+            return
+
+        event = None
+        try:
             event = data.get("event")
 
-            if event == "ping":
+            handler = self._handlers.get(event)
+            if handler is not None:
+                handler(data)
+            elif event == "ping":
                 self._handle_ping(ws)
-            elif event == "tick":
-                self._handle_tick(data)
-            elif event == "option_chain_ltp":
-                self._handle_option_chain_ltp(data)
-            elif event == "snapshot":
-                self._handle_snapshot(data)
             else:
-                logger.debug("ws_unknown_event", event=event)
+                logger.debug("ws_unknown_event", event_type=event)
 
-        except json.JSONDecodeError as e:
-            # Requirement 17.7: Log all errors to console for debugging
-            logger.error("ws_json_parse_error", error=str(e), message_preview=message[:100] if message else None)
         except Exception as e:
             # Requirement 17.7: Log all errors to console for debugging
-            logger.error("ws_message_handling_error", error=str(e), error_type=type(e).__name__, event=data.get("event") if isinstance(data, dict) else None)
+            logger.error("ws_message_handling_error", error=str(e), error_type=type(e).__name__, event_type=event)
 
     def _handle_ping(self, ws: websocket.WebSocketApp) -> None:
         """Handle ping event by sending pong response.
@@ -203,8 +389,7 @@ class FastStreamClient:
             ws: WebSocketApp instance
         """
         try:
-            pong_message = json.dumps({"action": "pong"})
-            ws.send(pong_message)
+            ws.send(_PONG_MESSAGE)
             logger.debug("ws_pong_sent")
         except Exception as e:
             # Requirement 17.7: Log all errors to console for debugging
@@ -224,21 +409,39 @@ class FastStreamClient:
         ts_str = data.get("ts") or data.get("timestamp")
         ts = self._parse_timestamp(ts_str)
 
+        # Symbols in one frame usually share a timestamp string, so each
+        # distinct string is parsed once per frame.
+        ts_cache: Dict[str, Optional[datetime]] = {}
+        parse = self._parse_timestamp
+
+        # Collect the whole frame so the state publishes it in one update
+        valid_symbols = self._valid_symbols
+        ticks = []
         for symbol, tick in tick_data.items():
-            if isinstance(tick, dict):
-                ltp = tick.get("ltp", 0.0)
-                change = tick.get("change", 0.0)
-                change_pct = tick.get("change_pct", 0.0)
-                tick_ts = self._parse_timestamp(tick.get("ts")) or ts
-
-                self.state.update_ltp(
-                    symbol=symbol,
-                    ltp=ltp,
-                    change=change,
-                    change_pct=change_pct,
-                    ts=tick_ts,
-                )
-                logger.debug("ws_ltp_updated", symbol=symbol, ltp=ltp)
+            if symbol.lower() not in valid_symbols:
+                continue
+            # Server contract sends dict values; anything else is skipped
+            # via the failed .get rather than an isinstance per symbol.
+            try:
+                raw = tick.get("ts")
+            except AttributeError:
+                continue
+            if not raw:
+                tick_ts = None
+            elif raw in ts_cache:
+                tick_ts = ts_cache[raw]
+            else:
+                tick_ts = ts_cache[raw] = parse(raw)
+            ticks.append((
+                symbol,
+                tick.get("ltp", 0.0),
+                tick.get("change", 0.0),
+                tick.get("change_pct", 0.0),
+                tick_ts or ts,
+            ))
+        self.state.update_ltps_batch(ticks)
+        if _level_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ws_ltp_updated", symbol_count=len(ticks))
 
     def _handle_option_chain_ltp(self, data: dict) -> None:
         """Handle option_chain_ltp event to update option LTPs.
@@ -273,15 +476,16 @@ class FastStreamClient:
         if not symbol or not strikes_arr:
             return
 
-        # Build strike LTP mapping from columnar arrays
-        strike_ltps: Dict[float, Tuple[Optional[float], Optional[float]]] = {}
-        for i, strike in enumerate(strikes_arr):
-            call_ltp = call_ltp_arr[i] if i < len(call_ltp_arr) else None
-            put_ltp = put_ltp_arr[i] if i < len(put_ltp_arr) else None
-            strike_ltps[float(strike)] = (call_ltp, put_ltp)
+        # Build strike LTP mapping from columnar arrays; short LTP columns pad
+        # with None and surplus LTPs beyond the last strike are dropped.
+        strike_ltps: Dict[float, Tuple[Optional[float], Optional[float]]] = dict(zip(
+            map(float, strikes_arr),
+            chain(zip_longest(call_ltp_arr, put_ltp_arr), repeat(_NO_LTPS)),
+        ))
 
         self.state.update_option_chain_ltp(symbol, mode, strike_ltps)
-        logger.debug("ws_option_chain_ltp_updated", symbol=symbol, mode=mode, strike_count=len(strike_ltps))
+        if _level_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ws_option_chain_ltp_updated", symbol=symbol, mode=mode, strike_count=len(strike_ltps))
 
     def _handle_snapshot(self, data: dict) -> None:
         """Handle snapshot event with initial data.
@@ -291,19 +495,24 @@ class FastStreamClient:
         """
         # Snapshot handling - update all symbols with initial data
         snapshot_data = data.get("data", {})
+        valid_symbols = self._valid_symbols
+        ticks = []
         for symbol, symbol_data in snapshot_data.items():
-            if isinstance(symbol_data, dict):
+            if symbol.lower() not in valid_symbols:
+                continue
+            try:
                 ltp = symbol_data.get("ltp", 0.0)
-                change = symbol_data.get("change", 0.0)
-                change_pct = symbol_data.get("change_pct", 0.0)
-
-                self.state.update_ltp(
-                    symbol=symbol,
-                    ltp=ltp,
-                    change=change,
-                    change_pct=change_pct,
-                )
-        logger.info("ws_snapshot_processed", symbol_count=len(snapshot_data))
+            except AttributeError:
+                continue
+            ticks.append((
+                symbol,
+                ltp,
+                symbol_data.get("change", 0.0),
+                symbol_data.get("change_pct", 0.0),
+                None,
+            ))
+        self.state.update_ltps_batch(ticks)
+        logger.info("ws_snapshot_processed", symbol_count=len(ticks))
 
     def _on_error(self, ws: websocket.WebSocketApp, error: Exception) -> None:
         """Handle WebSocket error.
@@ -399,7 +608,8 @@ class FastStreamClient:
         delay = self.reconnect_delay
         logger.info("ws_reconnect_scheduled", delay_seconds=delay)
 
-        time.sleep(delay)
+        # Returns early if disconnect() is called during the wait
+        self._stop_event.wait(delay)
 
         # Increase delay for next attempt (exponential backoff)
         self.reconnect_delay = min(self.reconnect_delay * 2, self.MAX_RECONNECT_DELAY)
@@ -409,33 +619,64 @@ class FastStreamClient:
 
         Requirement 11.9: THE Dashboard SHALL proactively reconnect
         every 55 minutes before Cloud Run timeout.
+
+        Arms the long-lived monitor thread for a new connection. Bumping
+        the generation counter restarts its deadline without allocating a
+        new timer thread per connection.
         """
-        self._cancel_proactive_reconnect()
+        with self._lock:
+            self._monitor_gen += 1
+            self._monitor_armed = True
+        self._monitor_wake.set()
+        logger.debug("ws_proactive_reconnect_scheduled", minutes=self.PROACTIVE_RECONNECT_MINUTES)
 
-        reconnect_seconds = self.PROACTIVE_RECONNECT_MINUTES * 60
+    def _cancel_proactive_reconnect(self) -> None:
+        """Disarm the proactive reconnect deadline."""
+        with self._lock:
+            self._monitor_gen += 1
+            self._monitor_armed = False
+        self._monitor_wake.set()
 
-        def proactive_reconnect():
-            if self.running and self.ws:
-                logger.info("ws_proactive_reconnect_triggered")
-                self.reconnect_delay = 1.0  # Reset backoff for proactive reconnect
-                try:
-                    self.ws.close()
-                except Exception as e:
-                    # Requirement 17.7: Log all errors to console for debugging
-                    logger.error("ws_proactive_close_error", error=str(e), error_type=type(e).__name__)
+    def _start_monitor(self) -> None:
+        """Start the connection monitor thread if it is not already running."""
+        if self._monitor_thread is not None and self._monitor_thread.is_alive():
+            return
+        self._monitor_thread = threading.Thread(target=self._monitor_connection, daemon=True)
+        self._monitor_thread.start()
 
-        self._proactive_reconnect_timer = threading.Timer(
-            reconnect_seconds, proactive_reconnect
-        )
-        self._proactive_reconnect_timer.daemon = True
-        self._proactive_reconnect_timer.start()
-        logger.debug("ws_proactive_reconnect_scheduled", minutes=self.PROACTIVE_RECONNECT_MINUTES)
+    def _monitor_connection(self) -> None:
+        """Connection monitor loop, one thread for the client's lifetime.
 
-    def _cancel_proactive_reconnect(self) -> None:
-        """Cancel the proactive reconnection timer."""
-        if self._proactive_reconnect_timer:
-            self._proactive_reconnect_timer.cancel()
-            self._proactive_reconnect_timer = None
+        While armed for a connection, waits PROACTIVE_RECONNECT_MINUTES and
+        then closes the socket so _run reconnects (Requirement 11.9).
+
+        Any schedule/cancel call sets _monitor_wake, which ends the
+        current wait and re-reads the generation.
+        """
+        while self.running:
+            self._monitor_wake.wait()
+            with self._lock:
+                self._monitor_wake.clear()
+                gen = self._monitor_gen
+                armed = self._monitor_armed
+            if not armed:
+                continue
+
+            if self._monitor_wake.wait(timeout=self.PROACTIVE_RECONNECT_MINUTES * 60):
+                continue  # Rescheduled, cancelled or stopping
+            if self.running and gen == self._monitor_gen:
+                self._proactive_reconnect()
+
+    def _proactive_reconnect(self) -> None:
+        """Close the current socket so the run loop reconnects immediately."""
+        if self.running and self.ws:
+            logger.info("ws_proactive_reconnect_triggered")
+            self.reconnect_delay = 1.0  # Reset backoff for proactive reconnect
+            try:
+                self.ws.close()
+            except Exception as e:
+                # Requirement 17.7: Log all errors to console for debugging
+                logger.error("ws_proactive_close_error", error=str(e), error_type=type(e).__name__)
 
     def _parse_timestamp(self, ts_str: Optional[str]) -> Optional[datetime]:
         """Parse timestamp string to datetime.
@@ -450,14 +691,13 @@ class FastStreamClient:
             return None
 
         try:
-            # Try ISO format with timezone
-            if "+" in ts_str or ts_str.endswith("Z"):
-                dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                return dt.astimezone(IST)
-            else:
-                # Assume IST if no timezone
-                dt = datetime.fromisoformat(ts_str)
-                return IST.localize(dt)
+            # Z-suffixed UTC is the common case; test it before scanning for "+"
+            if ts_str[-1] == "Z":
+                return _FROMISO(ts_str[:-1] + "+00:00").astimezone(IST)
+            if "+" in ts_str:
+                return _FROMISO(ts_str).astimezone(IST)
+            # Assume IST if no timezone
+            return _IST_LOCALIZE(_FROMISO(ts_str))
         except (ValueError, TypeError):
             return None
 
@@ -468,7 +708,10 @@ class FastStreamClient:
         """
         logger.info("ws_disconnecting")
         self.running = False
+        self._stop_event.set()
         self._cancel_proactive_reconnect()
+        # Frames already queued are applied before the dispatcher exits
+        self._frames.put((None, None))
 
         if self.ws:
             try:
@@ -523,4 +766,4 @@ def create_pong_message() -> str:
     Returns:
         JSON string with pong action
     """
-    return json.dumps({"action": "pong"})
+    return _PONG_MESSAGE
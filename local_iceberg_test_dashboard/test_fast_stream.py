@@ -6,7 +6,13 @@ This script connects to the Iceberg Fast Stream WebSocket endpoint
 and logs all received messages for validation.
 
 Usage:
-    python test_fast_stream.py [--duration SECONDS] [--token JWT_TOKEN]
+    python test_fast_stream.py [--duration SECONDS] [--token JWT_TOKEN] [--verbose]
+                               [--no-debug-ticks]
+
+DEBUG lines (per-symbol ticks, pings) are only printed with --verbose;
+they are always counted in the summary. --no-debug-ticks keeps the other
+DEBUG lines but drops per-symbol tick lines. Running under `python -O`
+strips the per-symbol tick logging code entirely.
 
 Evidence-based validation:
 - Logs all WebSocket events with timestamps
@@ -16,15 +22,17 @@ Evidence-based validation:
 """
 
 import argparse
-import json
 import os
+import signal
 import sys
 import time
 import threading
-from datetime import datetime
-from collections import defaultdict
-from typing import Optional, Dict, Any, List
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Optional, Dict, Any, List, Set
 
+import orjson
 import websocket
 from dotenv import load_dotenv
 
@@ -36,38 +44,95 @@ DEFAULT_DURATION = 60  # seconds
 API_URL = os.getenv("ICEBERG_API_URL", "https://api.botbro.trade")
 JWT_TOKEN = os.getenv("ICEBERG_JWT_TOKEN", "")
 SYMBOLS = ["nifty", "banknifty", "sensex", "finnifty"]
+# Pre-encoded pong reply; sent as a text frame without a per-ping encode
+_PONG_FRAME = b'{"action":"pong"}'
+# Pings are tiny; frames up to this length are sniffed before parsing
+_PING_SNIFF_MAX_LEN = 64
+
+
+def _is_ping_frame(message) -> bool:
+    """Cheap check for a ping frame without parsing it as JSON."""
+    if len(message) > _PING_SNIFF_MAX_LEN:
+        return False
+    if isinstance(message, (bytes, bytearray)):
+        return b'"event":"ping"' in message or b'"event": "ping"' in message
+    return '"event":"ping"' in message or '"event": "ping"' in message
+
+
+@dataclass(slots=True)
+class StreamStats:
+    """Counters and evidence gathered during a validation run."""
+    
+    connected: bool = False
+    # Offsets from run() start in time.monotonic_ns() units; ms at summary time
+    connection_time_ns: Optional[int] = None
+    messages_received: int = 0
+    symbols_seen: Set[str] = field(default_factory=set)
+    first_message_time_ns: Optional[int] = None
+    last_message_time_ns: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+    pings_received: int = 0
+    pongs_sent: int = 0
+    snapshots_received: int = 0
+    ticks_received: int = 0
+    option_chain_ltp_received: int = 0
+    option_ticks_received: int = 0
+    other_events: Counter = field(default_factory=Counter)  # Unrecognised event types
+    
+    @property
+    def events_by_type(self) -> Counter:
+        """Per-event-type message counts, assembled from the typed counters."""
+        events = Counter({
+            "ping": self.pings_received,
+            "snapshot": self.snapshots_received,
+            "tick": self.ticks_received,
+            "option_chain_ltp": self.option_chain_ltp_received,
+            "option_tick": self.option_ticks_received,
+        })
+        events.update(self.other_events)
+        return +events  # Drop event types that never arrived
 
 
 class FastStreamValidator:
     """Validates the Fast Stream WebSocket connection."""
     
-    def __init__(self, jwt_token: str, duration: int = DEFAULT_DURATION):
+    def __init__(self, jwt_token: str, duration: int = DEFAULT_DURATION, verbose: bool = False,
+                 debug_ticks: bool = True):
         self.jwt_token = jwt_token
         self.duration = duration
+        self.verbose = verbose  # Print DEBUG lines
+        self._debug_ticks = verbose and debug_ticks  # Per-symbol TICK lines
+        # "YYYY-MM-DD HH:MM:SS" for the current second, reused by _log
+        self._ts_second = -1
+        self._ts_prefix = ""
+        # Log lines are queued by _log and written in batches by one writer
+        # thread, so the socket thread never blocks on stdout
+        self._log_q: deque = deque()
+        self._log_write_lock = threading.Lock()
+        self._log_stop = threading.Event()
         self.ws: Optional[websocket.WebSocketApp] = None
-        self.running = False
-        self.start_time: Optional[float] = None
+        self.closed = threading.Event()  # Set by _on_close; ends the run wait early
+        self._t0_ns = 0  # time.monotonic_ns() at run() start
         
         # Statistics
-        self.stats = {
-            "connected": False,
-            "connection_time": None,
-            "messages_received": 0,
-            "events_by_type": defaultdict(int),
-            "symbols_seen": set(),
-            "first_message_time": None,
-            "last_message_time": None,
-            "errors": [],
-            "pings_received": 0,
-            "pongs_sent": 0,
-            "snapshots_received": 0,
-            "ticks_received": 0,
-            "option_chain_ltp_received": 0,
+        self.stats = StreamStats()
+        
+        self._ticks_saturated = False  # All SYMBOLS seen; see _on_tick
+        
+        # Event type -> handler(ws, data); anything else goes to _on_unknown
+        self._handlers = {
+            "ping": self._on_ping,
+            "snapshot": self._on_snapshot,
+            "tick": self._on_tick,
+            "option_chain_ltp": self._on_option_chain_ltp,
+            "option_tick": self._on_option_tick,
         }
         
         # Message samples for evidence
-        self.message_samples: Dict[str, List[Dict]] = defaultdict(list)
         self.max_samples = 3  # Keep up to 3 samples per event type
+        # Fixed-size per type; the first max_samples frames are kept
+        self.message_samples: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self.max_samples))
         
     def _build_url(self) -> str:
         """Build WebSocket URL with token and symbols."""
@@ -77,110 +142,159 @@ class FastStreamValidator:
     
     def _log(self, level: str, message: str, **kwargs):
         """Log with timestamp and structured data."""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        if level == "DEBUG" and not self.verbose:
+            return
+        seconds, ms = divmod(time.time_ns() // 1_000_000, 1000)
+        if seconds != self._ts_second:
+            self._ts_second = seconds
+            self._ts_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+        ts = f"{self._ts_prefix}.{ms:03d}"
         extra = " ".join(f"{k}={v}" for k, v in kwargs.items()) if kwargs else ""
-        print(f"[{ts}] [{level}] {message} {extra}")
+        self._log_q.append(f"[{ts}] [{level}] {message} {extra}\n")
+    
+    def _drain_log(self):
+        """Write all queued log lines to stdout in one call."""
+        with self._log_write_lock:
+            log_q = self._log_q
+            if not log_q:
+                return
+            batch = []
+            while log_q:
+                batch.append(log_q.popleft())
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+    
+    def _log_writer(self):
+        """Drain the log queue every 10ms until stopped, then once more."""
+        while not self._log_stop.wait(0.01):
+            self._drain_log()
+        self._drain_log()
     
     def _on_open(self, ws):
         """Handle WebSocket connection open."""
-        self.stats["connected"] = True
-        self.stats["connection_time"] = time.time() - self.start_time
+        self.stats.connected = True
+        self.stats.connection_time_ns = time.monotonic_ns() - self._t0_ns
         self._log("INFO", "WebSocket CONNECTED", 
-                  connection_time_ms=f"{self.stats['connection_time']*1000:.0f}")
+                  connection_time_ms=self.stats.connection_time_ns // 1_000_000)
     
-    def _on_message(self, ws, message: str):
+    def _on_message(self, ws, message: bytes):
         """Handle incoming WebSocket message."""
-        now = time.time()
-        self.stats["messages_received"] += 1
+        elapsed_ns = time.monotonic_ns() - self._t0_ns
+        self.stats.messages_received += 1
         
-        if self.stats["first_message_time"] is None:
-            self.stats["first_message_time"] = now - self.start_time
-        self.stats["last_message_time"] = now - self.start_time
+        if self.stats.first_message_time_ns is None:
+            self.stats.first_message_time_ns = elapsed_ns
+        self.stats.last_message_time_ns = elapsed_ns
+        
+        # Once ping samples are captured, answer pings without parsing them
+        if _is_ping_frame(message) and len(self.message_samples["ping"]) >= self.max_samples:
+            self._on_ping(ws, None)
+            return
         
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)  # Raw frame bytes, parsed without a str copy
             event_type = data.get("event", "unknown")
-            self.stats["events_by_type"][event_type] += 1
             
             # Store sample for evidence
-            if len(self.message_samples[event_type]) < self.max_samples:
-                self.message_samples[event_type].append(data)
+            samples = self.message_samples[event_type]
+            if len(samples) < samples.maxlen:
+                samples.append(data)
+            
+            self._handlers.get(event_type, self._on_unknown)(ws, data)
             
-            # Handle specific event types
-            if event_type == "ping":
-                self.stats["pings_received"] += 1
-                self._handle_ping(ws)
-                self._log("DEBUG", "PING received, sending PONG")
-                
-            elif event_type == "snapshot":
-                self.stats["snapshots_received"] += 1
-                symbols_in_snapshot = list(data.get("data", {}).keys())
-                self.stats["symbols_seen"].update(symbols_in_snapshot)
-                self._log("INFO", "SNAPSHOT received", 
-                          symbols=symbols_in_snapshot,
-                          ts=data.get("ts"))
-                
-            elif event_type == "tick":
-                self.stats["ticks_received"] += 1
-                tick_data = data.get("data", {})
-                for symbol, tick in tick_data.items():
-                    self.stats["symbols_seen"].add(symbol)
-                    if isinstance(tick, dict):
-                        self._log("DEBUG", f"TICK {symbol}", 
-                                  ltp=tick.get("ltp"),
-                                  change=tick.get("change"),
-                                  change_pct=tick.get("change_pct"))
-                
-            elif event_type == "option_chain_ltp":
-                self.stats["option_chain_ltp_received"] += 1
-                symbol = data.get("symbol", "unknown")
-                mode = data.get("mode", "unknown")
-                strikes_data = data.get("data", {})
-                strikes_count = len(strikes_data.get("strikes", []))
-                self.stats["symbols_seen"].add(symbol)
-                self._log("INFO", f"OPTION_CHAIN_LTP {symbol}/{mode}", 
-                          strikes=strikes_count,
-                          expiry=data.get("expiry"))
-                
-            elif event_type == "option_tick":
-                symbol = data.get("symbol", "unknown")
-                self.stats["symbols_seen"].add(symbol)
-                self._log("DEBUG", f"OPTION_TICK {symbol}")
-                
-            else:
-                self._log("WARN", f"Unknown event type: {event_type}", 
-                          data_keys=list(data.keys()))
-                
-        except json.JSONDecodeError as e:
-            self.stats["errors"].append(f"JSON decode error: {e}")
+        except orjson.JSONDecodeError as e:
+            self.stats.errors.append(f"JSON decode error: {e}")
             self._log("ERROR", "Failed to parse message", 
                       error=str(e), 
                       message_preview=message[:100])
     
+    def _on_ping(self, ws, data):
+        """Count a ping and reply with pong."""
+        self.stats.pings_received += 1
+        self._handle_ping(ws)
+        self._log("DEBUG", "PING received, sending PONG")
+    
+    def _on_snapshot(self, ws, data):
+        """Record the symbols in a snapshot."""
+        self.stats.snapshots_received += 1
+        symbols_in_snapshot = list(data.get("data", {}).keys())
+        self.stats.symbols_seen.update(symbols_in_snapshot)
+        self._log("INFO", "SNAPSHOT received", 
+                  symbols=symbols_in_snapshot,
+                  ts=data.get("ts"))
+    
+    def _on_tick(self, ws, data):
+        """Record the symbols in a tick frame."""
+        self.stats.ticks_received += 1
+        tick_data = data.get("data", {})
+        # Ticks only carry subscribed symbols; once all have been seen the
+        # per-frame set update is skipped
+        if not self._ticks_saturated:
+            symbols_seen = self.stats.symbols_seen
+            symbols_seen.update(tick_data)
+            self._ticks_saturated = symbols_seen.issuperset(SYMBOLS)
+        # __debug__ is a compile-time constant: python -O removes this block
+        if __debug__ and self._debug_ticks:
+            for symbol, tick in tick_data.items():
+                if isinstance(tick, dict):
+                    self._log("DEBUG", f"TICK {symbol}", 
+                              ltp=tick.get("ltp"),
+                              change=tick.get("change"),
+                              change_pct=tick.get("change_pct"))
+    
+    def _on_option_chain_ltp(self, ws, data):
+        """Record an option chain LTP frame."""
+        self.stats.option_chain_ltp_received += 1
+        symbol = data.get("symbol", "unknown")
+        mode = data.get("mode", "unknown")
+        strikes_data = data.get("data", {})
+        strikes_count = len(strikes_data.get("strikes", []))
+        self.stats.symbols_seen.add(symbol)
+        self._log("INFO", f"OPTION_CHAIN_LTP {symbol}/{mode}", 
+                  strikes=strikes_count,
+                  expiry=data.get("expiry"))
+    
+    def _on_option_tick(self, ws, data):
+        """Record an option tick frame."""
+        self.stats.option_ticks_received += 1
+        symbol = data.get("symbol", "unknown")
+        self.stats.symbols_seen.add(symbol)
+        self._log("DEBUG", f"OPTION_TICK {symbol}")
+    
+    def _on_unknown(self, ws, data):
+        """Count and report an unrecognised event type."""
+        event_type = data.get("event", "unknown")
+        self.stats.other_events[event_type] += 1
+        self._log("WARN", f"Unknown event type: {event_type}", 
+                  data_keys=list(data.keys()))
+    
     def _handle_ping(self, ws):
         """Respond to ping with pong."""
         try:
-            pong_message = json.dumps({"action": "pong"})
-            ws.send(pong_message)
-            self.stats["pongs_sent"] += 1
+            ws.send(_PONG_FRAME)
+            self.stats.pongs_sent += 1
         except Exception as e:
-            self.stats["errors"].append(f"Pong send error: {e}")
+            self.stats.errors.append(f"Pong send error: {e}")
             self._log("ERROR", "Failed to send pong", error=str(e))
     
     def _on_error(self, ws, error):
         """Handle WebSocket error."""
-        self.stats["errors"].append(str(error))
+        self.stats.errors.append(str(error))
         self._log("ERROR", "WebSocket error", error=str(error))
     
     def _on_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket close."""
         self._log("INFO", "WebSocket CLOSED", 
                   code=close_status_code, 
-                  message=close_msg)
-        self.running = False
+                  close_msg=close_msg)
+        self.closed.set()
     
     def run(self):
         """Run the validation test."""
+        self._log_stop.clear()
+        log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        log_thread.start()
+        
         self._log("INFO", "=" * 60)
         self._log("INFO", "FAST STREAM VALIDATION TEST")
         self._log("INFO", "=" * 60)
@@ -193,8 +307,8 @@ class FastStreamValidator:
         url = self._build_url()
         self._log("INFO", f"Connecting to: {url[:80]}...")
         
-        self.start_time = time.time()
-        self.running = True
+        self._t0_ns = time.monotonic_ns()
+        self.closed.clear()
         
         self.ws = websocket.WebSocketApp(
             url,
@@ -204,74 +318,96 @@ class FastStreamValidator:
             on_close=self._on_close,
         )
         
-        # Run WebSocket in a thread
-        ws_thread = threading.Thread(target=self.ws.run_forever, kwargs={"ping_interval": 0})
+        # Run WebSocket in a thread. With UTF-8 validation skipped,
+        # websocket-client hands text frames over as raw bytes (no decode
+        # to str); orjson validates UTF-8 itself when parsing them.
+        ws_thread = threading.Thread(
+            target=self.ws.run_forever,
+            kwargs={"ping_interval": 0, "skip_utf8_validation": True},
+        )
         ws_thread.daemon = True
         ws_thread.start()
         
-        # Wait for duration or until stopped
+        # Wait for duration, server close or Ctrl+C. SIGINT just ends the
+        # wait, so the normal close + summary path runs. The wait is sliced:
+        # on Windows a long lock wait cannot be interrupted, so the handler
+        # would only run once the full duration had passed.
+        previous_sigint = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigint = signal.signal(signal.SIGINT, self._on_sigint)
         try:
-            end_time = time.time() + self.duration
-            while self.running and time.time() < end_time:
-                time.sleep(0.5)
-        except KeyboardInterrupt:
-            self._log("INFO", "Interrupted by user")
+            deadline = time.monotonic() + self.duration
+            while not self.closed.wait(min(0.5, max(0.0, deadline - time.monotonic()))):
+                if time.monotonic() >= deadline:
+                    break
+        finally:
+            if previous_sigint is not None:
+                signal.signal(signal.SIGINT, previous_sigint)
         
         # Close connection
         if self.ws:
             self.ws.close()
+        ws_thread.join(timeout=5)
+        self._log_stop.set()
+        log_thread.join()
         
         # Print summary
         self._print_summary()
         
         return self.stats
     
+    def _on_sigint(self, signum, frame):
+        """Stop the run on Ctrl+C without raising KeyboardInterrupt."""
+        self._log("INFO", "Interrupted by user")
+        self.closed.set()
+    
     def _print_summary(self):
         """Print validation summary."""
         self._log("INFO", "=" * 60)
         self._log("INFO", "VALIDATION SUMMARY")
         self._log("INFO", "=" * 60)
+        self._drain_log()  # Before the summary's direct prints
         
         print(f"\n{'='*60}")
         print("CONNECTION STATUS")
         print(f"{'='*60}")
-        print(f"  Connected: {self.stats['connected']}")
-        if self.stats['connection_time']:
-            print(f"  Connection Time: {self.stats['connection_time']*1000:.0f}ms")
+        print(f"  Connected: {self.stats.connected}")
+        if self.stats.connection_time_ns:
+            print(f"  Connection Time: {self.stats.connection_time_ns / 1e6:.0f}ms")
         
         print(f"\n{'='*60}")
         print("MESSAGE STATISTICS")
         print(f"{'='*60}")
-        print(f"  Total Messages: {self.stats['messages_received']}")
-        print(f"  Snapshots: {self.stats['snapshots_received']}")
-        print(f"  Ticks: {self.stats['ticks_received']}")
-        print(f"  Option Chain LTP: {self.stats['option_chain_ltp_received']}")
-        print(f"  Pings Received: {self.stats['pings_received']}")
-        print(f"  Pongs Sent: {self.stats['pongs_sent']}")
+        print(f"  Total Messages: {self.stats.messages_received}")
+        print(f"  Snapshots: {self.stats.snapshots_received}")
+        print(f"  Ticks: {self.stats.ticks_received}")
+        print(f"  Option Chain LTP: {self.stats.option_chain_ltp_received}")
+        print(f"  Pings Received: {self.stats.pings_received}")
+        print(f"  Pongs Sent: {self.stats.pongs_sent}")
         
         print(f"\n{'='*60}")
         print("EVENTS BY TYPE")
         print(f"{'='*60}")
-        for event_type, count in sorted(self.stats['events_by_type'].items()):
+        for event_type, count in sorted(self.stats.events_by_type.items()):
             print(f"  {event_type}: {count}")
         
         print(f"\n{'='*60}")
         print("SYMBOLS SEEN")
         print(f"{'='*60}")
-        print(f"  {sorted(self.stats['symbols_seen'])}")
+        print(f"  {sorted(self.stats.symbols_seen)}")
         
-        if self.stats['first_message_time']:
+        if self.stats.first_message_time_ns:
             print(f"\n{'='*60}")
             print("TIMING")
             print(f"{'='*60}")
-            print(f"  First Message: {self.stats['first_message_time']*1000:.0f}ms after connect")
-            print(f"  Last Message: {self.stats['last_message_time']*1000:.0f}ms after connect")
+            print(f"  First Message: {self.stats.first_message_time_ns / 1e6:.0f}ms after connect")
+            print(f"  Last Message: {self.stats.last_message_time_ns / 1e6:.0f}ms after connect")
         
-        if self.stats['errors']:
+        if self.stats.errors:
             print(f"\n{'='*60}")
             print("ERRORS")
             print(f"{'='*60}")
-            for error in self.stats['errors']:
+            for error in self.stats.errors:
                 print(f"  - {error}")
         
         # Print message samples as evidence
@@ -280,10 +416,11 @@ class FastStreamValidator:
         print(f"{'='*60}")
         for event_type, samples in self.message_samples.items():
             print(f"\n--- {event_type} ---")
-            for i, sample in enumerate(samples[:2]):  # Show max 2 samples
+            for i, sample in enumerate(islice(samples, 2)):  # Show max 2 samples
                 print(f"Sample {i+1}:")
-                print(json.dumps(sample, indent=2, default=str)[:500])
-                if len(json.dumps(sample)) > 500:
+                pretty = orjson.dumps(sample, option=orjson.OPT_INDENT_2, default=str).decode()
+                print(pretty[:500])
+                if len(pretty) > 500:
                     print("  ... (truncated)")
         
         # Validation result
@@ -292,16 +429,16 @@ class FastStreamValidator:
         print(f"{'='*60}")
         
         issues = []
-        if not self.stats['connected']:
+        if not self.stats.connected:
             issues.append("Failed to connect to WebSocket")
-        if self.stats['snapshots_received'] == 0:
+        if self.stats.snapshots_received == 0:
             issues.append("No snapshot received on connection")
-        if self.stats['ticks_received'] == 0 and self.stats['option_chain_ltp_received'] == 0:
+        if self.stats.ticks_received == 0 and self.stats.option_chain_ltp_received == 0:
             issues.append("No tick or option_chain_ltp events received (market may be closed)")
-        if len(self.stats['symbols_seen']) == 0:
+        if len(self.stats.symbols_seen) == 0:
             issues.append("No symbols seen in messages")
-        if self.stats['errors']:
-            issues.append(f"{len(self.stats['errors'])} errors occurred")
+        if self.stats.errors:
+            issues.append(f"{len(self.stats.errors)} errors occurred")
         
         if issues:
             print("  STATUS: ISSUES FOUND")
@@ -311,8 +448,8 @@ class FastStreamValidator:
             print("  STATUS: PASS")
             print("  - WebSocket connected successfully")
             print("  - Snapshot received on connection")
-            print(f"  - {self.stats['messages_received']} messages received")
-            print(f"  - {len(self.stats['symbols_seen'])} symbols seen")
+            print(f"  - {self.stats.messages_received} messages received")
+            print(f"  - {len(self.stats.symbols_seen)} symbols seen")
 
 
 def main():
@@ -321,17 +458,22 @@ def main():
                         help=f"Test duration in seconds (default: {DEFAULT_DURATION})")
     parser.add_argument("--token", type=str, default=JWT_TOKEN,
                         help="JWT token for authentication")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print DEBUG lines (per-symbol ticks, pings)")
+    parser.add_argument("--no-debug-ticks", dest="debug_ticks", action="store_false",
+                        help="With --verbose, skip the per-symbol TICK lines")
     args = parser.parse_args()
     
     if not args.token:
         print("ERROR: No JWT token provided. Set ICEBERG_JWT_TOKEN env var or use --token")
         sys.exit(1)
     
-    validator = FastStreamValidator(jwt_token=args.token, duration=args.duration)
+    validator = FastStreamValidator(jwt_token=args.token, duration=args.duration,
+                                    verbose=args.verbose, debug_ticks=args.debug_ticks)
     stats = validator.run()
     
     # Exit with error code if validation failed
-    if not stats['connected'] or stats['errors']:
+    if not stats.connected or stats.errors:
         sys.exit(1)
     sys.exit(0)
 
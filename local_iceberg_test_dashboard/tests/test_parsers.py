@@ -127,6 +127,25 @@ class TestParseColumnarCandles:
         assert len(candles) == 1
         assert candles[0].volume == 0
 
+    def test_parse_with_reference_date_drops_other_days(self):
+        """Should skip rows outside reference_date while parsing."""
+        candles_raw = {
+            "ts": ["2026-01-14T10:00:00+05:30", "2026-01-15T10:00:00+05:30"],
+            "open": [22400.0, 22500.0],
+            "high": [22420.0, 22520.0],
+            "low": [22390.0, 22490.0],
+            "close": [22410.0, 22510.0],
+            "volume": [800, 1000],
+        }
+
+        candles = parse_columnar_candles(
+            candles_raw, reference_date=datetime(2026, 1, 15, tzinfo=IST)
+        )
+
+        assert len(candles) == 1
+        assert candles[0].ts.day == 15
+        assert candles[0].open == 22500.0
+
 
 class TestCandlesToColumnar:
     """Tests for candle to columnar conversion."""
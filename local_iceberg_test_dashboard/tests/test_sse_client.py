@@ -7,6 +7,8 @@ Requirements: 12.1, 12.2, 12.3, 12.4, 12.5, 12.6, 12.7, 12.8, 12.9, 12.10
 """
 
 import json
+import threading
+import time
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
@@ -81,6 +83,18 @@ class TestBuildUrl:
         assert "include_optional=true" in url
         assert "/v1/stream/indicators/tiered" in url
 
+    def test_build_url_cached_until_token_changes(self):
+        """Test URL is reused across calls and rebuilt after a token update."""
+        state = StateManager()
+        client = TieredStreamClient(state, "old_token")
+
+        url = client._build_url()
+        assert client._build_url() is url
+
+        client.update_jwt_token("new_token")
+
+        assert "token=new_token" in client._build_url()
+
 
 class TestEventHandling:
     """Tests for SSE event handling."""
@@ -212,6 +226,39 @@ class TestEventHandling:
         assert client.last_heartbeat_time is not None
         assert state.get_connection_status().sse_connected is True
 
+    def test_handle_heartbeat_skips_timestamp_parse_without_debug(self):
+        """Test heartbeat timestamp is only parsed when DEBUG logging is on."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        with patch("src.sse_client._stdlib_logger") as stdlib_logger, \
+                patch("src.sse_client.parse_timestamp") as parse_ts:
+            stdlib_logger.isEnabledFor.return_value = False
+            client._handle_heartbeat({"timestamp": "2026-01-20T10:30:00+05:30"})
+            parse_ts.assert_not_called()
+
+            stdlib_logger.isEnabledFor.return_value = True
+            client._handle_heartbeat({"timestamp": "2026-01-20T10:30:00+05:30"})
+            parse_ts.assert_called_once()
+
+        assert state.get_connection_status().sse_connected is True
+
+    def test_heartbeat_sets_connected_only_on_transition(self):
+        """Test repeated heartbeats write connection status to state once."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        with patch.object(state, "set_sse_connected", wraps=state.set_sse_connected) as set_connected:
+            client._record_heartbeat()
+            client._record_heartbeat()
+            assert set_connected.call_count == 1
+
+            client._set_sse_connected(False)
+            client._record_heartbeat()
+            assert set_connected.call_count == 3
+
+        assert state.get_connection_status().sse_connected is True
+
     def test_handle_refresh_recommended_calls_callback(self):
         """Test refresh_recommended event triggers callback.
         
@@ -239,13 +286,21 @@ class TestBackoffDelay:
         
         Requirement 12.9: Backoff sequence: 1s, 2s, 4s, 8s, 16s, 30s, 30s, ...
         """
-        assert calculate_sse_backoff_delay(1) == 1.0
-        assert calculate_sse_backoff_delay(2) == 2.0
-        assert calculate_sse_backoff_delay(3) == 4.0
-        assert calculate_sse_backoff_delay(4) == 8.0
-        assert calculate_sse_backoff_delay(5) == 16.0
-        assert calculate_sse_backoff_delay(6) == 30.0  # Capped
-        assert calculate_sse_backoff_delay(7) == 30.0  # Still capped
+        # Upper end of the jitter range is the undelayed backoff step
+        with patch("src.sse_client.random.uniform", side_effect=lambda low, high: high):
+            assert calculate_sse_backoff_delay(1) == 1.0
+            assert calculate_sse_backoff_delay(2) == 2.0
+            assert calculate_sse_backoff_delay(3) == 4.0
+            assert calculate_sse_backoff_delay(4) == 8.0
+            assert calculate_sse_backoff_delay(5) == 16.0
+            assert calculate_sse_backoff_delay(6) == 30.0  # Capped
+            assert calculate_sse_backoff_delay(7) == 30.0  # Still capped
+
+    def test_backoff_jittered_within_half_to_full_step(self):
+        """Test jittered delay stays between half and all of the backoff step."""
+        for failure_count, base in [(1, 1.0), (3, 4.0), (6, 30.0), (10, 30.0)]:
+            for _ in range(50):
+                assert base * 0.5 <= calculate_sse_backoff_delay(failure_count) <= base
 
     def test_backoff_zero_or_negative(self):
         """Test backoff returns 1.0 for invalid counts."""
@@ -267,6 +322,19 @@ class TestConnectionManagement:
         assert client.running is False
         assert state.get_connection_status().sse_connected is False
 
+    def test_disconnect_closes_http_client(self):
+        """Test disconnect closes the HTTP client shared across reconnects."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        http = Mock()
+        client._http = http
+        client.running = True
+
+        client.disconnect()
+
+        http.close.assert_called_once()
+        assert client._http is None
+
     def test_update_jwt_token(self):
         """Test JWT token can be updated."""
         state = StateManager()
@@ -276,6 +344,86 @@ class TestConnectionManagement:
 
         assert client.jwt_token == "new_token"
 
+    def test_update_jwt_token_triggers_reconnect_when_running(self):
+        """Test a new token stops the running stream for a reconnect."""
+        state = StateManager()
+        client = TieredStreamClient(state, "old_token")
+        client.running = True
+
+        client.update_jwt_token("new_token")
+
+        assert client._reconnect_pending is True
+        assert client._stop_event.is_set()
+
+    def test_update_jwt_token_same_token_no_reconnect(self):
+        """Test re-applying the current token does not reconnect."""
+        state = StateManager()
+        client = TieredStreamClient(state, "token")
+        client.running = True
+
+        client.update_jwt_token("token")
+
+        assert client._reconnect_pending is False
+        assert not client._stop_event.is_set()
+
+    def test_update_jwt_token_reconnects_deduplicated(self):
+        """Test rapid token updates reconnect only once within the dedup window."""
+        state = StateManager()
+        client = TieredStreamClient(state, "token_1")
+        client.running = True
+
+        client.update_jwt_token("token_2")
+        # Simulate _run picking up the first reconnect
+        client._reconnect_pending = False
+        client._stop_event.clear()
+
+        client.update_jwt_token("token_3")
+
+        assert client.jwt_token == "token_3"
+        assert client._reconnect_pending is False
+        assert not client._stop_event.is_set()
+        assert client._token_reconnect_due is not None
+
+    def test_deferred_token_reconnect_fires_after_dedup_window(self):
+        """Test a token change inside the dedup window reconnects once it ends."""
+        state = StateManager()
+        client = TieredStreamClient(state, "token_1")
+        client.running = True
+        client.TOKEN_RECONNECT_DEDUP_SECONDS = 0.1
+        client._start_monitor()
+        client._schedule_proactive_reconnect()
+
+        client.update_jwt_token("token_2")
+        # Simulate _run picking up the first reconnect on the same connection
+        client._reconnect_pending = False
+        client._stop_event.clear()
+
+        client.update_jwt_token("token_3")
+        assert client._reconnect_pending is False
+
+        deadline = time.monotonic() + 2.0
+        while not client._reconnect_pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert client._reconnect_pending is True
+        assert client._token_reconnect_due is None
+        client.disconnect()
+
+    def test_rebuilt_url_settles_deferred_token_reconnect(self):
+        """Test a reconnect that already uses the new token cancels the deferral."""
+        state = StateManager()
+        client = TieredStreamClient(state, "token_1")
+        client.running = True
+        client._last_token_reconnect = time.monotonic()
+
+        client.update_jwt_token("token_2")
+        assert client._token_reconnect_due is not None
+
+        with patch("src.sse_client.get_settings"):
+            client._build_url()
+
+        assert client._token_reconnect_due is None
+
     def test_is_connected_returns_state(self):
         """Test is_connected returns state manager value."""
         state = StateManager()
@@ -308,6 +456,56 @@ class TestEventParsing:
         indicators = state.get_indicators("nifty", "current")
         assert indicators.skew == 0.5
 
+    def test_handle_event_uses_type_from_payload(self):
+        """Test _handle_event falls back to event_type in the JSON body."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        client._handle_event(None, json.dumps({"event_type": "market_closed"}))
+
+        assert state.get_market_state() == "CLOSED"
+
+    def test_heartbeat_event_skips_json_decode_without_debug(self):
+        """Test queued heartbeat events are not decoded when DEBUG is off."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        with patch("src.sse_client._stdlib_logger") as stdlib_logger, \
+                patch("src.sse_client.orjson.loads") as loads:
+            stdlib_logger.isEnabledFor.return_value = False
+            client._handle_event("heartbeat", b"not json")
+            loads.assert_not_called()
+
+    def test_queued_heartbeat_does_not_refresh_liveness(self):
+        """Test the worker only logs typed heartbeats; arrival time is kept."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.last_heartbeat_monotonic = arrived = time.monotonic() - 60
+
+        with patch("src.sse_client._stdlib_logger") as stdlib_logger:
+            stdlib_logger.isEnabledFor.return_value = True
+            client._handle_event("heartbeat", b'{"ts": "2026-01-20T10:30:00+05:30"}')
+
+        assert client.last_heartbeat_monotonic == arrived
+
+    def test_untyped_heartbeat_recorded_by_worker(self):
+        """Test a heartbeat typed only in its payload is still recorded."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        client._handle_event(None, json.dumps({"event_type": "heartbeat"}))
+
+        assert client.last_heartbeat_time is not None
+        assert state.get_connection_status().sse_connected is True
+
+    def test_handle_event_ignores_unknown_type(self):
+        """Test _handle_event ignores event types without a handler."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        # Should not raise exception
+        client._handle_event("unknown_event", json.dumps({"foo": "bar"}))
+
     def test_handle_event_with_invalid_json(self):
         """Test _handle_event handles invalid JSON gracefully."""
         state = StateManager()
@@ -325,6 +523,226 @@ class TestEventParsing:
         client._handle_event("indicator_update", "")
 
 
+class TestStreamParsing:
+    """Tests for the buffered SSE stream parser in _process_stream."""
+
+    def _stream(self, client, chunks):
+        """Feed raw byte chunks through _process_stream."""
+        client.running = True
+        response = Mock()
+        response.iter_bytes.return_value = iter(chunks)
+        client._process_stream(response)
+
+    def _queued(self, client):
+        """Drain and return events queued for the dispatch worker."""
+        events = []
+        while not client._event_queue.empty():
+            events.append(client._event_queue.get_nowait())
+        return events
+
+    def test_event_split_across_chunks(self):
+        """Test an event split mid-prefix across chunks is dispatched intact."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [b"eve", b"nt: heartbeat\ndata: {\"ts\"", b": 1}\n", b"\n"])
+
+        assert self._queued(client) == [("heartbeat", b'{"ts": 1}')]
+        assert client._rx_buf == bytearray()
+
+    def test_crlf_and_multiline_data(self):
+        """Test CRLF line endings and multiple data lines are handled."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [b": keep-alive\r\nevent: snapshot\r\ndata: {\r\ndata: }\r\n\r\n"])
+
+        assert self._queued(client) == [("snapshot", b"{\n}")]
+
+    def test_partial_event_stays_buffered(self):
+        """Test bytes of an unterminated event remain in the buffer."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [b"data: {}\n\ndata: {\"partial\""])
+
+        assert self._queued(client) == [(None, b"{}")]
+        assert bytes(client._rx_buf[client._rx_head:]) == b'data: {"partial"'
+
+    def test_completed_data_line_awaiting_blank_line(self):
+        """Test buffer is still trimmed while an event's data lines are pending."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [b"data: {}\n\nevent:heartbeat\ndata: {}\n", b"\n"])
+
+        assert self._queued(client) == [(None, b"{}"), ("heartbeat", b"{}")]
+        assert client._rx_buf == bytearray()
+
+    def test_lookalike_and_ignored_fields(self):
+        """Test only exact "data:"/"event:" fields are used; others are ignored."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [
+            b"id: 7\nretry: 1000\ndatabase: x\neventual: y\ndat\n"
+            b"event: snapshot\ndata: {}\n\n"
+        ])
+
+        assert self._queued(client) == [("snapshot", b"{}")]
+
+    def test_oversize_event_abandons_stream(self):
+        """Test an unterminated event past MAX_EVENT_BYTES ends the stream."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.MAX_EVENT_BYTES = 16
+
+        self._stream(client, [b"data: " + b"x" * 32, b"\n\ndata: {}\n\n"])
+
+        assert self._queued(client) == []
+        assert client._rx_buf == bytearray()
+
+    def test_oversize_event_keeps_backoff(self):
+        """Test a stream dropped for an oversize event does not reset the backoff."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.MAX_EVENT_BYTES = 16
+        client.reconnect_delay = 8.0
+
+        self._stream(client, [b"data: " + b"x" * 32])
+
+        assert client.reconnect_delay == 8.0
+
+    def test_first_complete_event_resets_backoff(self):
+        """Test the backoff resets once the stream delivers a whole event."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.reconnect_delay = 8.0
+
+        self._stream(client, [b"data: {", b"}\n\n"])
+
+        assert client.reconnect_delay == 1.0
+
+    def test_consumed_bytes_compacted_past_half(self):
+        """Test consumed bytes stay behind _rx_head until they pass half the buffer."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [b"data: 1\n\ndata: 2345678901", b"\n\ndata: 3"])
+
+        assert self._queued(client) == [(None, b"1"), (None, b"2345678901")]
+        assert client._rx_head == 0
+        assert bytes(client._rx_buf) == b"data: 3"
+
+    def test_partial_event_state_kept_between_chunks(self):
+        """Test a partial event resumes from its saved offsets, not its first byte."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        self._stream(client, [b"data: 1\n\nevent: snapshot\ndata: a\n", b"data: b"])
+
+        assert self._queued(client) == [(None, b"1")]
+        # Relative to _rx_head: "event: snapshot\ndata: a\n" is scanned, "data: b" is not
+        assert client._rx_event_type == "snapshot"
+        assert client._rx_data_spans == [(22, 23)]
+        assert client._rx_scan == 24
+        assert client._rx_newline_from == 31
+
+        client._parse_buffer(client._rx_buf, client._rx_head)
+        assert self._queued(client) == []
+
+        client._rx_buf += b"\n\n"
+        client._parse_buffer(client._rx_buf, client._rx_head)
+        assert self._queued(client) == [("snapshot", b"a\nb")]
+
+    def test_heartbeats_dropped_when_backlogged(self):
+        """Test heartbeats are dropped once the dispatch backlog is full."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.MAX_PENDING_EVENTS = 1
+
+        self._stream(client, [b"data: {}\n\n" * 2 + b"event: heartbeat\ndata: {}\n\n"])
+
+        assert self._queued(client) == [(None, b"{}"), (None, b"{}")]
+        # Liveness is still recorded on arrival for the watchdog
+        assert client.last_heartbeat_time is not None
+        assert state.get_connection_status().sse_connected is True
+
+    def test_dispatch_worker_updates_state(self):
+        """Test the dispatch worker applies queued events until the sentinel."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        payload = json.dumps({
+            "symbol": "nifty",
+            "mode": "current",
+            "indicators": {"skew": 0.4, "skew_confidence": 0.7},
+        }).encode()
+
+        self._stream(client, [b"event: indicator_update\ndata: " + payload + b"\n\n"])
+        client._event_queue.put(None)
+        client._dispatch_events(client._event_queue)
+
+        assert state.get_indicators("nifty", "current").skew == 0.4
+
+
+class TestOptionChainCoalescing:
+    """Tests for option_chain_update coalescing in the dispatch worker."""
+
+    def _event(self, symbol, mode, underlying):
+        return json.dumps({
+            "symbol": symbol,
+            "mode": mode,
+            "expiry": "2026-01-23",
+            "underlying": underlying,
+            "strikes": [{"strike": 24500, "call_oi": 1000, "put_oi": 1000}],
+        })
+
+    def test_keeps_latest_per_symbol_mode(self):
+        """Test only the newest update per symbol/mode is applied."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        client._handle_event("option_chain_update", self._event("nifty", "current", 24500.0))
+        client._handle_event("option_chain_update", self._event("nifty", "current", 24510.0))
+        client._handle_event("option_chain_update", self._event("nifty", "positional", 24520.0))
+
+        # Nothing applied until the window is flushed
+        assert state.get_option_chain("nifty", "current").underlying == 0.0
+        assert len(client._pending_option_chains) == 2
+
+        client._flush_option_chain_updates()
+
+        assert state.get_option_chain("nifty", "current").underlying == 24510.0
+        assert state.get_option_chain("nifty", "positional").underlying == 24520.0
+        assert client._pending_option_chains == {}
+
+    def test_worker_flushes_after_window(self):
+        """Test the dispatch worker applies pending updates once idle."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.OPTION_CHAIN_COALESCE_SECONDS = 0.01
+
+        worker = threading.Thread(target=client._dispatch_events, args=(client._event_queue,))
+        worker.start()
+        client._event_queue.put(("option_chain_update", self._event("nifty", "current", 24500.0).encode()))
+        time.sleep(0.1)
+
+        assert state.get_option_chain("nifty", "current").underlying == 24500.0
+        client._event_queue.put(None)
+        worker.join(timeout=1.0)
+
+    def test_snapshot_flushes_pending_first(self):
+        """Test a snapshot applies pending option chains before itself."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+
+        client._handle_event("option_chain_update", self._event("nifty", "current", 24500.0))
+        client._handle_snapshot({"data": {}})
+
+        assert client._pending_option_chains == {}
+        assert state.get_option_chain("nifty", "current").underlying == 24500.0
+
+
 class TestReconnectionLogic:
     """Tests for SSE reconnection logic.
     
@@ -362,6 +780,21 @@ class TestReconnectionLogic:
         client.reconnect_delay = min(client.reconnect_delay * 2, client.MAX_RECONNECT_DELAY)
         assert client.reconnect_delay == 30.0  # Still capped
 
+    def test_schedule_reconnect_waits_jittered_delay(self):
+        """Test _schedule_reconnect waits a jittered delay and doubles the step."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.running = True
+        client.reconnect_delay = 8.0
+        client._stop_event = Mock()
+        client._stop_event.is_set.return_value = False
+
+        client._schedule_reconnect()
+
+        timeout = client._stop_event.wait.call_args.kwargs["timeout"]
+        assert 4.0 <= timeout <= 8.0
+        assert client.reconnect_delay == 16.0
+
     def test_max_reconnect_delay_constant(self):
         """Test MAX_RECONNECT_DELAY is 30 seconds."""
         assert TieredStreamClient.MAX_RECONNECT_DELAY == 30.0
@@ -404,41 +837,97 @@ class TestReconnectionLogic:
         # Should not raise exception
         client._handle_refresh_recommended({})
 
-    def test_schedule_proactive_reconnect_creates_timer(self):
-        """Test proactive reconnect timer is created."""
+    def _wait_for(self, predicate, timeout=1.0):
+        """Poll until predicate() is true or timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return predicate()
+
+    def test_schedule_proactive_reconnect_arms_monitor(self):
+        """Test scheduling arms the connection monitor and wakes it."""
         state = StateManager()
         client = TieredStreamClient(state, "test_jwt_token")
 
         client._schedule_proactive_reconnect()
 
-        assert client._proactive_reconnect_timer is not None
-        assert client._proactive_reconnect_timer.daemon is True
-
-        # Clean up
-        client._cancel_proactive_reconnect()
+        assert client._monitor_armed is True
+        assert client._monitor_wake.is_set()
 
-    def test_cancel_proactive_reconnect_clears_timer(self):
-        """Test proactive reconnect timer is properly cancelled."""
+    def test_cancel_proactive_reconnect_disarms_monitor(self):
+        """Test cancelling disarms the monitor and bumps its generation."""
         state = StateManager()
         client = TieredStreamClient(state, "test_jwt_token")
 
         client._schedule_proactive_reconnect()
-        assert client._proactive_reconnect_timer is not None
+        gen = client._monitor_gen
 
         client._cancel_proactive_reconnect()
-        assert client._proactive_reconnect_timer is None
+
+        assert client._monitor_armed is False
+        assert client._monitor_gen == gen + 1
 
     def test_disconnect_cancels_proactive_reconnect(self):
-        """Test disconnect cancels proactive reconnect timer."""
+        """Test disconnect disarms the monitor and stops its thread."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.running = True
+        client._start_monitor()
+        client._schedule_proactive_reconnect()
+
+        client.disconnect()
+        client._monitor_thread.join(timeout=1.0)
+
+        assert client._monitor_armed is False
+        assert not client._monitor_thread.is_alive()
+
+    def test_monitor_triggers_proactive_reconnect(self):
+        """Test the monitor requests a reconnect once the deadline passes."""
         state = StateManager()
         client = TieredStreamClient(state, "test_jwt_token")
         client.running = True
+        client.HEARTBEAT_CHECK_INTERVAL = 0.01
+        client.PROACTIVE_RECONNECT_MINUTES = 0
+        client._start_monitor()
 
         client._schedule_proactive_reconnect()
-        assert client._proactive_reconnect_timer is not None
 
+        assert self._wait_for(lambda: client._reconnect_pending)
+        assert client._stop_event.is_set()
+        client.disconnect()
+
+    def test_heartbeat_watchdog_requests_reconnect(self):
+        """Test watchdog reconnects after HEARTBEAT_TIMEOUT without heartbeat."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.running = True
+        client.HEARTBEAT_CHECK_INTERVAL = 0.01
+        client.last_heartbeat_monotonic = time.monotonic() - (client.HEARTBEAT_TIMEOUT + 1)
+        client._start_monitor()
+
+        client._schedule_proactive_reconnect()
+
+        assert self._wait_for(lambda: client._reconnect_pending)
+        assert client._stop_event.is_set()
+        client.disconnect()
+
+    def test_monitor_idle_while_disarmed(self):
+        """Test a disarmed monitor does not request reconnects."""
+        state = StateManager()
+        client = TieredStreamClient(state, "test_jwt_token")
+        client.running = True
+        client.HEARTBEAT_CHECK_INTERVAL = 0.01
+        client.PROACTIVE_RECONNECT_MINUTES = 0
+        client._start_monitor()
+
+        client._schedule_proactive_reconnect()
+        client._cancel_proactive_reconnect()
+        client._reconnect_pending = False
+        client._stop_event.clear()
+        time.sleep(0.05)
+
+        assert client._reconnect_pending is False
         client.disconnect()
-        assert client._proactive_reconnect_timer is None
 
     def test_reconnect_delay_resets_on_successful_connection(self):
         """Test reconnect delay resets to 1.0 after successful connection."""
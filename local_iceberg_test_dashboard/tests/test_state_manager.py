@@ -22,6 +22,7 @@ from src.models import (
     OptionChainData,
     OptionStrike,
     Candle,
+    SymbolData,
     VALID_SYMBOLS,
     VALID_MODES,
 )
@@ -46,14 +47,28 @@ class TestStateManagerInitialization:
         state = StateManager()
 
         for symbol in VALID_SYMBOLS:
-            assert symbol in state.indicators
-            assert symbol in state.option_chains
             assert symbol in state.candles
             assert symbol in state.ema_history
 
             for mode in VALID_MODES:
-                assert mode in state.indicators[symbol]
-                assert mode in state.option_chains[symbol]
+                assert (symbol, mode) in state.indicators
+                assert (symbol, mode) in state.option_chains
+                assert state.skew_pcr_history[(symbol, mode)] == []
+
+    def test_substates_use_slots(self):
+        """Substate dataclasses should be slotted (no per-instance __dict__)."""
+        state = StateManager()
+
+        for substate in (
+            state.connection_status,
+            state.user_session,
+            state.otp_session,
+            state.error_state,
+            state.staleness_state,
+            state.data_gap_state,
+            state.market_info_state,
+        ):
+            assert not hasattr(substate, "__dict__")
 
 
 class TestLTPUpdates:
@@ -74,6 +89,18 @@ class TestLTPUpdates:
         assert tick.change_pct == 0.45
         assert tick.ts == ts
 
+    def test_update_ltp_publishes_new_tick(self):
+        """Each tick should be a new slotted object, leaving earlier reads intact."""
+        state = StateManager()
+        state.update_ltp("nifty", 22500.0)
+        first = state.get_ltp("nifty")
+
+        state.update_ltp("nifty", 22510.0)
+
+        assert first.ltp == 22500.0
+        assert state.get_ltp("nifty").ltp == 22510.0
+        assert not hasattr(first, "__dict__")
+
     def test_update_ltp_normalizes_symbol_case(self):
         """update_ltp should normalize symbol to lowercase."""
         state = StateManager()
@@ -93,6 +120,32 @@ class TestLTPUpdates:
         status = state.get_connection_status()
         assert status.last_ws_update == ts
 
+    def test_update_ltps_batch_publishes_all_ticks(self):
+        """update_ltps_batch should store every tick in one republish."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        before = state.get_all_ltps()
+
+        state.update_ltps_batch([
+            ("NIFTY", 22500.0, 10.0, 0.05, None),
+            ("banknifty", 48000.0, -20.0, -0.04, ts),
+        ])
+
+        ltps = state.get_all_ltps()
+        assert len(before) == 0
+        assert ltps["nifty"].ltp == 22500.0
+        assert ltps["banknifty"].change == -20.0
+        assert state.get_connection_status().last_ws_update == ts
+
+    def test_update_ltps_batch_empty_is_noop(self):
+        """update_ltps_batch with no ticks should leave state untouched."""
+        state = StateManager()
+
+        state.update_ltps_batch([])
+
+        assert len(state.get_all_ltps()) == 0
+        assert state.get_connection_status().last_ws_update is None
+
     def test_get_all_ltps_returns_copy(self):
         """get_all_ltps should return a copy of the data."""
         state = StateManager()
@@ -105,6 +158,20 @@ class TestLTPUpdates:
         assert "nifty" in ltps
         assert "banknifty" in ltps
 
+    def test_get_all_ltps_is_read_only_snapshot(self):
+        """get_all_ltps view should be read-only and unaffected by later ticks."""
+        state = StateManager()
+        state.update_ltp("nifty", 22500.0)
+
+        ltps = state.get_all_ltps()
+        state.update_ltp("nifty", 22600.0)
+        state.update_ltp("banknifty", 48000.0)
+
+        assert ltps["nifty"].ltp == 22500.0
+        assert "banknifty" not in ltps
+        with pytest.raises(TypeError):
+            ltps["sensex"] = None
+
 
 class TestIndicatorUpdates:
     """Tests for indicator update functionality (Requirement 12.4)."""
@@ -142,6 +209,14 @@ class TestIndicatorUpdates:
 
         assert state.get_indicators("nifty", "current") is not None
 
+    def test_canonical_names_are_interned(self):
+        """Known symbol/mode names should resolve to shared lowercase strings."""
+        from src.state_manager import _canon
+
+        assert _canon("NIFTY") is _canon("nifty")
+        assert _canon("POSITIONAL") == "positional"
+        assert _canon("MidCapNifty") == "midcapnifty"
+
     def test_update_indicators_updates_ema_history(self):
         """update_indicators should append to EMA history when EMAs present.
         
@@ -161,6 +236,129 @@ class TestIndicatorUpdates:
         expected_ts = floor_to_5min_boundary(ts)
         assert history[0] == (expected_ts, 22500.0, 22450.0)
 
+    def test_update_indicators_without_ts_skips_history(self):
+        """An update with no timestamp should be stored but not added to history."""
+        state = StateManager()
+
+        state.update_indicators("nifty", "current", IndicatorData(ema_5=1.0, ema_21=2.0, rsi=55.0, ts=None))
+
+        assert state.get_indicators("nifty", "current").rsi == 55.0
+        assert state.get_ema_history("nifty") == []
+        assert state.get_rsi_history("nifty") == []
+
+    def test_update_indicators_replaces_earlier_bucket(self):
+        """A late update for an older candle bucket should replace, not append."""
+        state = StateManager()
+        first = IST.localize(datetime(2026, 1, 20, 10, 0, 30))
+        second = IST.localize(datetime(2026, 1, 20, 10, 5, 30))
+
+        state.update_indicators("nifty", "current", IndicatorData(rsi=40.0, ts=first))
+        state.update_indicators("nifty", "current", IndicatorData(rsi=50.0, ts=second))
+        state.update_indicators("nifty", "current", IndicatorData(rsi=45.0, ts=first))
+
+        assert [v for _, v in state.get_rsi_history("nifty")] == [45.0, 50.0]
+
+    def test_history_kept_sorted_for_out_of_order_buckets(self):
+        """An older bucket arriving late is stored in timestamp order."""
+        state = StateManager()
+        late = IST.localize(datetime(2026, 1, 20, 10, 10))
+        early = IST.localize(datetime(2026, 1, 20, 10, 0))
+
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.2, pcr=1.1, ts=late))
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.1, pcr=1.0, ts=early))
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.3, pcr=1.2, ts=late))
+
+        assert state.get_skew_pcr_history("nifty", "current") == [
+            (early, 0.1, 1.0),
+            (late, 0.3, 1.2),
+        ]
+
+    def test_backfilled_buckets_remain_addressable(self):
+        """Buckets shifted by a backfill insert are still updated in place."""
+        from datetime import timedelta
+
+        state = StateManager()
+        start = IST.localize(datetime(2026, 1, 20, 9, 15))
+        for i in (4, 0, 2, 1, 3):
+            ts = start + timedelta(minutes=5 * i)
+            state.update_indicators("nifty", "current", IndicatorData(rsi=float(i), ts=ts))
+        for i in range(5):
+            ts = start + timedelta(minutes=5 * i)
+            state.update_indicators("nifty", "current", IndicatorData(rsi=10.0 + i, ts=ts))
+
+        history = state.get_rsi_history("nifty")
+        assert [ts for ts, _ in history] == [start + timedelta(minutes=5 * i) for i in range(5)]
+        assert [v for _, v in history] == [10.0, 11.0, 12.0, 13.0, 14.0]
+
+    def test_history_trimmed_to_last_100_buckets(self):
+        """History keeps the latest 100 buckets and still dedups after trimming."""
+        from datetime import timedelta
+
+        state = StateManager()
+        start = IST.localize(datetime(2026, 1, 20, 9, 15))
+        for i in range(105):
+            ts = start + timedelta(minutes=5 * i)
+            state.update_indicators("nifty", "current", IndicatorData(adr=float(i), ts=ts))
+
+        # Overwrite a bucket that moved position when the list was trimmed
+        state.update_indicators(
+            "nifty", "current", IndicatorData(adr=-1.0, ts=start + timedelta(minutes=5 * 10))
+        )
+
+        history = state.get_adr_history("nifty")
+        assert len(history) == 100
+        assert history[0][0] == start + timedelta(minutes=5 * 5)
+        assert history[5][1] == -1.0
+
+
+class TestFloorTo5MinBoundary:
+    """Tests for floor_to_5min_boundary candle alignment."""
+
+    def test_floors_ist_timestamp(self):
+        """Aware IST timestamps floor to the 5-minute wall-clock boundary."""
+        from src.state_manager import floor_to_5min_boundary
+
+        ts = IST.localize(datetime(2026, 1, 20, 9, 19, 59, 999999))
+
+        assert floor_to_5min_boundary(ts) == IST.localize(datetime(2026, 1, 20, 9, 15))
+
+    def test_floors_naive_timestamp(self):
+        """Naive timestamps are floored on their wall-clock fields."""
+        from src.state_manager import floor_to_5min_boundary
+
+        result = floor_to_5min_boundary(datetime(2026, 1, 20, 14, 3, 7))
+
+        assert result == datetime(2026, 1, 20, 14, 0)
+        assert result.tzinfo is None
+
+    def test_same_bucket_reuses_result(self):
+        """Consecutive timestamps in one bucket return the cached datetime."""
+        from src.state_manager import floor_to_5min_boundary
+
+        first = floor_to_5min_boundary(IST.localize(datetime(2026, 1, 20, 10, 1)))
+        second = floor_to_5min_boundary(IST.localize(datetime(2026, 1, 20, 10, 4, 30)))
+
+        assert second is first
+
+    def test_floors_wall_clock_for_non_5min_offset(self):
+        """A pytz zone attached via tzinfo= (LMT +05:53) still floors to 9:15."""
+        from src.state_manager import floor_to_5min_boundary
+
+        ts = datetime(2026, 1, 20, 9, 17, 30, tzinfo=IST)
+
+        assert floor_to_5min_boundary(ts) == ts.replace(minute=15, second=0)
+
+    def test_bucket_change_rebuilds_result(self):
+        """A timestamp in the next bucket or another zone gets a new boundary."""
+        from src.state_manager import floor_to_5min_boundary
+
+        first = floor_to_5min_boundary(IST.localize(datetime(2026, 1, 20, 10, 4)))
+        nxt = floor_to_5min_boundary(IST.localize(datetime(2026, 1, 20, 10, 5)))
+        naive = floor_to_5min_boundary(datetime(2026, 1, 20, 10, 6))
+
+        assert first.minute == 0 and nxt.minute == 5
+        assert naive == datetime(2026, 1, 20, 10, 5)
+
 
 class TestModeDataSeparation:
     """Tests for mode data separation (Requirement 13.4)."""
@@ -290,6 +488,67 @@ class TestCandleUpdates:
         result = state.get_candles("nifty")
         assert len(result) == 2
 
+    def test_get_candles_snapshot_unaffected_by_append(self):
+        """A list returned by get_candles should not change on later appends."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        state.append_candle("nifty", Candle(ts=ts, open=1, high=2, low=0.5, close=1.5, volume=10))
+
+        before = state.get_candles("nifty")
+        state.append_candle("nifty", Candle(ts=ts, open=2, high=3, low=1.5, close=2.5, volume=20))
+
+        assert len(before) == 1
+        assert len(state.get_candles("nifty")) == 2
+
+    def test_get_candles_unaffected_by_snapshot_list_mutation(self):
+        """apply_snapshot should copy candles, not share the caller's list."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        candles = [Candle(ts=ts, open=1, high=2, low=0.5, close=1.5, volume=10)]
+        state.apply_snapshot({"nifty": {"current": SymbolData(candles=candles)}})
+
+        published = state.get_candles("nifty")
+        candles.append(Candle(ts=ts, open=2, high=3, low=1.5, close=2.5, volume=20))
+
+        assert len(published) == 1
+        assert len(state.get_candles("nifty")) == 1
+
+
+class TestApplySnapshot:
+    """Tests for bulk snapshot application."""
+
+    def test_apply_snapshot_updates_all_stores(self):
+        """apply_snapshot should update indicators, option chains and candles."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        candles = [Candle(ts=ts, open=22500, high=22550, low=22480, close=22530, volume=1000)]
+        snapshot = {
+            "nifty": {
+                "current": SymbolData(
+                    candles=candles,
+                    option_chain=OptionChainData(expiry="2026-01-23", underlying=22500.0),
+                    indicators=IndicatorData(skew=0.4, pcr=1.1, ts=ts),
+                ),
+                "positional": SymbolData(indicators=IndicatorData(skew=-0.2, ts=ts)),
+            },
+        }
+
+        state.apply_snapshot(snapshot)
+
+        assert state.get_indicators("nifty", "current").skew == 0.4
+        assert state.get_indicators("nifty", "positional").skew == -0.2
+        assert state.get_option_chain("nifty", "current").expiry == "2026-01-23"
+        assert len(state.get_candles("nifty")) == 1
+        assert len(state.get_skew_pcr_history("nifty", "current")) == 1
+
+    def test_apply_empty_snapshot(self):
+        """apply_snapshot should accept an empty snapshot."""
+        state = StateManager()
+
+        state.apply_snapshot({})
+
+        assert state.get_candles("nifty") == []
+
 
 class TestConnectionStatus:
     """Tests for connection status management."""
@@ -314,6 +573,46 @@ class TestConnectionStatus:
         assert status.sse_connected is True
         assert status.last_sse_update is not None
 
+    def test_last_update_returned_as_ist_datetime(self):
+        """Update times are stored as epoch seconds but returned in IST."""
+        state = StateManager()
+        ts = IST.localize(datetime(2026, 1, 20, 10, 30, 15, 250000))
+
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.1, ts=ts))
+
+        status = state.get_connection_status()
+        assert status.last_sse_update == ts
+        assert status.last_sse_update.utcoffset() == ts.utcoffset()
+        assert state.get_staleness_state().last_data_update == ts
+
+    def test_data_age_from_epoch_timestamps(self):
+        """Staleness checks should compare epoch seconds against now."""
+        from datetime import timedelta
+
+        state = StateManager()
+        assert state.get_data_age_seconds() is None
+
+        state.update_last_data_timestamp(datetime.now(IST) - timedelta(minutes=10))
+
+        assert 599 <= state.get_data_age_seconds() <= 601
+        assert state.is_data_stale() is True
+        assert state.should_show_staleness_warning() is True
+
+    def test_staleness_checks_without_data(self):
+        """No data is stale, but only the cache flag shows a warning then."""
+        state = StateManager()
+
+        assert state.is_data_stale() is True
+        assert state.should_show_staleness_warning() is False
+
+        state.set_cache_stale(True)
+        assert state.should_show_staleness_warning() is True
+
+        state.set_cache_stale(False)
+        state.update_last_data_timestamp()
+        assert state.is_data_stale() is False
+        assert state.should_show_staleness_warning() is False
+
 
 class TestMarketState:
     """Tests for market state management."""
@@ -397,6 +696,137 @@ class TestThreadSafety:
         assert len(errors) == 0
         assert read_count[0] == 100  # Both readers completed
 
+    def test_symbol_update_not_blocked_by_other_symbol_lock(self):
+        """Updating one symbol should not wait on another symbol's shard lock."""
+        state = StateManager()
+        pairs = [
+            (a, b) for a in VALID_SYMBOLS for b in VALID_SYMBOLS
+            if state._lock_for(a) is not state._lock_for(b)
+        ]
+        if not pairs:
+            pytest.skip("all symbols hashed to one shard in this process")
+        held, updated = pairs[0]
+
+        with state._lock_for(held):
+            writer = threading.Thread(target=state.update_ltp, args=(updated, 100.0))
+            writer.start()
+            writer.join(timeout=1.0)
+
+            assert not writer.is_alive()
+        assert state.get_ltp(updated).ltp == 100.0
+
+    def test_substate_update_not_blocked_by_other_substate_lock(self):
+        """A session update should not wait on the staleness or error locks."""
+        state = StateManager()
+
+        with state._staleness_lock, state._error_lock:
+            writer = threading.Thread(
+                target=state.set_user_session,
+                kwargs={"email": "user@example.com", "role": "admin", "jwt_token": "token"},
+            )
+            writer.start()
+            writer.join(timeout=1.0)
+
+            assert not writer.is_alive()
+        assert state.is_admin() is True
+
+    def test_indicator_and_chain_reads_skip_shard_lock(self):
+        """Single-lookup getters should not wait on the symbol's shard lock."""
+        state = StateManager()
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.2))
+        result = []
+
+        def read():
+            result.append(state.get_indicators("nifty", "current"))
+            result.append(state.get_option_chain("nifty", "current"))
+
+        with state._lock_for("nifty"):
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=1.0)
+
+            assert not reader.is_alive()
+        assert result[0].skew == 0.2
+        assert result[1] is not None
+
+    def test_history_read_skips_lock_when_no_write_in_progress(self):
+        """History getters should copy without waiting on the shard lock."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        state.update_indicators("nifty", "current", IndicatorData(rsi=55.0, ts=ts))
+        result = []
+
+        with state._lock_for("nifty"):
+            reader = threading.Thread(target=lambda: result.append(state.get_rsi_history("nifty")))
+            reader.start()
+            reader.join(timeout=1.0)
+
+            assert not reader.is_alive()
+        assert len(result[0]) == 1
+
+    def test_history_read_waits_for_write_in_progress(self):
+        """History getters should fall back to the lock while a write is in flight."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        state.update_indicators("nifty", "current", IndicatorData(rsi=55.0, ts=ts))
+        shard = state._symbol_locks.index(state._lock_for("nifty"))
+        result = []
+
+        with state._lock_for("nifty"):
+            state._history_seq[shard] += 1  # Simulate a writer mid-update
+            reader = threading.Thread(target=lambda: result.append(state.get_rsi_history("nifty")))
+            reader.start()
+            reader.join(timeout=0.1)
+
+            assert reader.is_alive()
+            state._history_seq[shard] += 1
+        reader.join(timeout=1.0)
+
+        assert not reader.is_alive()
+        assert len(result[0]) == 1
+
+
+class TestClearIndicatorHistory:
+    """Tests for clear_indicator_history."""
+
+    def _populate(self, state, ts):
+        for symbol in ("nifty", "banknifty"):
+            for mode in VALID_MODES:
+                state.update_indicators(
+                    symbol, mode,
+                    IndicatorData(ema_5=1.0, ema_21=2.0, skew=0.1, pcr=1.0, adr=0.5, rsi=50.0, ts=ts),
+                )
+
+    def test_clear_all_history(self):
+        """Without arguments every symbol's history should be emptied."""
+        state = StateManager()
+        self._populate(state, datetime.now(IST))
+
+        state.clear_indicator_history()
+
+        for symbol in ("nifty", "banknifty"):
+            assert state.get_ema_history(symbol) == []
+            assert state.get_rsi_history(symbol) == []
+            for mode in VALID_MODES:
+                assert state.get_skew_pcr_history(symbol, mode) == []
+
+    def test_clear_symbol_and_mode_only(self):
+        """A symbol and mode should only clear that symbol's data and mode's skew/pcr."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        self._populate(state, ts)
+
+        state.clear_indicator_history("NIFTY", "current")
+
+        assert state.get_adr_history("nifty") == []
+        assert state.get_skew_pcr_history("nifty", "current") == []
+        assert len(state.get_skew_pcr_history("nifty", "positional")) == 1
+        assert len(state.get_adr_history("banknifty")) == 1
+
+        # Cleared series accept new entries again
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.2, pcr=1.1, ts=ts))
+        assert len(state.get_skew_pcr_history("nifty", "current")) == 1
+
 
 class TestClear:
     """Tests for clear functionality."""
@@ -416,6 +846,33 @@ class TestClear:
         status = state.get_connection_status()
         assert status.ws_connected is False
 
+    def test_clear_shares_empty_substates_across_instances(self):
+        """clear should reset substates to the shared empty instances."""
+        state = StateManager()
+        other = StateManager()
+        state.set_error("boom")
+        state.set_user_session(email="user@example.com", jwt_token="token")
+
+        state.clear()
+
+        assert state.get_error_state() is other.get_error_state()
+        assert state.get_user_session() is other.get_user_session()
+        assert state.has_error() is False
+
+    def test_clear_reinitializes_history_containers(self):
+        """clear should leave fresh, empty per-symbol containers."""
+        state = StateManager()
+        ts = datetime.now(IST)
+        state.update_indicators("nifty", "current", IndicatorData(rsi=55.0, skew=0.1, pcr=1.0, ts=ts))
+        old_rsi = state.rsi_history
+
+        state.clear()
+
+        assert len(old_rsi["nifty"]) == 1
+        assert state.get_rsi_history("nifty") == []
+        assert state.get_skew_pcr_history("nifty", "current") == []
+        assert ("nifty", "current") in state.indicators
+
 
 class TestUserSession:
     """Tests for user session management (Requirement 15.2)."""
@@ -538,8 +995,10 @@ class TestUserSession:
 
         assert state.is_admin() is False
 
-    def test_get_user_session_returns_copy(self):
-        """get_user_session should return a copy of the session data."""
+    def test_get_user_session_returns_immutable_snapshot(self):
+        """get_user_session should return a frozen snapshot unaffected by later changes."""
+        from dataclasses import FrozenInstanceError
+
         state = StateManager()
 
         state.set_user_session(
@@ -548,12 +1007,13 @@ class TestUserSession:
             jwt_token="test_token",
         )
 
-        session1 = state.get_user_session()
-        session2 = state.get_user_session()
+        session = state.get_user_session()
+        state.update_jwt_token("new_token")
 
-        # Should be equal but not the same object
-        assert session1.email == session2.email
-        assert session1.role == session2.role
+        assert session.jwt_token == "test_token"
+        assert state.get_user_session().jwt_token == "new_token"
+        with pytest.raises(FrozenInstanceError):
+            session.role = "customer"
 
 
 class TestOTPSession:
@@ -666,8 +1126,8 @@ class TestOTPSession:
 
         assert state.is_otp_session_valid() is False
 
-    def test_get_otp_session_returns_copy(self):
-        """get_otp_session should return a copy of the session data."""
+    def test_get_otp_session_returns_snapshot(self):
+        """get_otp_session should return a consistent snapshot of the session data."""
         state = StateManager()
         from datetime import timedelta
         expiry = datetime.now(IST) + timedelta(hours=1)
@@ -677,7 +1137,6 @@ class TestOTPSession:
         session1 = state.get_otp_session()
         session2 = state.get_otp_session()
 
-        # Should be equal but not the same object
         assert session1.otp_verified == session2.otp_verified
         assert session1.otp_expiry == session2.otp_expiry
 
@@ -717,6 +1176,23 @@ class TestJWTManagement:
         assert parse_jwt_expiry("") is None
         assert parse_jwt_expiry(None) is None
 
+    def test_parse_jwt_expiry_malformed_payload(self):
+        """parse_jwt_expiry should return None for undecodable or odd claims."""
+        from src.state_manager import parse_jwt_expiry
+        import base64
+        import json
+
+        def token_for(claims_json: str) -> str:
+            payload = base64.urlsafe_b64encode(claims_json.encode()).decode().rstrip("=")
+            return f"header.{payload}.signature"
+
+        assert parse_jwt_expiry("header.!!!!.signature") is None
+        assert parse_jwt_expiry("header..signature") is None
+        assert parse_jwt_expiry("a.b.c.d") is None
+        assert parse_jwt_expiry(token_for("[1, 2]")) is None
+        assert parse_jwt_expiry(token_for(json.dumps({"exp": "soon"}))) is None
+        assert parse_jwt_expiry(token_for(json.dumps({"exp": 1e20}))) is None
+
     def test_parse_jwt_expiry_no_exp_claim(self):
         """parse_jwt_expiry should return None when no exp claim."""
         from src.state_manager import parse_jwt_expiry
@@ -731,9 +1207,42 @@ class TestJWTManagement:
         mock_jwt = f"eyJhbGciOiJIUzI1NiJ9.{payload_b64}.signature"
         
         expiry = parse_jwt_expiry(mock_jwt)
-        
+
         assert expiry is None
 
+    def test_parse_jwt_expiry_reads_top_level_claim(self):
+        """parse_jwt_expiry should ignore nested 'exp' keys and accept exp=0."""
+        from src.state_manager import parse_jwt_expiry
+        import base64
+        import json
+
+        def token_for(claims: dict) -> str:
+            payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+            return f"header.{payload}.signature"
+
+        nested = token_for({"act": {"exp": 1}, "note": '"exp": 5', "exp": 2000000000})
+        assert parse_jwt_expiry(nested) == datetime.fromtimestamp(2000000000, tz=IST)
+        assert parse_jwt_expiry(token_for({"exp": 0})) == datetime.fromtimestamp(0, tz=IST)
+        assert parse_jwt_expiry(token_for({"exp": True})) is None
+
+    def test_parse_jwt_expiry_memoized(self):
+        """parse_jwt_expiry should decode a given token only once."""
+        from src.state_manager import parse_jwt_expiry, _parse_jwt_expiry_cached
+        import base64
+        import json
+
+        payload_b64 = base64.urlsafe_b64encode(
+            json.dumps({"exp": 1768900000, "jti": "memo"}).encode()
+        ).decode().rstrip("=")
+        mock_jwt = f"eyJhbGciOiJIUzI1NiJ9.{payload_b64}.signature"
+
+        first = parse_jwt_expiry(mock_jwt)
+        hits_before = _parse_jwt_expiry_cached.cache_info().hits
+        second = parse_jwt_expiry(mock_jwt)
+
+        assert second is first
+        assert _parse_jwt_expiry_cached.cache_info().hits == hits_before + 1
+
     def test_jwt_needs_refresh_within_threshold(self):
         """jwt_needs_refresh should return True when < 1 hour remaining.
         
@@ -900,6 +1409,7 @@ class TestJWTManagement:
         # New expiry should be approximately 2 hours from now
         expected_expiry = datetime.fromtimestamp(new_exp, tz=IST)
         assert abs((session.jwt_expiry - expected_expiry).total_seconds()) < 1
+        assert session.jwt_expiry_ts == session.jwt_expiry.timestamp()
         # Should NOT need refresh now (> 1 hour remaining)
         assert state.jwt_needs_refresh() is False
 
@@ -949,3 +1459,132 @@ class TestJWTManagement:
         
         assert expiry is None
         assert seconds_remaining is None
+
+
+class TestDataGapDetection:
+    """Tests for data gap detection (FIX-032)."""
+
+    def test_no_gap_check_outside_market_hours(self):
+        """detect_data_gaps should report no gap when the market is closed."""
+        state = StateManager()
+        state.is_market_open = lambda now=None: False
+
+        assert state.detect_data_gaps("nifty", "current").has_gap is False
+
+    def test_stale_indicators_reported_as_gap(self):
+        """Indicators older than the gap threshold should be reported."""
+        from datetime import timedelta
+
+        state = StateManager()
+        state.is_market_open = lambda now=None: True
+        old_ts = datetime.now(IST) - timedelta(minutes=12)
+        state.update_indicators("nifty", "current", IndicatorData(skew=0.1, ts=old_ts))
+
+        result = state.detect_data_gaps("nifty", "current")
+
+        assert result.has_gap is True
+        assert result.gap_type == "indicators"
+        assert result.last_data_time == old_ts
+        assert result.gap_minutes == 12
+
+    def test_fresh_data_has_no_gap(self):
+        """Recent indicator and skew/pcr data should not be reported as a gap."""
+        state = StateManager()
+        state.is_market_open = lambda now=None: True
+        state.update_indicators(
+            "nifty", "current", IndicatorData(skew=0.1, pcr=1.0, ts=datetime.now(IST))
+        )
+
+        assert state.detect_data_gaps("nifty", "current").has_gap is False
+
+    def test_is_market_open_uses_given_time(self):
+        """is_market_open should evaluate a caller-supplied time."""
+        state = StateManager()
+
+        assert state.is_market_open(IST.localize(datetime(2026, 1, 20, 10, 0))) is True
+        assert state.is_market_open(IST.localize(datetime(2026, 1, 20, 16, 0))) is False
+        assert state.is_market_open(IST.localize(datetime(2026, 1, 24, 10, 0))) is False
+
+    def test_auto_bootstrap_shares_one_clock_read(self):
+        """should_auto_bootstrap should pass one 'now' to every gap check."""
+        state = StateManager()
+        state.set_user_session(email="user@example.com", jwt_token="token")
+        state.is_market_open = lambda now=None: True
+        seen = []
+
+        from src.state_manager import GapResult
+
+        def fake_detect(symbol, mode, now=None):
+            seen.append(now)
+            return GapResult()
+
+        state.detect_data_gaps = fake_detect
+
+        assert state.should_auto_bootstrap() is False
+        assert len(seen) == len(VALID_SYMBOLS) * len(VALID_MODES)
+        assert seen[0] is not None
+        assert all(now is seen[0] for now in seen)
+
+    def test_stale_skew_pcr_reported_from_newest_entry(self):
+        """The skew/pcr gap should be measured from the newest history bucket."""
+        from datetime import timedelta
+
+        state = StateManager()
+        state.is_market_open = lambda now=None: True
+        now = datetime.now(IST)
+        for minutes_ago in (10, 30):  # Newer bucket first, then a backfill
+            state.update_indicators(
+                "nifty", "current",
+                IndicatorData(skew=0.1, pcr=1.0, ts=now - timedelta(minutes=minutes_ago)),
+            )
+        # Fresh indicators so only the skew/pcr history is checked for age
+        state.update_indicators("nifty", "current", IndicatorData(ts=now))
+
+        result = state.detect_data_gaps("nifty", "current")
+
+        assert result.has_gap is True
+        assert result.gap_type == "skew_pcr"
+        assert 10 <= result.gap_minutes <= 15
+
+    def test_no_gap_result_is_shared(self):
+        """The no-gap result should be one shared immutable instance."""
+        from dataclasses import FrozenInstanceError
+        from src.state_manager import NO_GAP
+
+        state = StateManager()
+        state.is_market_open = lambda now=None: False
+
+        result = state.detect_data_gaps("nifty", "current")
+
+        assert result is NO_GAP
+        assert state.detect_data_gaps("banknifty", "positional") is result
+        with pytest.raises(FrozenInstanceError):
+            result.has_gap = True
+
+    def test_auto_bootstrap_cooldown_skips_gap_scan(self):
+        """should_auto_bootstrap should reject during cooldown without scanning."""
+        state = StateManager()
+        state.set_user_session(email="user@example.com", jwt_token="token")
+        state.is_market_open = lambda now=None: True
+        state.record_bootstrap_attempt()
+        scanned = []
+        state.detect_data_gaps = lambda symbol, mode, now=None: scanned.append(symbol)
+
+        assert state.should_auto_bootstrap() is False
+        assert scanned == []
+
+    def test_is_market_open_cached_per_minute(self, monkeypatch):
+        """is_market_open should reuse its result within one wall-clock minute."""
+        from types import SimpleNamespace
+
+        state = StateManager()
+        clock = [IST.localize(datetime(2026, 1, 20, 10, 0, 5)).timestamp()]
+        monkeypatch.setattr("src.state_manager.time", SimpleNamespace(time=lambda: clock[0]))
+
+        assert state.is_market_open() is True
+        minute = state._market_open_cache[0]
+        state._market_open_cache = (minute, False)  # Poison the cached value
+        clock[0] += 30
+        assert state.is_market_open() is False      # Same minute: served from cache
+        clock[0] += 60
+        assert state.is_market_open() is True       # Next minute: recomputed
@@ -12,10 +12,13 @@ Requirements: 11.1, 11.2, 11.3, 11.4, 11.5, 11.6, 11.7, 11.8, 11.9
 """
 
 import json
+import threading
+import time
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, MagicMock, patch
 import pytz
+from structlog.testing import capture_logs
 
 from src.state_manager import StateManager
 from src.ws_client import (
@@ -78,6 +81,13 @@ class TestFastStreamClientInit:
         assert ws_client.ws is None
 
 
+    def test_init_uses_slots(self, ws_client):
+        """Test that the client keeps a fixed attribute layout."""
+        assert not hasattr(ws_client, "__dict__")
+        with pytest.raises(AttributeError):
+            ws_client.unexpected_attribute = 1
+
+
 class TestBuildUrl:
     """Tests for WebSocket URL building."""
 
@@ -96,6 +106,16 @@ class TestBuildUrl:
         url = ws_client._build_url()
         assert "/v1/stream/fast" in url
 
+    def test_build_url_uses_refreshed_token_without_settings_lookup(self, ws_client):
+        """Test that reconnect URLs pick up a new token from cached parts."""
+        ws_client.update_jwt_token("refreshed_token")
+
+        with patch("src.ws_client.get_settings") as get_settings:
+            url = ws_client._build_url()
+
+        get_settings.assert_not_called()
+        assert "token=refreshed_token&symbols=nifty,banknifty" in url
+
 
 class TestHandlePing:
     """Tests for ping/pong protocol handling."""
@@ -168,6 +188,81 @@ class TestHandleTick:
         assert nifty_ltp.ltp == 24500.50
         assert banknifty_ltp.ltp == 52000.00
 
+    def test_handle_tick_parses_shared_timestamp_once(self, ws_client, state_manager):
+        """Test that a timestamp shared by several symbols is parsed once."""
+        shared = "2026-01-20T10:30:00+05:30"
+        tick_data = {
+            "event": "tick",
+            "ts": "2026-01-20T10:29:00+05:30",
+            "data": {
+                "nifty": {"ltp": 24500.0, "ts": shared},
+                "banknifty": {"ltp": 52000.0, "ts": shared},
+            },
+        }
+
+        with patch.object(
+            FastStreamClient, "_parse_timestamp", autospec=True,
+            side_effect=FastStreamClient._parse_timestamp,
+        ) as parse:
+            ws_client._handle_tick(tick_data)
+
+        assert parse.call_count == 2  # envelope + one shared per-symbol string
+        assert state_manager.get_ltp("nifty").ts.minute == 30
+        assert state_manager.get_ltp("banknifty").ts.minute == 30
+
+    def test_handle_tick_falls_back_to_envelope_timestamp(self, ws_client, state_manager):
+        """Test that symbols without their own ts use the frame timestamp."""
+        tick_data = {
+            "event": "tick",
+            "ts": "2026-01-20T10:29:00+05:30",
+            "data": {"nifty": {"ltp": 24500.0}},
+        }
+
+        ws_client._handle_tick(tick_data)
+
+        assert state_manager.get_ltp("nifty").ts.minute == 29
+
+    def test_handle_tick_skips_unsubscribed_symbols(self, ws_client, state_manager):
+        """Test that symbols outside the subscription never reach the state."""
+        state_manager.update_ltps_batch = Mock()
+        tick_data = {
+            "event": "tick",
+            "data": {
+                "NIFTY": {"ltp": 24500.0},
+                "sensex": {"ltp": 80000.0},
+                "bogus": {"ltp": 1.0},
+            },
+        }
+
+        ws_client._handle_tick(tick_data)
+
+        batch = state_manager.update_ltps_batch.call_args[0][0]
+        assert [tick[0] for tick in batch] == ["NIFTY"]
+
+    def test_handle_tick_skips_non_dict_entries(self, ws_client, state_manager):
+        """Test that malformed per-symbol entries are skipped, not fatal."""
+        tick_data = {
+            "event": "tick",
+            "data": {"nifty": {"ltp": 24500.0}, "banknifty": 52000.0, "sensex": None},
+        }
+
+        ws_client._handle_tick(tick_data)
+
+        assert state_manager.get_ltp("nifty").ltp == 24500.0
+        assert state_manager.get_ltp("banknifty") is None
+
+    @pytest.mark.parametrize("debug_enabled", [False, True])
+    def test_handle_tick_debug_log_gated_by_level(self, ws_client, debug_enabled):
+        """Test that the per-frame debug log is only built when DEBUG is on."""
+        tick_data = {"event": "tick", "data": {"nifty": {"ltp": 24500.0}}}
+
+        with patch("src.ws_client.logger") as mock_logger, patch(
+            "src.ws_client._level_logger.isEnabledFor", return_value=debug_enabled
+        ):
+            ws_client._handle_tick(tick_data)
+
+        assert mock_logger.debug.called is debug_enabled
+
     def test_handle_tick_empty_data(self, ws_client, state_manager):
         """Test that empty tick data is handled gracefully."""
         tick_data = {"event": "tick", "data": {}}
@@ -219,6 +314,43 @@ class TestHandleOptionChainLtp:
         assert updated_chain.strikes[1].call_ltp == 100.0
         assert updated_chain.strikes[1].put_ltp == 100.0
 
+    def test_handle_option_chain_ltp_ragged_columns(self, ws_client, state_manager):
+        """Test that short LTP columns pad with None and extras are dropped."""
+        state_manager.update_option_chain_ltp = Mock()
+        ltp_data = {
+            "event": "option_chain_ltp",
+            "symbol": "NIFTY",
+            "mode": "current",
+            "data": {
+                "strikes": [24400, 24500],
+                "call_ltp": [150.0],
+                "put_ltp": [50.0, 60.0, 70.0],
+            },
+        }
+
+        ws_client._handle_option_chain_ltp(ltp_data)
+
+        state_manager.update_option_chain_ltp.assert_called_once_with(
+            "nifty", "current", {24400.0: (150.0, 50.0), 24500.0: (None, 60.0)}
+        )
+
+    def test_handle_option_chain_ltp_pads_strikes_past_both_columns(self, ws_client, state_manager):
+        """Test that strikes beyond both LTP columns still get (None, None)."""
+        state_manager.update_option_chain_ltp = Mock()
+        ltp_data = {
+            "event": "option_chain_ltp",
+            "symbol": "nifty",
+            "mode": "next",
+            "data": {"strikes": [24400, 24500, 24600], "call_ltp": [150.0], "put_ltp": []},
+        }
+
+        ws_client._handle_option_chain_ltp(ltp_data)
+
+        state_manager.update_option_chain_ltp.assert_called_once_with(
+            "nifty", "next",
+            {24400.0: (150.0, None), 24500.0: (None, None), 24600.0: (None, None)},
+        )
+
     def test_handle_option_chain_ltp_missing_symbol(self, ws_client, state_manager):
         """Test that missing symbol is handled gracefully."""
         ltp_data = {
@@ -279,6 +411,64 @@ class TestOnMessage:
         
         assert state_manager.get_ltp("nifty").ltp == 24500.0
 
+    def test_on_message_routes_option_chain_and_snapshot(self, ws_client, state_manager):
+        """Test that table-dispatched events reach their handlers."""
+        mock_ws = Mock()
+        ws_client._on_message(mock_ws, json.dumps({
+            "event": "snapshot",
+            "data": {"banknifty": {"ltp": 52100.0, "change": 0, "change_pct": 0}},
+        }))
+
+        assert state_manager.get_ltp("banknifty").ltp == 52100.0
+        assert set(ws_client._handlers) == {"tick", "option_chain_ltp", "snapshot"}
+
+    def test_on_message_ignores_unknown_event(self, ws_client):
+        """Test that unknown events are neither dispatched nor answered."""
+        mock_ws = Mock()
+
+        ws_client._on_message(mock_ws, json.dumps({"event": "heartbeat"}))
+
+        mock_ws.send.assert_not_called()
+
+    def test_on_message_handler_error_logs_event(self, ws_client):
+        """Test that a failing handler is logged with the parsed event name."""
+        ws_client._handlers["tick"] = Mock(side_effect=RuntimeError("boom"))
+
+        with capture_logs() as logs:
+            ws_client._on_message(Mock(), json.dumps({"event": "tick", "data": {}}))
+
+        assert logs[-1]["event"] == "ws_message_handling_error"
+        assert logs[-1]["event_type"] == "tick"
+
+    def test_on_message_non_object_frame_is_logged(self, ws_client):
+        """Test that a valid JSON non-object frame is logged without an event."""
+        with capture_logs() as logs:
+            ws_client._on_message(Mock(), "[1, 2]")
+
+        assert logs[-1]["event"] == "ws_message_handling_error"
+        assert logs[-1]["event_type"] is None
+
+    def test_on_message_handler_value_error_not_reported_as_parse_error(self, ws_client):
+        """Test that a ValueError inside a handler is logged as a handling error."""
+        message = json.dumps({
+            "event": "option_chain_ltp",
+            "symbol": "nifty",
+            "data": {"strikes": ["not-a-strike"], "call_ltp": [1.0], "put_ltp": [2.0]},
+        })
+
+        with capture_logs() as logs:
+            ws_client._on_message(Mock(), message)
+
+        assert [log["event"] for log in logs] == ["ws_message_handling_error"]
+        assert logs[0]["error_type"] == "ValueError"
+
+    def test_on_message_invalid_json_logs_parse_error(self, ws_client):
+        """Test that an unparseable frame is logged as a parse error."""
+        with capture_logs() as logs:
+            ws_client._on_message(Mock(), b"{not json")
+
+        assert [log["event"] for log in logs] == ["ws_json_parse_error"]
+
     def test_on_message_handles_invalid_json(self, ws_client):
         """Test that invalid JSON is handled gracefully."""
         mock_ws = Mock()
@@ -286,6 +476,109 @@ class TestOnMessage:
         # Should not raise
         ws_client._on_message(mock_ws, "not valid json")
 
+    def test_on_message_accepts_bytes_frame(self, ws_client, state_manager):
+        """Test that binary frames are parsed without decoding first."""
+        mock_ws = Mock()
+        message = json.dumps({
+            "event": "tick",
+            "data": {"nifty": {"ltp": 24600.0, "change": 0, "change_pct": 0}},
+        }).encode()
+
+        ws_client._on_message(mock_ws, message)
+
+        assert state_manager.get_ltp("nifty").ltp == 24600.0
+
+
+class TestRun:
+    """Tests for the connection loop."""
+
+    def test_run_skips_utf8_validation(self, ws_client):
+        """Test that frames are read without the library's UTF-8 validation."""
+        def stop(**kwargs):
+            ws_client.running = False
+
+        ws_client.running = True
+        with patch("src.ws_client.websocket.WebSocketApp") as app_cls:
+            app_cls.return_value.run_forever.side_effect = stop
+            ws_client._run()
+
+        app_cls.return_value.run_forever.assert_called_once_with(
+            ping_interval=0, skip_utf8_validation=True
+        )
+
+    def test_invalid_utf8_frame_is_rejected_by_parser(self, ws_client, state_manager):
+        """Test that invalid UTF-8 is still caught when parsing the frame."""
+        ws_client._on_message(Mock(), b'{"event":"tick","data":{"nifty":{"ltp":1,"x":"\xff"}}}')
+
+        assert state_manager.get_ltp("nifty") is None
+
+
+class TestFrameDispatch:
+    """Tests for handing frames from the socket thread to the dispatcher."""
+
+    def test_dispatch_loop_applies_frames_in_order(self, ws_client, state_manager):
+        """Test that queued frames are applied in arrival order."""
+        mock_ws = Mock()
+        for ltp in (24500.0, 24510.0):
+            ws_client._enqueue_frame(mock_ws, json.dumps({
+                "event": "tick",
+                "data": {"nifty": {"ltp": ltp, "change": 0, "change_pct": 0}},
+            }))
+        ws_client._enqueue_frame(mock_ws, json.dumps({"event": "ping"}))
+        ws_client.disconnect()
+
+        ws_client._dispatch_loop(ws_client._frames)
+
+        assert state_manager.get_ltp("nifty").ltp == 24510.0
+        mock_ws.send.assert_called_once()
+
+    def test_enqueue_frame_does_not_parse(self, ws_client, state_manager):
+        """Test that the socket-thread callback only queues the frame."""
+        ws_client._enqueue_frame(Mock(), json.dumps({
+            "event": "tick",
+            "data": {"nifty": {"ltp": 24500.0}},
+        }))
+
+        assert state_manager.get_ltp("nifty") is None
+        assert ws_client._frames.qsize() == 1
+
+    def test_ping_answered_on_socket_thread(self, ws_client):
+        """Test that pings get a pong at once, ahead of queued frames."""
+        mock_ws = Mock()
+        ws_client._enqueue_frame(mock_ws, json.dumps({"event": "tick", "data": {}}))
+        ws_client._enqueue_frame(mock_ws, b'{"event":"ping"}')
+
+        mock_ws.send.assert_called_once_with('{"action":"pong"}')
+        assert ws_client._frames.qsize() == 1
+
+    def test_backlog_keeps_only_snapshots(self, ws_client, state_manager):
+        """Test that a full backlog drops ticks and chain LTPs but keeps snapshots."""
+        mock_ws = Mock()
+        tick = json.dumps({"event": "tick", "data": {"nifty": {"ltp": 24500.0}}})
+        chain_ltp = json.dumps({
+            "event": "option_chain_ltp",
+            "symbol": "nifty",
+            "data": {"strikes": [24500], "call_ltp": [100.0], "put_ltp": [90.0]},
+        })
+        snapshot = json.dumps({"event": "snapshot", "data": {"nifty": {"ltp": 24500.0}}})
+
+        # __slots__ instances have no per-instance override; patch the class
+        with patch.object(FastStreamClient, "MAX_PENDING_FRAMES", 1):
+            ws_client._enqueue_frame(mock_ws, tick)
+            ws_client._enqueue_frame(mock_ws, tick.encode())
+            ws_client._enqueue_frame(mock_ws, chain_ltp)
+            ws_client._enqueue_frame(mock_ws, snapshot)
+
+            assert ws_client._frames.qsize() == 2
+            assert ws_client._dropped_frames == 2
+
+            ws_client._frames.get_nowait()
+            ws_client._frames.get_nowait()
+            ws_client._enqueue_frame(mock_ws, chain_ltp)
+
+        assert ws_client._frames.qsize() == 1
+        assert ws_client._dropped_frames == 0
+
 
 class TestOnClose:
     """Tests for connection close handling."""
@@ -355,6 +648,77 @@ class TestOnOpen:
         
         assert ws_client.last_connect_time is not None
 
+    def test_on_open_records_monotonic_connect_time(self, ws_client):
+        """Test that opens store a monotonic stamp and derive wall-clock lazily."""
+        before = time.monotonic()
+
+        ws_client._on_open(Mock())
+
+        assert ws_client.last_connect_monotonic >= before
+        connected_at = ws_client.last_connect_time
+        assert connected_at.utcoffset().total_seconds() == 5.5 * 3600
+        assert abs((datetime.now(IST) - connected_at).total_seconds()) < 5
+
+
+class TestProactiveReconnect:
+    """Tests for the long-lived proactive reconnect monitor."""
+
+    def _wait_for(self, predicate, timeout=1.0):
+        """Poll until predicate() is true or timeout elapses."""
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return predicate()
+
+    def test_schedule_proactive_reconnect_arms_monitor(self, ws_client):
+        """Test scheduling arms the monitor without starting a timer thread."""
+        threads_before = threading.active_count()
+
+        ws_client._schedule_proactive_reconnect()
+
+        assert ws_client._monitor_armed is True
+        assert ws_client._monitor_wake.is_set()
+        assert threading.active_count() <= threads_before
+
+    def test_cancel_proactive_reconnect_disarms_monitor(self, ws_client):
+        """Test cancelling disarms the monitor and bumps its generation."""
+        ws_client._schedule_proactive_reconnect()
+        gen = ws_client._monitor_gen
+
+        ws_client._cancel_proactive_reconnect()
+
+        assert ws_client._monitor_armed is False
+        assert ws_client._monitor_gen == gen + 1
+
+    def test_monitor_closes_socket_at_deadline(self, ws_client):
+        """Test the monitor closes the socket once the deadline passes.
+
+        Requirement 11.9: Proactively reconnect before Cloud Run timeout.
+        """
+        ws_client.running = True
+        ws_client.ws = Mock()
+        ws_client.reconnect_delay = 8.0
+
+        with patch.object(FastStreamClient, "PROACTIVE_RECONNECT_MINUTES", 0):
+            ws_client._start_monitor()
+            ws_client._schedule_proactive_reconnect()
+            assert self._wait_for(lambda: ws_client.ws.close.called)
+
+        assert ws_client.reconnect_delay == 1.0
+        ws_client.disconnect()
+
+    def test_disconnect_stops_monitor(self, ws_client):
+        """Test disconnect disarms the monitor and ends its thread."""
+        ws_client.running = True
+        ws_client._start_monitor()
+        ws_client._schedule_proactive_reconnect()
+
+        ws_client.disconnect()
+        ws_client._monitor_thread.join(timeout=1.0)
+
+        assert ws_client._monitor_armed is False
+        assert not ws_client._monitor_thread.is_alive()
+
 
 class TestCalculateBackoffDelay:
     """Tests for exponential backoff calculation."""
@@ -422,6 +786,13 @@ class TestCreatePongMessage:
         parsed = json.loads(message)
         assert parsed == {"action": "pong"}
 
+    def test_pong_message_is_shared_constant(self, ws_client):
+        """Test that the handler and helper send the same precomputed payload."""
+        mock_ws = Mock()
+        ws_client._handle_ping(mock_ws)
+
+        assert mock_ws.send.call_args[0][0] is create_pong_message()
+
 
 class TestParseTimestamp:
     """Tests for timestamp parsing."""
@@ -455,6 +826,16 @@ class TestParseTimestamp:
         """Test parsing invalid timestamp returns None."""
         assert ws_client._parse_timestamp("not a timestamp") is None
 
+    def test_parse_utc_timestamp_with_fraction(self, ws_client):
+        """Test parsing Z-suffixed timestamp with fractional seconds."""
+        ts = ws_client._parse_timestamp("2026-01-20T05:00:00.250Z")
+        assert ts.utcoffset().total_seconds() == 5.5 * 3600
+        assert (ts.hour, ts.minute, ts.microsecond) == (10, 30, 250000)
+
+    def test_parse_non_string_timestamp(self, ws_client):
+        """Test parsing a non-string value returns None."""
+        assert ws_client._parse_timestamp(1737349200) is None
+
 
 class TestDisconnect:
     """Tests for disconnect functionality."""
@@ -471,6 +852,20 @@ class TestDisconnect:
         ws_client.disconnect()
         assert not state_manager.get_connection_status().ws_connected
 
+    def test_disconnect_interrupts_backoff_wait(self, ws_client):
+        """Test that disconnect wakes a pending reconnect backoff at once."""
+        ws_client.running = True
+        ws_client.reconnect_delay = 30.0
+        waiter = threading.Thread(target=ws_client._schedule_reconnect)
+        started = time.monotonic()
+        waiter.start()
+
+        ws_client.disconnect()
+        waiter.join(timeout=5)
+
+        assert not waiter.is_alive()
+        assert time.monotonic() - started < 5
+
 
 class TestUpdateJwtToken:
     """Tests for JWT token update."""